@@ -1,7 +1,8 @@
 from http.client import HTTPResponse
 from logging import getLogger
 from pathlib import Path
-from typing import Optional, List, Tuple
+from socket import socket
+from typing import Callable, Dict, Optional, List, Tuple
 
 from drivebuildclient.aiExchangeMessages_pb2 import VehicleID, SimulationID, TestResult, SubmissionResult, User, \
     DataResponse, Void, \
@@ -11,9 +12,17 @@ _logger = getLogger("DriveBuild.Client.AIExchangeService")
 
 
 class AIExchangeService:
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: str, port: int, direct: bool = False):
+        """
+        :param direct: Whether AI requests (wait_for_simulator_request, request_data and control) are sent to the
+        SimNode running the simulation directly instead of through the main app. If a SimNode is not reachable directly
+        the requests are sent through the main app.
+        """
         self.host = host
         self.port = port
+        self.direct = direct
+        self._sessions: Dict[str, User] = {}  # username --> user having a session token
+        self._direct_sockets: Dict[Tuple[str, str], Optional[socket]] = {}  # (sid, vid) --> socket to the SimNode
 
     @staticmethod
     def _print_error(response: HTTPResponse) -> None:
@@ -22,6 +31,65 @@ class AIExchangeService:
                         + "Messsage:\n"
                         + str(b"\n".join(response.readlines())))
 
+    def _connect_directly(self, sid: SimulationID, vid: VehicleID) -> Optional[socket]:
+        """
+        Asks the main app for a signed endpoint of the SimNode running the given simulation and authenticates there.
+        :return: The authenticated socket or None if a direct connection is not possible.
+        """
+        from drivebuildclient import create_client, send_request
+        from drivebuildclient.aiExchangeMessages_pb2 import Bool, DirectEndpoint
+        from drivebuildclient.httpUtil import do_get_request
+        response = do_get_request(self.host, self.port, "/ai/directEndpoint", {
+            "sid": sid.SerializeToString(),
+            "vid": vid.SerializeToString()
+        })
+        if response.status == 200:
+            endpoint = DirectEndpoint()
+            endpoint.ParseFromString(b"".join(response.readlines()))
+            try:
+                sock = create_client(endpoint.host, endpoint.port)
+                authenticated = Bool()
+                authenticated.ParseFromString(send_request(sock, b"authenticate", [endpoint.SerializeToString()]))
+                if authenticated.value:
+                    return sock
+                sock.close()
+                _logger.warning("The SimNode at " + endpoint.host + ":" + str(endpoint.port)
+                                + " rejected the endpoint.")
+            except OSError:
+                _logger.warning("The SimNode at " + endpoint.host + ":" + str(endpoint.port) + " is not reachable.")
+        else:
+            response.read()
+        _logger.info("Sending requests of " + sid.sid + ":" + vid.vid + " through the main app.")
+        return None
+
+    def _send_directly(self, sid: SimulationID, vid: VehicleID, action: bytes, data: List[bytes]) -> Optional[bytes]:
+        """
+        Sends the given request to the SimNode running the given simulation directly if possible.
+        :return: The response of the SimNode or None if the request has to be sent through the main app.
+        """
+        from drivebuildclient import send_request
+        if self.direct:
+            key = (sid.sid, vid.vid)
+            if key not in self._direct_sockets:
+                self._direct_sockets[key] = self._connect_directly(sid, vid)
+            sock = self._direct_sockets[key]
+            if sock:
+                try:
+                    response = send_request(sock, action, data)
+                except OSError:
+                    response = None
+                if response:
+                    return response
+                _logger.warning("The direct connection of " + sid.sid + ":" + vid.vid + " broke.")
+                self._close_directly(sid, vid)
+                self._direct_sockets[key] = None
+        return None
+
+    def _close_directly(self, sid: SimulationID, vid: VehicleID) -> None:
+        sock = self._direct_sockets.pop((sid.sid, vid.vid), None)
+        if sock:
+            sock.close()
+
     def wait_for_simulator_request(self, sid: SimulationID, vid: VehicleID) -> SimStateResponse.SimState:
         """
         Waits for the simulation with ID sid to request the car with ID vid. This call blocks until the simulation
@@ -33,17 +101,22 @@ class AIExchangeService:
         stopped the simulation.
         """
         from drivebuildclient.httpUtil import do_get_request
-        response = do_get_request(self.host, self.port, "/ai/waitForSimulatorRequest", {
-            "sid": sid.SerializeToString(),
-            "vid": vid.SerializeToString()
-        })
-        if response.status == 200:
-            result = b"".join(response.readlines())
-            sim_state = SimStateResponse()
-            sim_state.ParseFromString(result)
-            return sim_state.state
-        else:
-            AIExchangeService._print_error(response)
+        result = self._send_directly(sid, vid, b"waitForSimulatorRequest", [])
+        if result is None:
+            response = do_get_request(self.host, self.port, "/ai/waitForSimulatorRequest", {
+                "sid": sid.SerializeToString(),
+                "vid": vid.SerializeToString()
+            })
+            if response.status == 200:
+                result = b"".join(response.readlines())
+            else:
+                AIExchangeService._print_error(response)
+                return None
+        sim_state = SimStateResponse()
+        sim_state.ParseFromString(result)
+        if sim_state.state != SimStateResponse.SimState.RUNNING:
+            self._close_directly(sid, vid)
+        return sim_state.state
 
     def request_data(self, sid: SimulationID, vid: VehicleID, request: DataRequest) -> DataResponse:
         """
@@ -61,18 +134,21 @@ class AIExchangeService:
         checkout the content of the returned value using a debugger.
         """
         from drivebuildclient.httpUtil import do_get_request
-        response = do_get_request(self.host, self.port, "/ai/requestData", {
-            "request": request.SerializeToString(),
-            "sid": sid.SerializeToString(),
-            "vid": vid.SerializeToString()
-        })
-        if response.status == 200:
-            result = b"".join(response.readlines())
-            data_response = DataResponse()
-            data_response.ParseFromString(result)
-            return data_response
-        else:
-            AIExchangeService._print_error(response)
+        result = self._send_directly(sid, vid, b"requestData", [request.SerializeToString()])
+        if result is None:
+            response = do_get_request(self.host, self.port, "/ai/requestData", {
+                "request": request.SerializeToString(),
+                "sid": sid.SerializeToString(),
+                "vid": vid.SerializeToString()
+            })
+            if response.status == 200:
+                result = b"".join(response.readlines())
+            else:
+                AIExchangeService._print_error(response)
+                return None
+        data_response = DataResponse()
+        data_response.ParseFromString(result)
+        return data_response
 
     def control(self, sid: SimulationID, vid: VehicleID, commands: Control) -> Optional[Void]:
         """
@@ -94,16 +170,20 @@ class AIExchangeService:
         :return: A Void object possibly containing a info message.
         """
         from drivebuildclient.httpUtil import do_mixed_request
-        response = do_mixed_request(self.host, self.port, "/ai/control", {
-            "sid": sid.SerializeToString(),
-            "vid": vid.SerializeToString()
-        }, commands.SerializeToString())
-        if response.status == 200:
-            void = Void()
-            void.ParseFromString(b"".join(response.readlines()))
-            return void
-        else:
-            AIExchangeService._print_error(response)
+        result = self._send_directly(sid, vid, b"control", [commands.SerializeToString()])
+        if result is None:
+            response = do_mixed_request(self.host, self.port, "/ai/control", {
+                "sid": sid.SerializeToString(),
+                "vid": vid.SerializeToString()
+            }, commands.SerializeToString())
+            if response.status == 200:
+                result = b"".join(response.readlines())
+            else:
+                AIExchangeService._print_error(response)
+                return None
+        void = Void()
+        void.ParseFromString(result)
+        return void
 
     def control_sim(self, sid: SimulationID, result: TestResult) -> Optional[Void]:
         """
@@ -215,12 +295,68 @@ class AIExchangeService:
         else:
             AIExchangeService._print_error(response)
 
-    def run_tests(self, username: str, password: str, *paths: Path) -> Optional[SubmissionResult.Submissions]:
+    def login(self, username: str, password: str) -> bool:
+        """
+        Opens a session for the given user. Subsequent calls for this user authenticate with the session token instead
+        of the password.
+        :return: Whether the login succeeded.
+        """
+        from drivebuildclient.httpUtil import do_get_request
+        user = User()
+        user.username = username
+        user.password = password
+        response = do_get_request(self.host, self.port, "/auth/login", {
+            "user": user.SerializeToString()
+        })
+        if response.status == 200:
+            session = User()
+            session.ParseFromString(b"".join(response.readlines()))
+            self._sessions[username] = session
+            return True
+        else:
+            AIExchangeService._print_error(response)
+            return False
+
+    def logout(self, username: str) -> None:
+        """
+        Closes the session of the given user if there is any.
+        """
+        from drivebuildclient.httpUtil import do_get_request
+        session = self._sessions.pop(username, None)
+        if session:
+            response = do_get_request(self.host, self.port, "/auth/logout", {
+                "user": session.SerializeToString()
+            })
+            if response.status != 200:
+                AIExchangeService._print_error(response)
+
+    def _do_authenticated(self, username: str, password: str, do_request: Callable[[User], HTTPResponse]) \
+            -> HTTPResponse:
+        """
+        Performs the given request with the session of the given user if there is one. If the session expired the
+        request is repeated with the password.
         """
-        Upload the sequence of given files to DriveBuild, execute them and get their associated simulation IDs.
+        session = self._sessions.get(username)
+        if session:
+            response = do_request(session)
+            if response.status != 401:
+                return response
+            del self._sessions[username]
+            response.read()
+        user = User()
+        user.username = username
+        user.password = password
+        return do_request(user)
+
+    def run_tests(self, username: str, password: str, *paths: Path, priority: int = 0) \
+            -> Optional[SubmissionResult.Submissions]:
+        """
+        Upload the sequence of given files to DriveBuild, execute them and get their associated simulation IDs. If
+        DriveBuild queues the tests this call blocks until they are dispatched.
         :param username: The username for login.
-        :param password: The password for login.
+        :param password: The password for login (Only used if there is no session of the user, see login(...)).
         :param paths: The sequence of file paths of files or folders containing files to be uploaded.
+        :param priority: Queued tests having a higher priority are run first (e.g. CI gating tests).
         :return: A sequence containing simulation IDs for all *valid* test cases uploaded. Returns None iff the upload
         of tests failed or the tests could not be run. Returns an empty list of none of the given test cases was valid.
         """
@@ -228,6 +364,7 @@ class AIExchangeService:
         from tempfile import NamedTemporaryFile
         from zipfile import ZipFile
         from os import remove
+        from time import sleep
         temp_file = NamedTemporaryFile(mode="w", suffix=".zip", delete=False)
         temp_file.close()
 
@@ -248,19 +385,46 @@ class AIExchangeService:
             if len(write_zip_file.filelist) < 2:
                 _logger.error("runTests(...) requires at least two valid files.")
                 return None
-        user = User()
-        user.username = username
-        user.password = password
         with open(temp_file.name, "rb") as read_zip_file:
-            response = do_mixed_request(self.host, self.port, "/runTests", {
-                "user": user.SerializeToString()
-            }, b"".join(read_zip_file.readlines()))
+            content = read_zip_file.read()
         remove(temp_file.name)
+        response = self._do_authenticated(username, password, lambda user: do_mixed_request(
+            self.host, self.port, "/runTests", {
+                "user": user.SerializeToString(),
+                "priority": str(priority)
+            }, content))
         submission_result = SubmissionResult()
         submission_result.ParseFromString(b"".join(response.readlines()))
+        while response.status == 202:
+            _logger.info("The tests are queued (Position: " + str(submission_result.queued.position) + ", ETA: "
+                         + (str(submission_result.queued.eta) + "s" if submission_result.queued.eta else "unknown")
+                         + ").")
+            sleep(min(max(submission_result.queued.eta / 2, 1), 10))
+            response, submission_result = self._get_submission(username, password, submission_result.queued.qid)
         if response.status == 200:
             return submission_result.result
         else:
             _logger.error("Running tests errored:\n"
                           + submission_result.message.message)
             return None
+
+    def get_submission(self, username: str, password: str, qid: int) -> SubmissionResult:
+        """
+        Returns the state of a queued submission.
+        :param qid: The ID of the submission as returned by a queued run_tests(...) call.
+        :return: The queue position and the estimated time until the dispatch if the submission is still queued or the
+        result of running the tests otherwise.
+        """
+        _, submission_result = self._get_submission(username, password, qid)
+        return submission_result
+
+    def _get_submission(self, username: str, password: str, qid: int) -> Tuple[HTTPResponse, SubmissionResult]:
+        from drivebuildclient.httpUtil import do_get_request
+        response = self._do_authenticated(username, password, lambda user: do_get_request(
+            self.host, self.port, "/queue/status", {
+                "user": user.SerializeToString(),
+                "qid": str(qid)
+            }))
+        submission_result = SubmissionResult()
+        submission_result.ParseFromString(b"".join(response.readlines()))
+        return response, submission_result
@@ -3,13 +3,14 @@ from logging import getLogger
 from math import floor, log10
 from socket import socket
 from threading import Lock
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, Iterator, Optional
 
 name = "DriveBuild client"
 CONTENT_LENGTH_LIMIT: int = 10000000  # 10 millions
 # The length of the message transferring the content length
 CONTENT_LENGTH_MESSAGE_LENGTH: int = floor(log10(CONTENT_LENGTH_LIMIT)) + 1
 MAX_RETRY: int = 100
+STREAM_CHUNK_SIZE: int = 65536  # The maximum number of bytes stream_request(...) yields at once
 _logger = getLogger("DriveBuild.Client")
 
 
@@ -34,24 +35,33 @@ def static_vars(**kwargs):
 
 
 def create_server(port: int) -> socket:
-    from socket import AF_INET, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR
+    from socket import AF_INET, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR, IPPROTO_TCP, TCP_NODELAY, SOMAXCONN
     server_socket = socket(AF_INET, SOCK_STREAM)
     server_socket.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+    # NOTE Accepted sockets inherit this option
+    server_socket.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
     server_socket.bind(("0.0.0.0", port))
-    server_socket.listen(1)  # FIXME Determine appropriate value
+    # NOTE SimNodes may connect multiple sockets concurrently (e.g. one per vehicle)
+    server_socket.listen(SOMAXCONN)
     return server_socket
 
 
 def accept_at_server(server_socket: socket, on_accept: Callable[[socket, Tuple[str, int]], None]) -> None:
     while True:
-        conn, addr = server_socket.accept()
+        try:
+            conn, addr = server_socket.accept()
+        except OSError:
+            _logger.info("Stopped accepting connections since the server socket was closed.")
+            return
         _logger.debug(str(server_socket.getsockname()) + " accepted " + str(addr))
         on_accept(conn, addr)
 
 
 def create_client(server_host: str, server_port: int) -> socket:
-    from socket import AF_INET, SOCK_STREAM
+    from socket import AF_INET, SOCK_STREAM, IPPROTO_TCP, TCP_NODELAY
     client_socket = socket(AF_INET, SOCK_STREAM)
+    # NOTE Messages consist of multiple small writes which would otherwise be delayed by Nagle's algorithm
+    client_socket.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
     client_socket.connect((server_host, server_port))
     return client_socket
 
@@ -72,11 +82,12 @@ def _send_message(sock: socket, message: bytes) -> None:
         _send_message.send_locks[sock].release()
 
 
-# FIXME Introduce method receiving bytes until reaching a certain number
-@static_vars(recv_locks=defaultdict(lambda: Lock()))
-def _recv_message(sock: socket) -> bytes:
+def _recv_content_length(sock: socket) -> Optional[int]:
+    """
+    Receives the message announcing the length of the next message.
+    :return: The length of the next message, 0 if the socket stream broke or None if no length was announced.
+    """
     from time import sleep
-    _recv_message.recv_locks[sock].acquire()
     _logger.debug(str(sock.getsockname()) + " waiting for recv message length")
     try:
         tries = 0
@@ -87,32 +98,46 @@ def _recv_message(sock: socket) -> bytes:
                 content_length = int(content_length_message)
                 _logger.debug(
                     str(sock.getsockname()) + " waits for receiving a message of length " + str(content_length))
-                break
+                return content_length
             else:
                 tries = tries + 1
                 sleep(1)
         else:
             _logger.warning("Did not receive content length message.")
-            return b""
+            return None
     except ConnectionResetError:
         _logger.info("The socket " + str(sock.getsockname()) + " was closed.")
-        content_length = 0
+        return 0
     except Exception as ex:
         _logger.warning("The socket stream of " + str(sock.getsockname())
                         + " got corrupted. It is likely that any further message will also break. Cause: " + str(ex))
-        content_length = 0
-    received_message = b""
-    while len(received_message) < content_length:
-        received_message = received_message + sock.recv(content_length - len(received_message))
-    _recv_message.recv_locks[sock].release()
-    return received_message
+        return 0
+
+
+@static_vars(recv_locks=defaultdict(lambda: Lock()))
+def _recv_message(sock: socket) -> bytes:
+    with _recv_message.recv_locks[sock]:
+        content_length = _recv_content_length(sock)
+        if content_length is None:
+            return b""
+        # NOTE Collect the chunks instead of concatenating them since messages (e.g. camera images) may be large
+        chunks = []
+        remaining = content_length
+        while remaining > 0:
+            chunk = sock.recv(remaining)
+            if not chunk:
+                raise ConnectionAbortedError("The socket " + str(sock.getsockname()) + " was closed within a message.")
+            chunks.append(chunk)
+            remaining = remaining - len(chunk)
+        return b"".join(chunks)
 
 
 @static_vars(process_locks=defaultdict(lambda: Lock()))
 def process_request(sock: socket, handle_message: Callable[[bytes, List[bytes]], bytes]) -> None:
     from drivebuildclient.aiExchangeMessages_pb2 import Num
     socket_name = str(sock.getsockname())
-    process_request.process_locks[socket_name].acquire()
+    # NOTE Sockets accepted by the same server share their name, so lock per socket instead of per name
+    process_request.process_locks[sock].acquire()
     action = _recv_message(sock)
     _logger.debug(socket_name + " received action " + action.decode())
     num_data = Num()
@@ -122,7 +147,7 @@ def process_request(sock: socket, handle_message: Callable[[bytes, List[bytes]],
     for _ in range(num_data.num):
         data.append(_recv_message(sock))
         _logger.debug(socket_name + " received data " + str(data[-1]))
-    process_request.process_locks[socket_name].release()
+    process_request.process_locks[sock].release()
     # FIXME Include the send call to the blocked section?
     result = handle_message(action, data)
     _logger.debug(socket_name + " sends result")
@@ -137,12 +162,29 @@ def process_requests(waiting_socket: socket, handle_message: Callable[[bytes, Li
             process_request(waiting_socket, handle_message)
     except (ConnectionAbortedError, ConnectionResetError):
         _logger.info("The socket " + str(waiting_socket.getsockname()) + " was closed.")
+    finally:
+        release_socket(waiting_socket)
+
+
+def release_socket(sock: socket) -> None:
+    """
+    Forgets the locks of the given socket such that they do not keep it alive. Call it once a socket which sent or
+    received messages is closed.
+    """
+    for locks in [_send_message.send_locks, _recv_message.recv_locks, process_request.process_locks,
+                  send_request.request_locks]:
+        locks.pop(sock, None)
 
 
 @static_vars(request_locks=defaultdict(lambda: Lock()))
 def send_request(sock: socket, action: bytes, data: List[bytes]) -> bytes:
+    with send_request.request_locks[sock]:
+        _send_request_message(sock, action, data)
+        return _recv_message(sock)
+
+
+def _send_request_message(sock: socket, action: bytes, data: List[bytes]) -> None:
     from drivebuildclient.aiExchangeMessages_pb2 import Num
-    send_request.request_locks[sock].acquire()
     _send_message(sock, action)
     num_data = Num()
     num_data.num = len(data)
@@ -151,6 +193,31 @@ def send_request(sock: socket, action: bytes, data: List[bytes]) -> bytes:
     _send_message(sock, num_data.SerializeToString())
     for d in data:
         _send_message(sock, d)
-    result = _recv_message(sock)
-    send_request.request_locks[sock].release()
-    return result
+
+
+def stream_request(sock: socket, action: bytes, data: List[bytes],
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Like send_request(...) but yields the response in chunks of at most chunk_size bytes as soon as they arrive instead
+    of buffering the whole response. The request is sent when the first chunk is requested. The socket stays locked
+    until the generator is exhausted or closed. If it is closed early the rest of the response is skipped such that the
+    next request on the socket receives its own response.
+    """
+    with send_request.request_locks[sock]:
+        _send_request_message(sock, action, data)
+        with _recv_message.recv_locks[sock]:
+            remaining = _recv_content_length(sock) or 0
+            try:
+                while remaining > 0:
+                    chunk = sock.recv(min(chunk_size, remaining))
+                    if not chunk:
+                        raise ConnectionAbortedError(
+                            "The socket " + str(sock.getsockname()) + " was closed within a message.")
+                    remaining = remaining - len(chunk)
+                    yield chunk
+            finally:
+                while remaining > 0:
+                    chunk = sock.recv(min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining = remaining - len(chunk)
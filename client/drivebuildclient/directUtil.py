@@ -0,0 +1,29 @@
+from drivebuildclient.aiExchangeMessages_pb2 import DirectEndpoint
+
+# The actions an AI may send over a direct connection to a SimNode
+DIRECT_ACTIONS = [b"waitForSimulatorRequest", b"requestData", b"control"]
+
+
+def _signed_content(endpoint: DirectEndpoint) -> bytes:
+    return "\n".join([endpoint.sid.sid, endpoint.vid.vid, str(endpoint.expires)]).encode()
+
+
+def sign_endpoint(endpoint: DirectEndpoint, secret: bytes) -> None:
+    """
+    Signs the sid, the vid and the expiration time of the given endpoint with the secret the main app shares with the
+    SimNodes.
+    """
+    from hashlib import sha256
+    from hmac import new
+    endpoint.signature = new(secret, _signed_content(endpoint), sha256).digest()
+
+
+def verify_endpoint(endpoint: DirectEndpoint, secret: bytes) -> bool:
+    """
+    :return: Whether the given endpoint was signed with the given secret and is not expired.
+    """
+    from hashlib import sha256
+    from hmac import new, compare_digest
+    from time import time
+    expected = new(secret, _signed_content(endpoint), sha256).digest()
+    return compare_digest(expected, endpoint.signature) and endpoint.expires > time()
@@ -0,0 +1,81 @@
+from typing import Dict, Tuple
+
+from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
+
+# NOTE numpy and pillow are optional dependencies (pip install drivebuild-client[numpy])
+
+RAW_HEADER_FORMAT = "<III"  # height, width, channels
+
+
+def decode_image(encoded: bytes, encoding: DataResponse.Data.Camera.Encoding) -> "numpy.ndarray":
+    """
+    Decodes a single image of a DataResponse.Data.Camera.
+    :param encoded: The content of one of the fields color, annotated or depth.
+    :param encoding: The encoding of the camera message.
+    :return: An uint8 array of shape (height, width) or (height, width, channels).
+    """
+    from numpy import frombuffer, uint8, asarray
+    from struct import calcsize, unpack_from
+    if encoding == DataResponse.Data.Camera.RAW:
+        height, width, channels = unpack_from(RAW_HEADER_FORMAT, encoded)
+        pixels = frombuffer(encoded, dtype=uint8, offset=calcsize(RAW_HEADER_FORMAT))
+        return pixels.reshape((height, width) if channels == 1 else (height, width, channels))
+    else:
+        from PIL import Image
+        from io import BytesIO
+        return asarray(Image.open(BytesIO(encoded)))
+
+
+def decode_camera(camera: DataResponse.Data.Camera) -> Dict[str, "numpy.ndarray"]:
+    """
+    Decodes all images a camera request returned.
+    :param camera: The camera data of a DataResponse like data_response.data["egoFrontCamera"].camera.
+    :return: The decoded images of all returned channels (color, annotated and depth).
+    """
+    images = {}
+    for channel in ["color", "annotated", "depth"]:
+        encoded = getattr(camera, channel)
+        if encoded:
+            images[channel] = decode_image(encoded, camera.encoding)
+    return images
+
+
+def unpack_points(packed: DataResponse.Data.PackedPoints) -> "numpy.ndarray":
+    """
+    Returns a read-only view of shape (number of points, stride) on the given packed points without copying them.
+    """
+    from numpy import frombuffer
+    return frombuffer(packed.data, dtype="<f4").reshape((-1, packed.stride if packed.stride else 1))
+
+
+def _points(packed: DataResponse.Data.PackedPoints, values, stride: int) -> "numpy.ndarray":
+    """
+    Falls back to the deprecated repeated field if a server does not send packed points.
+    """
+    from numpy import asarray, float32
+    if packed.data:
+        return unpack_points(packed)
+    else:
+        return asarray(values, dtype=float32).reshape((-1, stride))
+
+
+def lidar_points(lidar: DataResponse.Data.Lidar) -> "numpy.ndarray":
+    """
+    :return: The points of a lidar having the shape (n, 3).
+    """
+    return _points(lidar.packed, lidar.points, 3)
+
+
+def bounding_box_points(bounding_box: DataResponse.Data.BoundingBox) -> "numpy.ndarray":
+    """
+    :return: The corners of a bounding box having the shape (n, 2).
+    """
+    return _points(bounding_box.packed, bounding_box.points, 2)
+
+
+def road_edge_points(road_edge: DataResponse.Data.RoadEdges.RoadEdge) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    """
+    :return: The points of the left and the right edge of a road each having the shape (n, 2).
+    """
+    return _points(road_edge.packed_left, road_edge.left_points, 2), \
+           _points(road_edge.packed_right, road_edge.right_points, 2)
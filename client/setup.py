@@ -20,8 +20,14 @@ setuptools.setup(
     install_requires=[
         "dill",
         "flask",
-        "protobuf"
+        "protobuf>=3.20"
     ],
+    extras_require={
+        "numpy": [
+            "numpy",
+            "pillow"
+        ]
+    },
     classifiers=[
         "Operating System :: OS Independent",
         "Programming Language :: Python",
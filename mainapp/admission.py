@@ -0,0 +1,285 @@
+from concurrent.futures import Future
+from logging import getLogger
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from drivebuildclient.aiExchangeMessages_pb2 import SubmissionResult, QueuedSubmission
+from drivebuildclient.db_handler import DBConnection
+
+from scheduler import Scheduler
+
+_logger = getLogger("DriveBuild.MainApp.Admission")
+
+
+class AdmissionQueue:
+    """
+    A persistent queue of submissions (tables submissions and submissionparts). Each submission consists of parts
+    (usually one test each) which are dispatched to SimNodes individually as soon as the scheduler finds a free slot.
+    Parts of submissions with a higher priority are dispatched first. Among parts having the same priority users running
+    the fewest simulations are favored (fair share). Users running sim_instance_quota or more simulations are only
+    served if no other user waits for a slot. Remaining ties are dispatched in order of submission.
+    """
+
+    def __init__(self, db_connection: DBConnection, scheduler: Scheduler, count_running: Callable[[], Dict[str, int]],
+                 sim_instance_quota: int, poll_interval: float,
+                 dispatch: Callable[[str, str, bytes], SubmissionResult], dispatch_timeout: float):
+        """
+        :param count_running: Returns the number of running simulations of each user.
+        :param sim_instance_quota: The number of simulations a user may run simultaneously while others are waiting.
+        :param poll_interval: The time in seconds after which the queue looks for free slots without being notified.
+        :param dispatch: Sends the given zip file of the given user to the given SimNode (snid, username, content).
+        :param dispatch_timeout: The time in seconds after which a part which is still dispatching is queued again, e.g.
+        since the worker dispatching it crashed.
+        """
+        self._db_connection = db_connection
+        self._scheduler = scheduler
+        self._count_running = count_running
+        self._sim_instance_quota = sim_instance_quota
+        self._poll_interval = poll_interval
+        self._dispatch = dispatch
+        self._dispatch_timeout = dispatch_timeout
+        self._wake_up = Event()
+        self._lock = Lock()
+        self._dispatched: Dict[int, Future] = {}  # qid --> future SubmissionResult of all parts
+
+    def enqueue(self, username: str, priority: int, parts: List[bytes]) -> Optional[int]:
+        """
+        :param parts: The zip files of the parts of the submission.
+        :return: The qid of the queued submission or None if it could not be stored.
+        """
+        args = {
+            "username": username,
+            "priority": priority
+        }
+        result = self._db_connection.run_query("""
+        INSERT INTO submissions (username, priority) VALUES (:username, :priority) RETURNING qid;
+        """, args)
+        if result:
+            qid = result.fetchall()[0][0]
+            result = self._db_connection.run_query("""
+            INSERT INTO submissionparts (qid, content)
+            SELECT :qid, content FROM unnest(CAST(:contents AS BYTEA[])) AS parts(content);
+            """, {"qid": qid, "contents": parts})
+            if result:
+                with self._lock:
+                    self._dispatched[qid] = Future()
+                self.notify()
+                return qid
+        return None
+
+    def notify(self) -> None:
+        """
+        Signals that slots may have become free or submissions were queued.
+        """
+        self._wake_up.set()
+
+    def wait_for(self, qid: int, timeout: float) -> Optional[SubmissionResult]:
+        """
+        Waits for all parts of the given submission (queued by this process) to be dispatched.
+        :return: The merged result of the parts or None if they were not dispatched within the given timeout.
+        """
+        from concurrent.futures import TimeoutError
+        with self._lock:
+            future = self._dispatched.get(qid)
+        if future:
+            try:
+                return future.result(timeout=timeout)
+            except TimeoutError:
+                return None
+        else:
+            return None
+
+    def get_submission(self, qid: int, username: str) -> Optional[SubmissionResult]:
+        """
+        Returns the merged result of all parts of the given submission if they were dispatched already or the position
+        of the submission in the queue otherwise.
+        :return: None if the given user did not submit a submission having the given qid.
+        """
+        result = self._db_connection.run_query("""
+        SELECT s.priority, p.status, p.result
+        FROM submissions s LEFT JOIN submissionparts p ON p.qid = s.qid
+        WHERE s.qid = :qid AND s.username = :username;
+        """, {"qid": qid, "username": username})
+        rows = result.fetchall() if result else []
+        if rows:
+            return self._to_submission_result(qid, rows[0][0], [(status, result) for _, status, result in rows])
+        else:
+            return None
+
+    def _to_submission_result(self, qid: int, priority: int, parts: List[Tuple[Optional[str], Optional[bytes]]]) \
+            -> SubmissionResult:
+        """
+        :param parts: The status and the serialized result of each part.
+        """
+        from planner import merge_submission_results
+        submission_result = SubmissionResult()
+        num_waiting = len([status for status, _ in parts if status in ["QUEUED", "DISPATCHING"]])
+        if num_waiting:
+            submission_result.queued.CopyFrom(self._get_queued_submission(qid, priority, num_waiting))
+        else:
+            part_results = []
+            for _, serialized_result in parts:
+                if serialized_result:
+                    part_result = SubmissionResult()
+                    part_result.ParseFromString(serialized_result)
+                    part_results.append(part_result)
+            submission_result = merge_submission_results(part_results)
+        return submission_result
+
+    def _get_queued_submission(self, qid: int, priority: int, num_waiting: int) -> QueuedSubmission:
+        from math import ceil
+        queued_submission = QueuedSubmission()
+        queued_submission.qid = qid
+        result = self._db_connection.run_query("""
+        SELECT count(*)
+        FROM submissionparts p JOIN submissions s ON s.qid = p.qid
+        WHERE p.status = 'QUEUED' AND (s.priority > :priority OR (s.priority = :priority AND s.qid < :qid));
+        """, {"qid": qid, "priority": priority})
+        queued_submission.position = result.fetchall()[0][0] if result else 0
+        # Estimate the time until enough simulations finished for all parts of the submission to be dispatched
+        result = self._db_connection.run_query("""
+        SELECT extract(EPOCH FROM avg(finished - started))
+        FROM tests
+        WHERE finished > now() - INTERVAL '1 hour';
+        """)
+        duration = result.fetchall()[0][0] if result else None
+        slots = sum([load.status.slots for load in self._scheduler.get_loads()])
+        if duration and slots:
+            queued_submission.eta = int(ceil((queued_submission.position + num_waiting) / slots) * float(duration))
+        return queued_submission
+
+    def start(self) -> None:
+        dispatch_thread = Thread(target=self._run)
+        dispatch_thread.daemon = True
+        dispatch_thread.start()
+
+    def _run(self) -> None:
+        from time import monotonic
+        next_requeue = monotonic()
+        while True:
+            if monotonic() >= next_requeue:
+                # NOTE Stale parts are queued again at most dispatch_timeout / 2 seconds after they became stale
+                self._requeue_stale_parts()
+                next_requeue = monotonic() + self._dispatch_timeout / 2
+            self._wake_up.wait(self._poll_interval)
+            self._wake_up.clear()
+            try:
+                while self._dispatch_next():
+                    pass
+            except Exception:
+                _logger.exception("Dispatching queued submissions failed.")
+
+    def _requeue_stale_parts(self) -> None:
+        """
+        Queues parts again which are dispatching for more than dispatch_timeout seconds. Otherwise a part claimed by a
+        worker which crashed would never be dispatched and would count against the quota of its user forever.
+        """
+        result = self._db_connection.run_query("""
+        UPDATE submissionparts
+        SET status = 'QUEUED', dispatched = NULL
+        WHERE status = 'DISPATCHING' AND dispatched < now() - make_interval(secs => :timeout)
+        RETURNING pid;
+        """, {"timeout": self._dispatch_timeout})
+        pids = [str(row[0]) for row in result.fetchall()] if result else []
+        if pids:
+            _logger.warning("Queued the parts " + ", ".join(pids) + " again since their dispatch did not finish within "
+                            + str(self._dispatch_timeout) + " seconds.")
+            self.notify()
+
+    def _dispatch_next(self) -> bool:
+        """
+        Claims the next part if there is a free slot and dispatches it in the background.
+        :return: Whether a part was claimed.
+        """
+        from planner import environment_hash
+        snid = self._scheduler.place()
+        if snid:
+            claimed = self._claim_next()
+            if claimed:
+                snid = self._scheduler.prefer(snid, environment_hash(claimed[3]))
+                dispatch_thread = Thread(target=self._dispatch_part, args=(snid,) + claimed)
+                dispatch_thread.daemon = True
+                dispatch_thread.start()
+                return True
+            else:
+                self._scheduler.release(snid, False)
+        return False
+
+    def _claim_next(self) -> Optional[Tuple[int, int, str, bytes]]:
+        """
+        Marks the next part as dispatching. Parts claimed by other workers concurrently are skipped.
+        :return: The pid, the qid, the username and the content of the claimed part or None if there is none.
+        """
+        from json import dumps
+        result = self._db_connection.run_query("""
+        WITH running AS (
+            SELECT username, sum(num) AS num
+            FROM (SELECT key AS username, CAST(value AS INT) AS num FROM json_each_text(CAST(:running AS JSON))
+                  UNION ALL
+                  SELECT s.username, count(*) AS num
+                  FROM submissionparts p JOIN submissions s ON s.qid = p.qid
+                  WHERE p.status = 'DISPATCHING'
+                  GROUP BY s.username) AS active
+            GROUP BY username
+        )
+        UPDATE submissionparts
+        SET status = 'DISPATCHING', dispatched = now()
+        FROM submissions
+        WHERE submissions.qid = submissionparts.qid AND submissionparts.pid = (
+            SELECT p.pid
+            FROM submissionparts p
+                JOIN submissions s ON s.qid = p.qid
+                LEFT JOIN running r ON r.username = s.username
+            WHERE p.status = 'QUEUED'
+            ORDER BY s.priority DESC, coalesce(r.num, 0) >= :quota, coalesce(r.num, 0), p.pid
+            LIMIT 1
+            FOR UPDATE OF p SKIP LOCKED
+        )
+        RETURNING submissionparts.pid, submissionparts.qid, submissions.username, submissionparts.content;
+        """, {"quota": self._sim_instance_quota, "running": dumps(self._count_running())})
+        rows = result.fetchall() if result else []
+        return (rows[0][0], rows[0][1], rows[0][2], bytes(rows[0][3])) if rows else None
+
+    def _dispatch_part(self, snid: str, pid: int, qid: int, username: str, content: bytes) -> None:
+        try:
+            part_result = self._dispatch(snid, username, content)
+        except Exception:
+            _logger.exception("Dispatching part " + str(pid) + " of submission " + str(qid) + " to " + snid
+                              + " failed.")
+            part_result = SubmissionResult()
+            part_result.message.message = "Failed to run tests"
+        started = part_result.HasField("result")
+        self._scheduler.release(snid, started)
+        args = {
+            "pid": pid,
+            "status": "DISPATCHED" if started else "FAILED",
+            "result": part_result.SerializeToString()
+        }
+        self._db_connection.run_query("""
+        UPDATE submissionparts
+        SET status = :status, result = :result, content = NULL
+        WHERE pid = :pid;
+        """, args)
+        self._resolve(qid)
+        self.notify()
+
+    def _resolve(self, qid: int) -> None:
+        """
+        Resolves the future of the given submission if all of its parts are dispatched.
+        """
+        with self._lock:
+            future = self._dispatched.get(qid)
+        if future:
+            result = self._db_connection.run_query("""
+            SELECT s.priority, p.status, p.result
+            FROM submissions s JOIN submissionparts p ON p.qid = s.qid
+            WHERE s.qid = :qid;
+            """, {"qid": qid})
+            rows = result.fetchall() if result else []
+            if rows:
+                submission_result = self._to_submission_result(qid, rows[0][0],
+                                                               [(status, result) for _, status, result in rows])
+                if not submission_result.HasField("queued"):
+                    with self._lock:
+                        self._dispatched.pop(qid, None)
+                    future.set_result(submission_result)
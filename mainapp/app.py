@@ -1,32 +1,227 @@
 from collections import defaultdict
+from concurrent.futures import Future
 from logging import getLogger, basicConfig, INFO
+from os import environ
 from socket import socket
 from threading import Lock
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Set, Iterator
 
-from drivebuildclient import static_vars
-from drivebuildclient.aiExchangeMessages_pb2 import SimulationID, User, SubmissionResult
+from drivebuildclient.aiExchangeMessages_pb2 import SimulationID, User, SubmissionResult, SimStateResponse, VehicleID, \
+    Void, SimulationEvents, SimNodeRegistration
 from drivebuildclient.db_handler import DBConnection
 from flask import Flask, Response
+from admission import AdmissionQueue
+from auth import Authenticator
+from heartbeat import Heartbeat
+from running import RunningTests
+from scheduler import Scheduler
+from state import SharedState
+from stats import TERMINAL_STATES, TestStatesCache
 
 app = Flask(__name__)
 app.config.from_pyfile("app.cfg")
 _DBCONNECTION = DBConnection(app.config["DBMS_HOST"], app.config["DBMS_PORT"], app.config["DBMS_DBNAME"],
                              app.config["DBMS_USERNAME"], app.config["DBMS_PASSWORD"])
+_STATE = SharedState(app.config["STATE_PATH"])
+# NOTE Multiple workers of the main app may run side by side (see workers.py)
+_WORKER_ID = int(environ.get("DRIVEBUILD_WORKER_ID", "0"))
 _logger = getLogger("DriveBuild.MainApp")
 basicConfig(format='%(asctime)s: %(levelname)s - %(message)s', level=INFO)
 
-# FIXME Handle unregister, check alive,...
-# snid --> (socket, sid --> (vid --> socket))
-_connected_sim_nodes: Dict[str, Tuple[socket, Dict[str, Dict[str, socket]]]] = {}
+
+class Connection:
+    """
+    A socket connected to a SimNode. A connection is owned by a single request at a time such that requests using
+    different connections (i.e. different SimNodes or different vehicles) never wait for each other.
+    """
+
+    def __init__(self, sock: socket):
+        self.sock = sock
+        self._lock = Lock()
+
+    def send_request(self, action: bytes, data: List[bytes]) -> bytes:
+        from drivebuildclient import send_request
+        with self._lock:
+            return send_request(self.sock, action, data)
+
+    def try_send_request(self, action: bytes, data: List[bytes]) -> Optional[bytes]:
+        """
+        Sends the request only if the connection is currently not used by another request.
+        :return: The response or None if the connection is busy.
+        """
+        from drivebuildclient import send_request
+        if self._lock.acquire(blocking=False):
+            try:
+                return send_request(self.sock, action, data)
+            finally:
+                self._lock.release()
+        else:
+            return None
+
+    def stream_request(self, action: bytes, data: List[bytes]) -> Iterator[bytes]:
+        """
+        Like send_request(...) but yields the response in chunks of at most RELAY_CHUNK_SIZE bytes as they arrive. The
+        connection is owned until the generator is exhausted or closed.
+        """
+        from drivebuildclient import stream_request
+        with self._lock:
+            yield from stream_request(self.sock, action, data, app.config["RELAY_CHUNK_SIZE"])
+
+    def abort(self) -> None:
+        """
+        Closes the socket immediately. Requests which currently wait for a response return an empty response.
+        """
+        from socket import SHUT_RDWR
+        try:
+            self.sock.shutdown(SHUT_RDWR)
+        except OSError:
+            pass  # The socket is not connected anymore
+        self._close()
+
+    def close(self) -> None:
+        """
+        Closes the socket as soon as it finished its current request.
+        """
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        from drivebuildclient import release_socket
+        self.sock.close()
+        release_socket(self.sock)
+
+
+# snid --> connection
+_connected_sim_nodes: Dict[str, Connection] = {}
+
+
+class RoutingTable:
+    """
+    Maps simulations to the SimNodes hosting them and vehicles in simulations to the connections dedicated to them.
+    All methods are thread safe and do not depend on the number of connected SimNodes or simulations.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._sim_nodes: Dict[str, str] = {}  # sid --> snid
+        self._sids: Dict[str, Set[str]] = defaultdict(set)  # snid --> sids
+        self._vehicle_connections: Dict[Tuple[str, str], Connection] = {}  # (sid, vid) --> connection
+        self._vids: Dict[str, Set[str]] = defaultdict(set)  # sid --> vids having a connection
+        self._expected_vehicle_connections: Dict[Tuple[str, str], Future] = {}  # (sid, vid) --> future connection
+
+    def add_simulation(self, sid: str, snid: str) -> None:
+        with self._lock:
+            self._sim_nodes[sid] = snid
+            self._sids[snid].add(sid)
+
+    def get_sim_node(self, sid: str) -> Optional[str]:
+        return self._sim_nodes.get(sid)
+
+    def add_vehicle_connection(self, sid: str, vid: str, connection: Connection) -> None:
+        with self._lock:
+            self._vehicle_connections[(sid, vid)] = connection
+            self._vids[sid].add(vid)
+            future = self._expected_vehicle_connections.pop((sid, vid), None)
+        if future:
+            future.set_result(connection)
+
+    def expect_vehicle_connection(self, sid: str, vid: str) -> Tuple[Future, bool]:
+        """
+        Returns a future which is resolved as soon as a connection for the given vehicle is registered. All callers
+        waiting for the same vehicle share the same future.
+        :return: The future and whether the caller is the first one waiting (and thus has to request the connection).
+        """
+        with self._lock:
+            key = (sid, vid)
+            if key in self._vehicle_connections:
+                future = Future()
+                future.set_result(self._vehicle_connections[key])
+                return future, False
+            elif key in self._expected_vehicle_connections:
+                return self._expected_vehicle_connections[key], False
+            else:
+                future = Future()
+                self._expected_vehicle_connections[key] = future
+                return future, True
+
+    def discard_expected_vehicle_connection(self, sid: str, vid: str, future: Future) -> None:
+        """
+        Gives up waiting for a vehicle connection such that the next caller requests it again.
+        """
+        with self._lock:
+            if self._expected_vehicle_connections.get((sid, vid)) is future:
+                del self._expected_vehicle_connections[(sid, vid)]
+        future.cancel()
+
+    def get_vehicle_connection(self, sid: str, vid: str) -> Optional[Connection]:
+        return self._vehicle_connections.get((sid, vid))
+
+    def get_vehicle_connections_of(self, snid: str) -> List[Connection]:
+        """
+        Returns the connections of all vehicles in simulations which run on the given SimNode.
+        """
+        with self._lock:
+            return [self._vehicle_connections[(sid, vid)]
+                    for sid in self._sids.get(snid, set()) for vid in self._vids.get(sid, set())]
+
+    def remove_vehicle_connection(self, sid: str, vid: str) -> Optional[Connection]:
+        with self._lock:
+            if sid in self._vids:
+                self._vids[sid].discard(vid)
+            return self._vehicle_connections.pop((sid, vid), None)
+
+    def remove_simulation(self, sid: str) -> List[Connection]:
+        """
+        Removes all routes of the given simulation.
+        :return: The connections of vehicles of the removed simulation which are not used anymore.
+        """
+        with self._lock:
+            return self._remove_simulation(sid)
+
+    def _remove_simulation(self, sid: str) -> List[Connection]:
+        snid = self._sim_nodes.pop(sid, None)
+        if snid in self._sids:
+            self._sids[snid].discard(sid)
+        for key in [key for key in self._expected_vehicle_connections.keys() if key[0] == sid]:
+            self._expected_vehicle_connections.pop(key).cancel()
+        return [self._vehicle_connections.pop((sid, vid)) for vid in self._vids.pop(sid, set())]
+
+    def remove_sim_node(self, snid: str) -> List[Connection]:
+        """
+        Removes all routes of simulations hosted by the given SimNode.
+        :return: The connections of vehicles of the removed simulations.
+        """
+        with self._lock:
+            removed_connections = []
+            for sid in self._sids.pop(snid, set()):
+                removed_connections.extend(self._remove_simulation(sid))
+            return removed_connections
+
+
+_ROUTING_TABLE = RoutingTable()
 
 
 def _find_sim_node(sid: SimulationID) -> Optional[str]:
-    for snid, (_, sid_entries) in _connected_sim_nodes.items():
-        for sid_keys in sid_entries.keys():
-            if sid.sid in sid_keys:
-                return snid
-    return None
+    snid = _ROUTING_TABLE.get_sim_node(sid.sid)
+    if not snid:
+        # NOTE The simulation may have been dispatched by another worker
+        snid = _STATE.get_route(sid.sid)
+        if snid:
+            _ROUTING_TABLE.add_simulation(sid.sid, snid)
+    return snid if snid in _connected_sim_nodes else None
+
+
+def _remove_simulation(sid: str) -> None:
+    _STATE.remove_route(sid)
+    _close_connections(_ROUTING_TABLE.remove_simulation(sid))
+
+
+def _owns_sim_node(snid: str) -> bool:
+    """
+    Every worker is connected to every SimNode but only one of them places submissions on a SimNode. Otherwise workers
+    would place submissions on the same free slots simultaneously.
+    """
+    return int(snid.rsplit("_", 1)[1]) % app.config["WORKERS"] == _WORKER_ID
 
 
 # Setup routes for the app
@@ -61,159 +256,309 @@ def test_launcher():
         return render_template("test_launcher.html")
 
 
-# Contains tuples of vehicles in simulations that requested a socket from a simulation node
-_requested_vehicle_sockets: Dict[str, Tuple[str, str]] = {}  # snid --> (sid, vid)
+def _request_vehicle_connection(snid: str, sid: str, vid: str) -> None:
+    """
+    Asks the given SimNode to register a connection for the given vehicle. The request is sent over any connection to
+    the SimNode which is currently idle such that it does not have to wait for long running requests like runTests.
+    """
+    sid_obj = SimulationID()
+    sid_obj.sid = sid
+    vid_obj = VehicleID()
+    vid_obj.vid = vid
+    data = [sid_obj.SerializeToString(), vid_obj.SerializeToString()]
+    main_connection = _connected_sim_nodes[snid]
+    for connection in [main_connection] + _ROUTING_TABLE.get_vehicle_connections_of(snid):
+        if connection.try_send_request(b"requestSocket", data) is not None:
+            return
+    main_connection.send_request(b"requestSocket", data)
+
+
+def _get_vehicle_connection(snid: str, sid: str, vid: str) -> Optional[Connection]:
+    """
+    Returns the connection dedicated to the given vehicle. If there is none the SimNode is requested to register one
+    and this call blocks until the SimNode registered it or VEHICLE_SOCKET_TIMEOUT passed.
+    """
+    from concurrent.futures import TimeoutError, CancelledError
+    connection = _ROUTING_TABLE.get_vehicle_connection(sid, vid)
+    if connection is None:
+        future, is_requesting = _ROUTING_TABLE.expect_vehicle_connection(sid, vid)
+        if is_requesting:
+            try:
+                _request_vehicle_connection(snid, sid, vid)
+            except (OSError, KeyError):
+                _logger.exception("Requesting a socket for " + sid + ":" + vid + " failed.")
+                _ROUTING_TABLE.discard_expected_vehicle_connection(sid, vid, future)
+                return None
+        try:
+            connection = future.result(timeout=app.config["VEHICLE_SOCKET_TIMEOUT"])
+        except TimeoutError:
+            _logger.warning("The SimNode did not register a socket for " + sid + ":" + vid + " in time.")
+            _ROUTING_TABLE.discard_expected_vehicle_connection(sid, vid, future)
+        except CancelledError:
+            _logger.info("Stopped waiting for a socket for " + sid + ":" + vid + " since the simulation ended.")
+    return connection
+
+
+def _get_connection(snid: str, sid: Optional[str], vid: Optional[str]) -> Optional[Connection]:
+    """
+    :return: The connection dedicated to the given vehicle if sid and vid are given, the main connection to the given
+    SimNode otherwise or None if the SimNode is not connected.
+    """
+    main_connection = _connected_sim_nodes.get(snid)
+    if main_connection:
+        if sid and vid:
+            return _get_vehicle_connection(snid, sid, vid)
+        else:
+            return main_connection
+    else:
+        return None
+
+
+def _on_connection_failed(snid: str, action: bytes, connection: Connection, sid: Optional[str],
+                          vid: Optional[str]) -> None:
+    _logger.exception("Sending " + action.decode() + " to " + snid + " failed.")
+    if sid and vid:
+        # NOTE A broken main connection is handled by the heartbeat since the whole SimNode is unreachable
+        _ROUTING_TABLE.remove_vehicle_connection(sid, vid)
+        connection.abort()
 
 
-# FIXME How to recover failures?
-@static_vars(locks=defaultdict(lambda: Lock()), requestLock=Lock())
 def _send_message_to_sim_node(snid: str, action: bytes, data: List[bytes], sid: Optional[str] = None,
                               vid: Optional[str] = None) -> Optional[bytes]:
-    from drivebuildclient import send_request
-    _remove_dead_sockets()
-    if snid in _connected_sim_nodes:
-        main_socket, sid_entries = _connected_sim_nodes[snid]
-        if sid and vid:
-            _send_message_to_sim_node.requestLock.acquire()
-            if sid not in sid_entries.keys():
-                sid_entries[sid] = {}
-            if vid not in sid_entries[sid].keys():
-                _requested_vehicle_sockets[snid] = (sid, vid)
-                send_request(main_socket, b"requestSocket", [])
-            try:
-                while not _connected_sim_nodes[snid] \
-                        or vid not in _connected_sim_nodes[snid][1][sid]:
-                    pass  # Wait for additional socket to be registered
-                sock = _connected_sim_nodes[snid][1][sid][vid]
-            except KeyError as ex:
-                _logger.exception("Sending a message to the SimNode failed.")
-            _send_message_to_sim_node.requestLock.release()
-        else:
-            sock = main_socket
-        lock = _send_message_to_sim_node.locks[sock]
-        lock.acquire()
-        result = send_request(sock, action, data)
-        lock.release()
-        return result
+    connection = _get_connection(snid, sid, vid)
+    if connection:
+        try:
+            return connection.send_request(action, data)
+        except OSError:
+            _on_connection_failed(snid, action, connection, sid, vid)
+            return None
     else:
         return None
 
 
-def _remove_dead_sockets() -> None:
-    def _is_dead(sock: socket) -> bool:
+def _stream_message_to_sim_node(snid: str, action: bytes, data: List[bytes], sid: Optional[str] = None,
+                                vid: Optional[str] = None) -> Optional[Iterator[bytes]]:
+    """
+    Like _send_message_to_sim_node(...) but returns the response as chunks which are forwarded as soon as they arrive
+    from the SimNode. Hence the memory a relayed request needs does not depend on the size of the response.
+    :return: The chunks of the response or None if the SimNode could not be reached or answered with an empty response.
+    """
+    connection = _get_connection(snid, sid, vid)
+    if connection:
+        chunks = connection.stream_request(action, data)
         try:
-            sock.send(b"")
-            return False
-        except (ConnectionResetError, BrokenPipeError):
-            return True
-
-    to_delete_snids = []
-    to_delete_vids = []
-    sim_node_keys = _connected_sim_nodes.keys()
-    for snid in sim_node_keys:
-        sock, sid_entries = _connected_sim_nodes[snid]
-        if _is_dead(sock):
-            to_delete_snids.append(snid)
-        else:
-            if sid_entries:
-                for sid, vid_entries in sid_entries.items():
-                    for vid, sock in vid_entries.items():
-                        if _is_dead(sock):
-                            to_delete_vids.append((snid, sid, vid))
-    for snid, sid, vid in to_delete_vids:
-        del _connected_sim_nodes[snid][1][sid][vid]
-    for snid in to_delete_snids:
-        del _connected_sim_nodes[snid]
+            # NOTE Wait for the first chunk such that unreachable SimNodes are noticed before the response is started
+            first_chunk = next(chunks, b"")
+        except OSError:
+            _on_connection_failed(snid, action, connection, sid, vid)
+            return None
+        if not first_chunk:
+            chunks.close()
+            return None
+
+        def _forward() -> Iterator[bytes]:
+            try:
+                yield first_chunk
+                yield from chunks
+            except OSError:
+                # NOTE The status is already sent, so the client notices the failure by an incomplete response
+                _on_connection_failed(snid, action, connection, sid, vid)
+            finally:
+                chunks.close()
+
+        return _forward()
+    else:
+        return None
+
+
+def _close_connections(connections: List[Connection]) -> None:
+    for connection in connections:
+        connection.close()
+
+
+def _evict_sim_node(snid: str) -> None:
+    """
+    Removes all routes to the given SimNode and aborts all of its connections.
+    """
+    _SCHEDULER.remove(snid)
+    _RUNNING_TESTS.remove_sim_node(snid)
+    main_connection = _connected_sim_nodes.pop(snid, None)
+    connections = _ROUTING_TABLE.remove_sim_node(snid)
+    if main_connection:
+        connections.append(main_connection)
+    for connection in connections:
+        connection.abort()
+
+
+def _register_sim_node(snid: str, sock: socket, registration: SimNodeRegistration) -> None:
+    """
+    Makes the SimNode which connected the given main socket available for scheduling. A SimNode which registers again
+    (e.g. after a restart) replaces its previous registration.
+    """
+    if snid in _connected_sim_nodes:
+        _logger.warning(registration.node_id + " registered again as " + snid + ".")
+        _HEARTBEAT.unregister(snid)
+        _evict_sim_node(snid)
+    _connected_sim_nodes[snid] = Connection(sock)
+    _HEARTBEAT.register(snid)
+    _SCHEDULER.update(snid, registration.capabilities)
+    _logger.info("Registered " + registration.node_id + " as " + snid + ".")
+
+
+def _update_sim_node_status(snid: str, data: List[bytes]) -> None:
+    from drivebuildclient.aiExchangeMessages_pb2 import SimNodeStatus
+    if data:
+        status = SimNodeStatus()
+        status.ParseFromString(data[0])
+        _SCHEDULER.update(snid, status)
+
+
+def _fetch_running_simulations(snid: str) -> Optional[SimulationEvents]:
+    response = _send_message_to_sim_node(snid, b"runningSimulations", [])
+    if response:
+        running = SimulationEvents()
+        running.ParseFromString(response)
+        return running
+    else:
+        return None
+
+
+def _on_simulation_finished(sid: str) -> None:
+    _remove_simulation(sid)
+    _ADMISSION_QUEUE.notify()
+
+
+def _load_test_state(sid: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    query_result = _DBCONNECTION.run_query("""
+    SELECT status, result
+    FROM tests
+    WHERE "sid" = :sid;
+    """, {"sid": sid})
+    rows = query_result.fetchall() if query_result else []
+    return (rows[0][0], rows[0][1]) if rows else None
+
+
+def _dispatch_submission(snid: str, username: str, content: bytes) -> SubmissionResult:
+    user = User()
+    user.username = username
+    # FIXME Find appropriate timeout
+    response = _send_message_to_sim_node(snid, b"runTests", [content, user.SerializeToString()])
+    submission_result = SubmissionResult()
+    if response:
+        submission_result.ParseFromString(response)
+        if submission_result.HasField("result"):
+            for _, sid in submission_result.result.submissions.items():
+                _STATE.add_route(sid.sid, snid)
+                _ROUTING_TABLE.add_simulation(sid.sid, snid)
+    else:
+        submission_result.message.message = "Failed to run tests"
+    return submission_result
+
+
+_SCHEDULER = Scheduler(app.config["SCHEDULING_POLICY"], _owns_sim_node)
+_HEARTBEAT = Heartbeat(app.config["HEARTBEAT_INTERVAL"], app.config["HEARTBEAT_MAX_MISSED"], _evict_sim_node,
+                       _update_sim_node_status)
+_AUTHENTICATOR = Authenticator(_DBCONNECTION, _STATE, app.config["AUTH_CACHE_TTL"], app.config["SESSION_TTL"],
+                               app.config["PASSWORD_HASH_ITERATIONS"])
+_TEST_STATES = TestStatesCache(app.config["STATS_CACHE_SIZE"], app.config["STATS_CACHE_TTL"], _load_test_state)
+_RUNNING_TESTS = RunningTests(app.config["RECONCILE_INTERVAL"], _fetch_running_simulations,
+                              lambda: list(_connected_sim_nodes.keys()), _on_simulation_finished,
+                              _TEST_STATES.apply)
+_ADMISSION_QUEUE = AdmissionQueue(_DBCONNECTION, _SCHEDULER, _RUNNING_TESTS.count_running,
+                                  app.config["SIM_INSTANCE_QUOTA"], app.config["HEARTBEAT_INTERVAL"],
+                                  _dispatch_submission, app.config["DISPATCH_TIMEOUT"])
 
 
 def _login_correct(user: User) -> bool:
-    args = {
-        "username": user.username,
-        "password": user.password
-    }
-    result = _DBCONNECTION.run_query("""
-    SELECT 1
-    FROM users
-    WHERE username = :username AND password = :password
-    """, args)
-    return result and result.rowcount > 0
-
-
-def _get_running_tests(serialized_user: bytes) -> Union[SubmissionResult.Submissions, Response]:
+    return _AUTHENTICATOR.login_correct(user)
+
+
+def _get_running_tests(user: User) -> SubmissionResult.Submissions:
     submissions = SubmissionResult.Submissions()
-    for snid, (sock, _) in _connected_sim_nodes.items():
-        if snid:
-            submission_result = SubmissionResult()
-            try:
-                running_tests_result = _send_message_to_sim_node(snid, b"runningTests", [serialized_user])
-                if running_tests_result:
-                    submission_result.ParseFromString(running_tests_result)
-                    if submission_result.WhichOneof("may_submissions") == "message":
-                        if submission_result.message.message != "No simulations running":
-                            message = "Determination of running tests currently unavailable."
-                            return Response(response=message, status=503, mimetype="text/plain")
-                    else:
-                        for test_name, sid in submission_result.result.submissions.items():
-                            submissions.submissions[test_name].sid = sid.sid
-                else:
-                    _logger.warning("SimNode " + snid + " did not respond to runningTests request.")
-            except OSError:
-                message = "The connection to a simulation node broke. It may not run anymore."
-                return Response(response=message, status=503, mimetype="text/plain")
-        else:
-            _logger.warning("Found a snid in _connected_sim_nodes that is None.")
+    for test_name, sid in _RUNNING_TESTS.get_running(user.username).items():
+        submissions.submissions[test_name].sid = sid
     return submissions
 
 
+@app.route("/auth/login", methods=["GET"])
+def login():
+    from drivebuildclient.httpUtil import process_get_request
+
+    def do() -> Response:
+        from flask import request
+        user = User()
+        user.ParseFromString(request.args["user"].encode())
+        token = _AUTHENTICATOR.create_session(user)
+        if token:
+            session = User()
+            session.username = user.username
+            session.token = token
+            return Response(response=session.SerializeToString(), status=200, mimetype="application/x-protobuf")
+        else:
+            return Response(response="Login or password is incorrect.", status=401, mimetype="text/plain")
+
+    return process_get_request(["user"], do)
+
+
+@app.route("/auth/logout", methods=["GET"])
+def logout():
+    from drivebuildclient.httpUtil import process_get_request
+
+    def do() -> Response:
+        from flask import request
+        user = User()
+        user.ParseFromString(request.args["user"].encode())
+        if _AUTHENTICATOR.get_session_user(user.token) == user.username:
+            _AUTHENTICATOR.revoke_session(user.token)
+            return Response(response="Logged out.", status=200, mimetype="text/plain")
+        else:
+            return Response(response="The session is unknown or expired.", status=404, mimetype="text/plain")
+
+    return process_get_request(["user"], do)
+
+
 @app.route("/runTests", methods=["POST"])
-@static_vars(sim_instance_quota=2)
 def run_tests():
     from drivebuildclient.httpUtil import process_mixed_request
 
     def do() -> Response:
         from flask import request
-        _remove_dead_sockets()
         serialized_user = request.args["user"].encode()
         user = User()
         user.ParseFromString(serialized_user)
         submission_result = SubmissionResult()
         if _login_correct(user):
-            submissions = _get_running_tests(serialized_user)
-            if isinstance(submissions, SubmissionResult.Submissions):
-                if len(submissions.submissions) < run_tests.sim_instance_quota:
-                    selected_snid = None
-                    for snid, (sock, sid_entries) in _connected_sim_nodes.items():
-                        if selected_snid is None or len(sid_entries) < len(_connected_sim_nodes[selected_snid][1]):
-                            selected_snid = snid
-                    if selected_snid:
-                        # FIXME Find appropriate timeout
-                        response = _send_message_to_sim_node(
-                            selected_snid, b"runTests", [request.data, serialized_user])
-                        if response:
-                            submission_result.ParseFromString(response)
-                            if submission_result.HasField("result"):
-                                for _, sid in submission_result.result.submissions.items():
-                                    _connected_sim_nodes[selected_snid][1][sid.sid] = {}
-                                status = 200
+            try:
+                priority = min(max(int(request.args.get("priority", "0")), 0), app.config["MAX_SUBMISSION_PRIORITY"])
+            except ValueError:
+                priority = None
+            if priority is None:
+                submission_result.message.message = "The priority has to be an integer."
+                status = 400
+            else:
+                from planner import plan_submission
+                qid = _ADMISSION_QUEUE.enqueue(user.username, priority, plan_submission(request.data))
+                if qid is None:
+                    submission_result.message.message = "The tests could not be queued."
+                    status = 500
+                else:
+                    # NOTE Answer immediately if there are free slots
+                    dispatch_result = _ADMISSION_QUEUE.wait_for(qid, app.config["SUBMISSION_WAIT"])
+                    if dispatch_result:
+                        submission_result = dispatch_result
+                        status = 200 if submission_result.HasField("result") else 400
+                    else:
+                        queued_result = _ADMISSION_QUEUE.get_submission(qid, user.username)
+                        if queued_result:
+                            submission_result = queued_result
+                            if submission_result.HasField("queued"):
+                                status = 202
                             else:
-                                status = 400
+                                status = 200 if submission_result.HasField("result") else 400
                         else:
-                            submission_result.message.message = "Failed to run tests"
+                            submission_result.message.message = "The tests were queued as submission " + str(qid) \
+                                                                + " but its state could not be determined."
                             status = 500
-                    else:
-                        submission_result.message.message = "There is currently no simulation node registered."
-                        status = 503
-                else:
-                    submission_result.message.message = "You´re not allowed to run more than " \
-                                                        + str(run_tests.sim_instance_quota) \
-                                                        + " instances simultaneously (Running simulations: " \
-                                                        + ", ".join(submissions.submissions) + ")."
-                    status = 429
-            elif isinstance(submissions, Response):
-                return submissions
-            else:
-                submission_result.message.message = "The tests the user is running could not be determined."
-                status = 503
         else:
             submission_result.message.message = "Login or password is incorrect."
             status = 401
@@ -223,6 +568,37 @@ def run_tests():
     return process_mixed_request(["user"], do)
 
 
+@app.route("/queue/status", methods=["GET"])
+def queue_status():
+    from drivebuildclient.httpUtil import process_get_request
+
+    def do() -> Response:
+        from flask import request
+        user = User()
+        user.ParseFromString(request.args["user"].encode())
+        qid = int(request.args["qid"]) if request.args["qid"].isdigit() else -1
+        if _login_correct(user):
+            submission_result = _ADMISSION_QUEUE.get_submission(qid, user.username)
+            if submission_result is None:
+                submission_result = SubmissionResult()
+                submission_result.message.message = "There is no submission " + request.args["qid"] + " of this user."
+                status = 404
+            elif submission_result.HasField("queued"):
+                status = 202
+            elif submission_result.HasField("result"):
+                status = 200
+            else:
+                status = 400
+        else:
+            submission_result = SubmissionResult()
+            submission_result.message.message = "Login or password is incorrect."
+            status = 401
+        return Response(response=submission_result.SerializeToString(), status=status,
+                        mimetype="application/x-protobuf")
+
+    return process_get_request(["user", "qid"], do)
+
+
 @app.route("/sim/stop", methods=["GET"])
 def stop():
     from drivebuildclient.httpUtil import process_get_request
@@ -235,6 +611,7 @@ def stop():
         if snid:
             serialized_result = request.args["result"].encode()
             response = _send_message_to_sim_node(snid, b"stop", [serialized_sid, serialized_result])
+            _remove_simulation(sid.sid)
             return Response(response=response, status=200, mimetype="application/x-protobuf")
         else:
             return Response(response="Simulation node with ID " + sid.sid + " not found",
@@ -260,6 +637,13 @@ def wait_for_simulator_request():
                                                  [serialized_sid, serialized_vid], sid.sid, vid.vid)
             return Response(response=response, status=200, mimetype="application/x-protobuf")
         else:
+            # NOTE The routes of a simulation are removed once it finished but its AIs may still ask for its state
+            test_state = _TEST_STATES.get(sid.sid)
+            if test_state and test_state[0] in TERMINAL_STATES:
+                sim_state = SimStateResponse()
+                sim_state.state = SimStateResponse.SimState.Value(test_state[0])
+                return Response(response=sim_state.SerializeToString(), status=200,
+                                mimetype="application/x-protobuf")
             return Response(response="Simulation node with hosting simulation with ID " + sid.sid + " not found",
                             status=400, mimetype="text/plain")
 
@@ -278,9 +662,11 @@ def request_data():
         serialized_vid, vid = extract_vid()
         snid = _find_sim_node(sid)
         if snid:
-            response = _send_message_to_sim_node(snid, b"requestData",
-                                                 [serialized_sid, serialized_vid, serialized_request], sid.sid, vid.vid)
-            return Response(response=response, status=200, mimetype="application/x-protobuf")
+            response = _stream_message_to_sim_node(snid, b"requestData",
+                                                   [serialized_sid, serialized_vid, serialized_request], sid.sid,
+                                                   vid.vid)
+            # NOTE Flask sends a generator using chunked transfer encoding
+            return Response(response=response or b"", status=200, mimetype="application/x-protobuf")
         else:
             return Response(response="Simulation node with ID " + sid.sid + " not found",
                             status=400, mimetype="text/plain")
@@ -310,28 +696,81 @@ def control():
     return process_mixed_request(["sid", "vid"], do)
 
 
+@app.route("/ai/directEndpoint", methods=["GET"])
+def direct_endpoint():
+    from drivebuildclient.httpUtil import process_get_request
+
+    def do() -> Response:
+        from drivebuildclient.aiExchangeMessages_pb2 import DirectEndpoint
+        from drivebuildclient.directUtil import sign_endpoint
+        from drivebuildclient.httpUtil import extract_sid, extract_vid
+        from time import time
+        _, sid = extract_sid()
+        _, vid = extract_vid()
+        snid = _find_sim_node(sid)
+        status = _SCHEDULER.get_status(snid) if snid else None
+        main_connection = _connected_sim_nodes.get(snid) if snid else None
+        if not main_connection:
+            return Response(response="Simulation node with ID " + sid.sid + " not found",
+                            status=400, mimetype="text/plain")
+        elif not status or not status.data_port:
+            return Response(response="The simulation node hosting simulation " + sid.sid
+                                     + " does not accept direct connections.", status=404, mimetype="text/plain")
+        else:
+            endpoint = DirectEndpoint()
+            endpoint.host = status.data_host if status.data_host else main_connection.sock.getpeername()[0]
+            endpoint.port = status.data_port
+            endpoint.sid.CopyFrom(sid)
+            endpoint.vid.CopyFrom(vid)
+            endpoint.expires = int(time() + app.config["DIRECT_ENDPOINT_TTL"])
+            sign_endpoint(endpoint, app.config["DIRECT_ENDPOINT_SECRET"].encode())
+            return Response(response=endpoint.SerializeToString(), status=200, mimetype="application/x-protobuf")
+
+    return process_get_request(["sid", "vid"], do)
+
+
 @app.route("/stats/getRunningSids", methods=["GET"])
 def get_running_sids():
     from drivebuildclient.httpUtil import process_get_request
 
     def do() -> Response:
         from flask import request
-        serialized_user = request.args["user"]
-        submissions = _get_running_tests(serialized_user)
-        if isinstance(submissions, Response):
-            return submissions
-        elif isinstance(submissions, SubmissionResult.Submissions):
-            submission_result = SubmissionResult()
-            submission_result.result.submissions.extend(submissions)
-            return Response(response=submission_result.SerializeToString(), status=200,
-                            mimetype="x-application/protobuf")
-        else:
-            return Response(response="getRunningSids can not handle " + str(type(submissions)) + ".",
-                            status=501, mimetype="text/plain")
+        user = User()
+        user.ParseFromString(request.args["user"].encode())
+        submission_result = SubmissionResult()
+        submission_result.result.CopyFrom(_get_running_tests(user))
+        return Response(response=submission_result.SerializeToString(), status=200,
+                        mimetype="x-application/protobuf")
 
     return process_get_request(["user"], do)
 
 
+@app.route("/stats/nodes", methods=["GET"])
+def get_node_metrics():
+    from json import dumps
+    return Response(response=dumps(_SCHEDULER.get_metrics()), status=200, mimetype="application/json")
+
+
+def _get_trace_files_response(sid: str) -> Optional[Response]:
+    """
+    SimNodes using the trace backend "columnar" store verification cycles as files instead of in the table
+    verificationcycles. This endpoint does not serve these files.
+    :return: A response pointing to the trace files of the given simulation or None if there are none.
+    """
+    query_result = _DBCONNECTION.run_query("""
+    SELECT path
+    FROM tracefiles
+    WHERE "sid" = :sid;
+    """, {"sid": sid})
+    rows = query_result.fetchall() if query_result else []
+    if rows:
+        return Response(response="The trace of simulation " + sid + " is stored as files in " + rows[0][0]
+                                 + " on its SimNode. Read them using the read_* functions of simnode/columnar.py.",
+                        status=404, mimetype="text/plain")
+    else:
+        return None
+
+
 @app.route("/stats/<action>", methods=["GET"])
 def status(action: str):
     from drivebuildclient.httpUtil import process_get_request
@@ -342,26 +781,13 @@ def status(action: str):
         _, sid = extract_sid()
         if sid:
             response = None
-            if action == "result":
-                args = {
-                    "sid": sid.sid
-                }
-                query_result = _DBCONNECTION.run_query("""
-                SELECT result
-                FROM tests
-                WHERE "sid" = :sid;
-                """, args)
-                result = query_result.fetchall()[0][0]
-            elif action == "status":
-                args = {
-                    "sid": sid.sid
-                }
-                query_result = _DBCONNECTION.run_query("""
-                SELECT status
-                FROM tests
-                WHERE "sid" = :sid;
-                """, args)
-                result = query_result.fetchall()[0][0]
+            if action in ["result", "status"]:
+                # NOTE Clients poll these, so they are answered by the cache (see TestStatesCache)
+                test_state = _TEST_STATES.get(sid.sid)
+                if test_state:
+                    result = test_state[1] if action == "result" else test_state[0]
+                else:
+                    result = None
             elif action == "trace":
                 _, vid = extract_vid()
                 if vid:
@@ -384,6 +810,8 @@ def status(action: str):
                     WHERE "sid" = :sid;
                     """, args)
                 result = query_result.fetchall()
+                if not result:
+                    response = _get_trace_files_response(sid.sid)
             else:
                 response = Response(response="The action \"" + action + "\" is not implemented.", status=501,
                                     mimetype="text/plain")
@@ -420,44 +848,92 @@ def page_not_implemented(error):
 
 def _wait_for_sim_node_registers() -> None:
     from threading import Thread
-    from drivebuildclient import static_vars, create_server, accept_at_server
+    from drivebuildclient import create_server, accept_at_server
     from drivebuildclient.aiExchangeMessages_pb2 import SimulationNodeID
 
-    @static_vars(prefix="snid_", counter=0)
-    def generate_snid() -> str:
-        while True:
-            snid = generate_snid.prefix + str(generate_snid.counter)
-            if snid in _connected_sim_nodes.keys():
-                generate_snid.counter += 1
-            else:
-                break
-        return snid
-
     def on_register(conn: socket, addr: Tuple[str, int]) -> None:
-        _remove_dead_sockets()
-        snid = None
-        for cur_snid, (main_sock, _) in _connected_sim_nodes.items():
-            if main_sock.getpeername()[0] == addr[0]:
-                snid = cur_snid
-                break
-        if snid:
-            if snid in _requested_vehicle_sockets.keys():
-                sid, vid = _requested_vehicle_sockets[snid]
-                del _requested_vehicle_sockets[snid]
-                _connected_sim_nodes[snid][1][sid][vid] = conn
+        from drivebuildclient import process_request, release_socket
+        from drivebuildclient.aiExchangeMessages_pb2 import Num
+        registrations = []
+        vehicle_connections: List[Tuple[str, str]] = []  # (sid, vid)
+        heartbeat_snids = []
+        event_snids = []
+
+        def _handle_registration(action: bytes, data: List[bytes]) -> bytes:
+            if action == b"registerSimNode":
+                registration = SimNodeRegistration()
+                registration.ParseFromString(data[0])
+                registrations.append(registration)
+                result = SimulationNodeID()
+                result.snid = _STATE.get_snid(registration.node_id)
+            elif action == b"registerVehicleSocket":
+                sid = SimulationID()
+                sid.ParseFromString(data[0])
+                vid = VehicleID()
+                vid.ParseFromString(data[1])
+                result = Void()
+                snid = _find_sim_node(sid)
+                if len(data) > 2:
+                    snid_obj = SimulationNodeID()
+                    snid_obj.ParseFromString(data[2])
+                    if snid_obj.snid != snid:
+                        # NOTE E.g. a socket of a restarted SimNode for a simulation which is placed elsewhere now
+                        _logger.warning(snid_obj.snid + " registered a socket for " + sid.sid + ":" + vid.vid
+                                        + " which runs on " + str(snid) + ".")
+                        result.message = "The simulation " + sid.sid + " does not run on " + snid_obj.snid + "."
+                        return result.SerializeToString()
+                vehicle_connections.append((sid.sid, vid.vid))
+                result.message = "Registered socket for " + sid.sid + ":" + vid.vid + "."
+            elif action == b"registerHeartbeatSocket":
+                snid_obj = SimulationNodeID()
+                snid_obj.ParseFromString(data[0])
+                heartbeat_snids.append(snid_obj.snid)
+                result = Num()
+                result.num = int(_HEARTBEAT.interval * 1000)  # The interval in ms the SimNode has to ping
+            elif action == b"registerEventSocket":
+                snid_obj = SimulationNodeID()
+                snid_obj.ParseFromString(data[0])
+                event_snids.append(snid_obj.snid)
+                result = Void()
+                result.message = "Registered event socket of " + snid_obj.snid + "."
             else:
                 _logger.debug("Got superfluous socket for " + str(addr))
-        else:
-            snid = generate_snid()
-            _connected_sim_nodes[snid] = (conn, {})
-            snid_obj = SimulationNodeID()
-            snid_obj.snid = snid
-            conn.send(snid_obj.SerializeToString())
+                result = Void()
+                result.message = "The action \"" + action.decode() + "\" is unknown."
+            return result.SerializeToString()
+
+        def _serve_socket() -> None:
+            process_request(conn, _handle_registration)
+            if registrations:
+                # NOTE Publish the connection not until the SimNode received its snid
+                _register_sim_node(_STATE.get_snid(registrations[0].node_id), conn, registrations[0])
+            elif vehicle_connections:
+                # NOTE Publish the connection not until the SimNode received the reply to its registration. Otherwise
+                # a relayed request may be sent while the SimNode still waits for the reply and corrupt the framing.
+                _ROUTING_TABLE.add_vehicle_connection(vehicle_connections[0][0], vehicle_connections[0][1],
+                                                      Connection(conn))
+            elif heartbeat_snids:
+                _HEARTBEAT.serve(heartbeat_snids[0], conn)
+            elif event_snids:
+                _RUNNING_TESTS.serve(event_snids[0], conn)
+            else:
+                conn.close()
+                release_socket(conn)
+
+        # NOTE Do not block accepting further sockets while waiting for the socket to identify itself
+        registration_thread = Thread(target=_serve_socket)
+        registration_thread.daemon = True
+        registration_thread.start()
 
-    sim_node_register_thread = Thread(target=accept_at_server, args=(create_server(5001), on_register))
+    register_server = create_server(app.config["SIM_NODE_REGISTER_PORT"] + _WORKER_ID)
+    sim_node_register_thread = Thread(target=accept_at_server, args=(register_server, on_register))
+    sim_node_register_thread.daemon = True
     sim_node_register_thread.start()
 
 
+_HEARTBEAT.start()
+_RUNNING_TESTS.start()
+_ADMISSION_QUEUE.start()
 _wait_for_sim_node_registers()
 if __name__ == '__main__':
-    app.run(host="0.0.0.0", port=app.config["PORT"])
+    app.run(host="0.0.0.0", port=app.config["PORT"] + _WORKER_ID)
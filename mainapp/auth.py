@@ -0,0 +1,166 @@
+from logging import getLogger
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from drivebuildclient.aiExchangeMessages_pb2 import User
+from drivebuildclient.db_handler import DBConnection
+
+from state import SharedState
+
+_logger = getLogger("DriveBuild.MainApp.Auth")
+HASH_SCHEME = "pbkdf2_sha256"
+
+
+def hash_password(password: str, iterations: int) -> str:
+    """
+    :return: A salted hash of the given password in the format <scheme>$<iterations>$<salt>$<hash> as stored in the
+    column password of the table users.
+    """
+    from hashlib import pbkdf2_hmac
+    from os import urandom
+    salt = urandom(16)
+    digest = pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return HASH_SCHEME + "$" + str(iterations) + "$" + salt.hex() + "$" + digest.hex()
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """
+    :param stored: A hash as created by hash_password(...) or a legacy plaintext password.
+    """
+    from hashlib import pbkdf2_hmac
+    from hmac import compare_digest
+    parts = stored.split("$")
+    if len(parts) == 4 and parts[0] == HASH_SCHEME:
+        _, iterations, salt, digest = parts
+        return compare_digest(pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations)).hex(),
+                              digest)
+    else:
+        return compare_digest(password.encode(), stored.encode())
+
+
+def is_hashed(stored: str) -> bool:
+    return stored.startswith(HASH_SCHEME + "$")
+
+
+class Authenticator:
+    """
+    Verifies the credentials of users. Passwords are stored as salted hashes. Legacy plaintext passwords are replaced by
+    hashes on their first successful login. Verified credentials are cached for cache_ttl seconds such that bursts of
+    requests do not query the database for each request. Users may also login once and authenticate subsequent requests
+    with the returned session token. Sessions are shared by all workers whereas each worker caches credentials itself.
+    """
+
+    def __init__(self, db_connection: DBConnection, state: SharedState, cache_ttl: float, session_ttl: float,
+                 iterations: int):
+        """
+        :param cache_ttl: The time in seconds verified credentials are accepted without querying the database.
+        :param session_ttl: The time in seconds a session token is valid.
+        :param iterations: The number of PBKDF2 iterations for hashing passwords.
+        """
+        from os import urandom
+        self._db_connection = db_connection
+        self._state = state
+        self._cache_ttl = cache_ttl
+        self._session_ttl = session_ttl
+        self._iterations = iterations
+        self._lock = Lock()
+        # NOTE The cache only holds keyed digests of passwords which are worthless outside of this process
+        self._cache_key = urandom(32)
+        self._verified: Dict[str, Tuple[bytes, float]] = {}  # username --> (password digest, expiry)
+
+    def _digest(self, password: str) -> bytes:
+        from hashlib import sha256
+        from hmac import new
+        return new(self._cache_key, password.encode(), sha256).digest()
+
+    def login_correct(self, user: User) -> bool:
+        """
+        Checks the session token of the given user if it has one and its password otherwise.
+        """
+        if user.token:
+            return self.get_session_user(user.token) == user.username
+        else:
+            return self._credentials_correct(user.username, user.password)
+
+    def _credentials_correct(self, username: str, password: str) -> bool:
+        from hmac import compare_digest
+        from time import monotonic
+        digest = self._digest(password)
+        with self._lock:
+            cached = self._verified.get(username)
+        if cached and cached[1] > monotonic() and compare_digest(cached[0], digest):
+            return True
+        result = self._db_connection.run_query("""
+        SELECT password
+        FROM users
+        WHERE username = :username;
+        """, {"username": username})
+        if result is None:  # NOTE Do not revoke anything only since the database is unavailable
+            return False
+        rows = result.fetchall()
+        if not rows:
+            if cached:
+                _logger.info("Invalidated the credentials of " + username + " since the user was removed.")
+                self.invalidate(username)
+            return False
+        if verify_password(password, rows[0][0]):
+            if cached and not compare_digest(cached[0], digest):
+                _logger.info("Invalidated the credentials of " + username + " since its password changed.")
+                self.invalidate(username)
+            if not is_hashed(rows[0][0]):
+                self._upgrade_password(username, password, rows[0][0])
+            with self._lock:
+                self._verified[username] = (digest, monotonic() + self._cache_ttl)
+            return True
+        else:
+            return False
+
+    def _upgrade_password(self, username: str, password: str, legacy_password: str) -> None:
+        args = {
+            "username": username,
+            "password": hash_password(password, self._iterations),
+            "legacy_password": legacy_password
+        }
+        # NOTE Only replace the password if nobody changed it in the meantime
+        self._db_connection.run_query("""
+        UPDATE users
+        SET password = :password
+        WHERE username = :username AND password = :legacy_password;
+        """, args)
+        _logger.info("Replaced the plaintext password of " + username + " by a hash.")
+
+    def invalidate(self, username: str) -> None:
+        """
+        Forgets the verified credentials and revokes all sessions of the given user, e.g. after changing its password.
+        Other workers forget the credentials after at most cache_ttl seconds.
+        """
+        with self._lock:
+            self._verified.pop(username, None)
+        self._state.remove_sessions_of(username)
+
+    def create_session(self, user: User) -> Optional[str]:
+        """
+        :return: A new session token for the given user or None if its credentials are incorrect.
+        """
+        from secrets import token_urlsafe
+        from time import time
+        if self._credentials_correct(user.username, user.password):
+            token = token_urlsafe(32)
+            self._state.add_session(token, user.username, time(), self._session_ttl)
+            return token
+        else:
+            return None
+
+    def get_session_user(self, token: str) -> Optional[str]:
+        """
+        :return: The username the given session token belongs to or None if the token is unknown or expired.
+        """
+        from time import time
+        return self._state.get_session(token, time())
+
+    def revoke_session(self, token: str) -> bool:
+        """
+        :return: Whether the given session token existed.
+        """
+        return self._state.remove_session(token)
+
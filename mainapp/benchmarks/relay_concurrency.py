@@ -0,0 +1,126 @@
+"""
+Measures how the throughput of relaying AI requests to a SimNode scales with the number of concurrently running
+simulations. A fake SimNode answers each requestData after a fixed latency which simulates the work of a real SimNode.
+If independent simulations are relayed in parallel the throughput grows linearly with the number of AI clients.
+With --stream the responses are relayed chunk-wise like /ai/requestData does and the peak of memory allocated while
+relaying is reported in addition.
+Run from the mainapp directory: python -m benchmarks.relay_concurrency [--latency 0.01] [--requests 50] [--stream]
+NOTE This starts the registration server of the MainApp, so no other MainApp may run on the same machine.
+"""
+from argparse import ArgumentParser
+from threading import Thread
+from time import sleep, perf_counter
+from typing import List
+
+
+def _start_fake_sim_node(latency: float, payload: bytes) -> None:
+    from drivebuildclient import create_client, process_requests, send_request
+    from drivebuildclient.aiExchangeMessages_pb2 import SimulationNodeID, Void, Num, SimNodeRegistration
+
+    def _handle_message(action: bytes, data: List[bytes]) -> bytes:
+        if action == b"requestSocket":
+            client = create_client("localhost", 5001)
+            send_request(client, b"registerVehicleSocket", data[0:2] + [snid.SerializeToString()])
+            client_thread = Thread(target=process_requests, args=(client, _handle_message))
+            client_thread.daemon = True
+            client_thread.start()
+            result = Void()
+            result.message = "Connected another client socket to the main app."
+            return result.SerializeToString()
+        elif action == b"requestData":
+            sleep(latency)
+            return payload
+        else:
+            result = Void()
+            result.message = "The action \"" + action.decode() + "\" is unknown."
+            return result.SerializeToString()
+
+    def _send_heartbeats() -> None:
+        heartbeat_client = create_client("localhost", 5001)
+        interval = Num()
+        interval.ParseFromString(send_request(heartbeat_client, b"registerHeartbeatSocket", [snid.SerializeToString()]))
+        while True:
+            sleep(interval.num / 1000)
+            send_request(heartbeat_client, b"ping", [])
+
+    main_app_client = create_client("localhost", 5001)
+    registration = SimNodeRegistration()
+    registration.node_id = "benchmark"
+    registration.capabilities.slots = 1
+    snid = SimulationNodeID()
+    snid.ParseFromString(send_request(main_app_client, b"registerSimNode", [registration.SerializeToString()]))
+    for target, args in [(process_requests, (main_app_client, _handle_message)), (_send_heartbeats, ())]:
+        sim_node_thread = Thread(target=target, args=args)
+        sim_node_thread.daemon = True
+        sim_node_thread.start()
+
+
+def _run_ai_clients(num_clients: int, num_requests: int, first_sid: int, stream: bool) -> float:
+    """
+    :return: The number of relayed requests per second.
+    """
+    import app
+    from drivebuildclient.aiExchangeMessages_pb2 import SimulationID, VehicleID, DataRequest
+    snid = next(iter(app._connected_sim_nodes.keys()))
+    request = DataRequest()
+    request.request_ids.extend(["egoPosition"])
+    serialized_request = request.SerializeToString()
+
+    def _run_ai(sid: SimulationID, vid: VehicleID) -> None:
+        serialized_sid = sid.SerializeToString()
+        serialized_vid = vid.SerializeToString()
+        data = [serialized_sid, serialized_vid, serialized_request]
+        for _ in range(num_requests):
+            if stream:
+                for _ in app._stream_message_to_sim_node(snid, b"requestData", data, sid.sid, vid.vid):
+                    pass
+            else:
+                app._send_message_to_sim_node(snid, b"requestData", data, sid.sid, vid.vid)
+
+    threads = []
+    for i in range(num_clients):
+        sid = SimulationID()
+        sid.sid = str(first_sid + i)
+        vid = VehicleID()
+        vid.vid = "ego"
+        app._ROUTING_TABLE.add_simulation(sid.sid, snid)
+        threads.append(Thread(target=_run_ai, args=(sid, vid)))
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return num_clients * num_requests / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark of relaying requests of concurrent AIs to a SimNode")
+    parser.add_argument("--latency", type=float, default=0.01, help="The time in seconds a SimNode needs per request")
+    parser.add_argument("--requests", type=int, default=50, help="The number of requests each AI sends")
+    parser.add_argument("--payload", type=int, default=1024, help="The size of each response in bytes")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--stream", action="store_true", help="Relay the responses chunk-wise")
+    args = parser.parse_args()
+    import app
+    from tracemalloc import start, get_traced_memory, reset_peak
+    _start_fake_sim_node(args.latency, b"x" * args.payload)
+    while not app._connected_sim_nodes:
+        sleep(0.1)
+    print("AI clients".ljust(12) + "requests/s".rjust(15) + "speedup".rjust(10) + "ideal".rjust(10)
+          + "peak MiB".rjust(10))
+    start()
+    first_sid = 0
+    baseline = None
+    for num_clients in args.clients:
+        reset_peak()
+        throughput = _run_ai_clients(num_clients, args.requests, first_sid, args.stream)
+        peak = get_traced_memory()[1] / (1024 * 1024)
+        first_sid += num_clients
+        if baseline is None:
+            baseline = throughput / num_clients
+        print(str(num_clients).ljust(12) + ("%.1f" % throughput).rjust(15)
+              + ("%.2f" % (throughput / baseline)).rjust(10) + str(num_clients).rjust(10) + ("%.1f" % peak).rjust(10))
+
+
+if __name__ == "__main__":
+    main()
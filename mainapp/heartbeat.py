@@ -0,0 +1,112 @@
+from logging import getLogger
+from socket import socket
+from threading import Lock, Thread
+from typing import Callable, Dict, List
+
+_logger = getLogger("DriveBuild.MainApp.Heartbeat")
+
+
+class Heartbeat:
+    """
+    Tracks the liveness of SimNodes. Each SimNode pings the main app every interval over a dedicated heartbeat socket.
+    Pings carry the current SimNodeStatus of a SimNode. A background thread evicts every SimNode which missed
+    max_missed consecutive pings such that request handlers do not have to check the liveness of sockets themselves.
+    """
+
+    def __init__(self, interval: float, max_missed: int, on_evict: Callable[[str], None],
+                 on_ping: Callable[[str, List[bytes]], None]):
+        """
+        :param interval: The time in seconds between two pings of a SimNode.
+        :param max_missed: The number of consecutive pings a SimNode may miss before it is evicted.
+        :param on_evict: Called with the snid of each evicted SimNode.
+        :param on_ping: Called with the snid and the data of each ping of a registered SimNode.
+        """
+        self.interval = interval
+        self.max_missed = max_missed
+        self._on_evict = on_evict
+        self._on_ping = on_ping
+        self._lock = Lock()
+        self._last_pings: Dict[str, float] = {}  # snid --> monotonic time of the last ping
+
+    def register(self, snid: str) -> None:
+        """
+        Starts tracking the given SimNode. Its first ping is expected within max_missed intervals.
+        """
+        from time import monotonic
+        with self._lock:
+            self._last_pings[snid] = monotonic()
+
+    def unregister(self, snid: str) -> bool:
+        """
+        Stops tracking the given SimNode without calling on_evict.
+        :return: Whether the SimNode was tracked.
+        """
+        with self._lock:
+            return self._last_pings.pop(snid, None) is not None
+
+    def is_alive(self, snid: str) -> bool:
+        return snid in self._last_pings
+
+    def ping(self, snid: str) -> bool:
+        """
+        Records a ping of the given SimNode.
+        :return: False iff the SimNode is not tracked (anymore), e.g. because it was evicted already.
+        """
+        from time import monotonic
+        with self._lock:
+            if snid in self._last_pings:
+                self._last_pings[snid] = monotonic()
+                return True
+            else:
+                return False
+
+    def serve(self, snid: str, sock: socket) -> None:
+        """
+        Answers the pings a SimNode sends over its heartbeat socket until the SimNode is evicted or unregistered.
+        """
+        from drivebuildclient import process_request, release_socket
+        from drivebuildclient.aiExchangeMessages_pb2 import Void
+
+        def _handle_ping(action: bytes, data: List[bytes]) -> bytes:
+            result = Void()
+            if action == b"ping":
+                if self.ping(snid):
+                    self._on_ping(snid, data)
+                    result.message = "pong"
+                else:
+                    result.message = "The SimNode " + snid + " is not registered."
+            else:
+                result.message = "The action \"" + action.decode() + "\" is unknown."
+            return result.SerializeToString()
+
+        try:
+            while self.is_alive(snid):
+                process_request(sock, _handle_ping)
+        except OSError:
+            _logger.info("The heartbeat socket of " + snid + " was closed.")
+        finally:
+            release_socket(sock)
+
+    def start(self) -> None:
+        """
+        Starts the background thread evicting SimNodes which missed too many pings.
+        """
+        monitor_thread = Thread(target=self._monitor)
+        monitor_thread.daemon = True
+        monitor_thread.start()
+
+    def _monitor(self) -> None:
+        from time import monotonic, sleep
+        while True:
+            sleep(self.interval)
+            deadline = monotonic() - self.interval * self.max_missed
+            with self._lock:
+                dead_snids = [snid for snid, last_ping in self._last_pings.items() if last_ping < deadline]
+                for snid in dead_snids:
+                    del self._last_pings[snid]
+            for snid in dead_snids:
+                _logger.warning("Evicting " + snid + " since it missed " + str(self.max_missed) + " heartbeats.")
+                try:
+                    self._on_evict(snid)
+                except Exception:
+                    _logger.exception("Evicting " + snid + " failed.")
@@ -0,0 +1,119 @@
+from logging import getLogger
+from typing import Dict, List, Optional
+
+from drivebuildclient.aiExchangeMessages_pb2 import SubmissionResult
+
+_logger = getLogger("DriveBuild.MainApp.Planner")
+NAMESPACE = "{http://drivebuild.com}"
+
+
+def _get_root_tag(content: bytes) -> Optional[str]:
+    """
+    :return: The tag name (without namespace) of the root element or None if the content is no XML.
+    """
+    from xml.etree.ElementTree import fromstring, ParseError
+    try:
+        root = fromstring(content)
+    except ParseError:
+        return None
+    return root.tag[len(NAMESPACE):] if root.tag.startswith(NAMESPACE) else root.tag
+
+
+def _get_needed_environment(content: bytes) -> Optional[str]:
+    """
+    :return: The filename of the environment a criteria definition declares or None if there is none.
+    """
+    from xml.etree.ElementTree import fromstring
+    element = fromstring(content).find(NAMESPACE + "environment")
+    return element.text.strip() if element is not None and element.text else None
+
+
+def _read_files(zip_content: bytes) -> Optional[Dict[str, bytes]]:
+    """
+    :return: The contents of the files at the top level of the given zip file or None if it is no zip file.
+    """
+    from io import BytesIO
+    from zipfile import ZipFile, BadZipFile
+    try:
+        with ZipFile(BytesIO(zip_content), "r") as zip_file:
+            # NOTE SimNodes only consider files at the top level
+            return {info.filename: zip_file.read(info) for info in zip_file.infolist()
+                    if not info.is_dir() and "/" not in info.filename}
+    except BadZipFile:
+        return None
+
+
+def environment_hash(zip_content: bytes) -> Optional[str]:
+    """
+    :return: The SHA-256 hash of the environment in the given zip file or None if there is not exactly one. SimNodes
+    use the same hash for caching the roads they generated for an environment.
+    """
+    from hashlib import sha256
+    files = _read_files(zip_content)
+    environments = [content for content in files.values() if _get_root_tag(content) == "environment"] if files else []
+    return sha256(environments[0]).hexdigest() if len(environments) == 1 else None
+
+
+def plan_submission(zip_content: bytes) -> List[bytes]:
+    """
+    Splits a submitted zip file into one zip file per test (a criteria definition and the environment it declares) the
+    same way the SimNodes pair them. Thus the tests of a submission can run on different SimNodes in parallel. Files
+    which are neither environments nor criteria definitions are added to every test. Validating the tests is still up
+    to the SimNodes.
+    :return: The zip files containing a single test each or a list only containing the given zip file if it does not
+    contain multiple tests.
+    """
+    from io import BytesIO
+    from zipfile import ZipFile, ZIP_DEFLATED
+    files = _read_files(zip_content)
+    if files is None:
+        return [zip_content]
+    environments: Dict[str, bytes] = {}
+    criteria: Dict[str, bytes] = {}
+    others: Dict[str, bytes] = {}
+    for filename, content in files.items():
+        tag = _get_root_tag(content)
+        if tag == "environment":
+            environments[filename] = content
+        elif tag == "criteria":
+            criteria[filename] = content
+        else:
+            others[filename] = content
+    tests = []
+    for filename, content in criteria.items():
+        needed_environment = _get_needed_environment(content)
+        if needed_environment in environments:
+            tests.append({filename: content, needed_environment: environments[needed_environment]})
+        else:
+            _logger.warning(filename + " needs the environment \"" + str(needed_environment)
+                            + "\" which is not available.")
+    if len(tests) < 2:
+        return [zip_content]
+    test_zips = []
+    for test in tests:
+        test_zip = BytesIO()
+        with ZipFile(test_zip, "w", ZIP_DEFLATED) as zip_file:
+            for filename, content in list(test.items()) + list(others.items()):
+                zip_file.writestr(filename, content)
+        test_zips.append(test_zip.getvalue())
+    return test_zips
+
+
+def merge_submission_results(results: List[SubmissionResult]) -> SubmissionResult:
+    """
+    Combines the results of the parts of a split submission. The merged result lists the simulations of all parts
+    which started simulations. Only if none did it contains the messages of the failed parts.
+    """
+    merged_result = SubmissionResult()
+    messages = []
+    for result in results:
+        if result.HasField("result"):
+            for test_name, sid in result.result.submissions.items():
+                merged_result.result.submissions[test_name].sid = sid.sid
+        elif result.HasField("message"):
+            messages.append(result.message.message)
+    if not merged_result.HasField("result"):
+        merged_result.message.message = "\n".join(sorted(set(messages))) if messages else "There were no tests to run."
+    elif messages:
+        _logger.info("Some tests of a submission were not started: " + "; ".join(messages))
+    return merged_result
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from logging import getLogger
+from socket import socket
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from drivebuildclient.aiExchangeMessages_pb2 import SimulationEvent, SimulationEvents
+
+_logger = getLogger("DriveBuild.MainApp.Running")
+
+
+class RunningTests:
+    """
+    Keeps track of the simulations running on the SimNodes. SimNodes push an event over a dedicated event socket
+    whenever one of their simulations starts or finishes. Since events may get lost if an event socket breaks the
+    registry is periodically reconciled with the simulations each SimNode reports as running.
+    """
+
+    def __init__(self, reconcile_interval: float, fetch_running: Callable[[str], Optional[SimulationEvents]],
+                 get_snids: Callable[[], List[str]], on_finished: Callable[[str], None],
+                 on_event: Callable[[SimulationEvent], None] = lambda event: None):
+        """
+        :param reconcile_interval: The time in seconds between two reconciliations.
+        :param fetch_running: Asks the given SimNode for its running simulations. Returns None if it does not answer.
+        :param get_snids: Returns the snids of all connected SimNodes.
+        :param on_finished: Called with the sid of every simulation which finished.
+        :param on_event: Called with every event a SimNode pushes.
+        """
+        self._reconcile_interval = reconcile_interval
+        self._fetch_running = fetch_running
+        self._get_snids = get_snids
+        self._on_finished = on_finished
+        self._on_event = on_event
+        self._lock = Lock()
+        # sid --> (snid, username, test name, monotonic time of the registration)
+        self._simulations: Dict[str, Tuple[str, str, str, float]] = {}
+        self._counts: Dict[str, int] = {}  # username --> number of running simulations
+        # NOTE Remember finished sids such that delayed snapshots do not resurrect them
+        self._finished: OrderedDict = OrderedDict()
+
+    def _add(self, snid: str, event: SimulationEvent, now: float) -> None:
+        if event.sid.sid not in self._simulations and event.sid.sid not in self._finished:
+            self._simulations[event.sid.sid] = (snid, event.username, event.test_name, now)
+            self._counts[event.username] = self._counts.get(event.username, 0) + 1
+
+    def _remove(self, sid: str) -> bool:
+        simulation = self._simulations.pop(sid, None)
+        if simulation:
+            username = simulation[1]
+            self._counts[username] -= 1
+            if not self._counts[username]:
+                del self._counts[username]
+        return simulation is not None
+
+    def _mark_finished(self, sid: str) -> None:
+        self._finished[sid] = None
+        while len(self._finished) > 10000:
+            self._finished.popitem(last=False)
+
+    def apply(self, snid: str, event: SimulationEvent) -> None:
+        from time import monotonic
+        with self._lock:
+            finished = event.kind != SimulationEvent.Kind.STARTED
+            if finished:
+                self._remove(event.sid.sid)
+                self._mark_finished(event.sid.sid)
+            else:
+                self._add(snid, event, monotonic())
+        self._on_event(event)
+        if finished:
+            # NOTE Also simulations which this worker did not know as running may have routes
+            self._on_finished(event.sid.sid)
+
+    def reconcile(self, snid: str, running: SimulationEvents, requested: float) -> None:
+        """
+        Replaces the simulations of the given SimNode by the given snapshot.
+        :param requested: The monotonic time the snapshot was requested at. Simulations registered later are kept.
+        """
+        from time import monotonic
+        now = monotonic()
+        running_sids = [event.sid.sid for event in running.events]
+        with self._lock:
+            stale_sids = [sid for sid, simulation in self._simulations.items()
+                          if simulation[0] == snid and simulation[3] < requested and sid not in running_sids]
+            for sid in stale_sids:
+                self._remove(sid)
+            for event in running.events:
+                self._add(snid, event, now)
+        if stale_sids:
+            _logger.warning("Missed the end of the simulations " + ", ".join(stale_sids) + " of " + snid + ".")
+        for sid in stale_sids:
+            self._on_finished(sid)
+
+    def remove_sim_node(self, snid: str) -> None:
+        with self._lock:
+            for sid in [sid for sid, simulation in self._simulations.items() if simulation[0] == snid]:
+                self._remove(sid)
+
+    def get_running(self, username: str) -> Dict[str, str]:
+        """
+        :return: The test names and sids of the running simulations of the given user.
+        """
+        with self._lock:
+            return {simulation[2]: sid for sid, simulation in self._simulations.items() if simulation[1] == username}
+
+    def count_running(self) -> Dict[str, int]:
+        """
+        :return: The number of running simulations of each user having at least one.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def serve(self, snid: str, sock: socket) -> None:
+        """
+        Applies the events a SimNode sends over its event socket until the socket breaks.
+        """
+        from drivebuildclient import process_request, release_socket
+        from drivebuildclient.aiExchangeMessages_pb2 import Void
+
+        def _handle_event(action: bytes, data: List[bytes]) -> bytes:
+            result = Void()
+            if action == b"simulationEvent":
+                event = SimulationEvent()
+                event.ParseFromString(data[0])
+                self.apply(snid, event)
+                result.message = "Applied event."
+            else:
+                result.message = "The action \"" + action.decode() + "\" is unknown."
+            return result.SerializeToString()
+
+        try:
+            while snid in self._get_snids():
+                process_request(sock, _handle_event)
+        except OSError:
+            _logger.info("The event socket of " + snid + " was closed.")
+        finally:
+            release_socket(sock)
+
+    def start(self) -> None:
+        """
+        Starts the background thread reconciling the registry.
+        """
+        reconcile_thread = Thread(target=self._run)
+        reconcile_thread.daemon = True
+        reconcile_thread.start()
+
+    def _run(self) -> None:
+        from time import monotonic, sleep
+        while True:
+            sleep(self._reconcile_interval)
+            for snid in self._get_snids():
+                requested = monotonic()
+                try:
+                    running = self._fetch_running(snid)
+                except Exception:
+                    _logger.exception("Fetching the running simulations of " + snid + " failed.")
+                    running = None
+                if running is not None:
+                    self.reconcile(snid, running, requested)
@@ -0,0 +1,194 @@
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from drivebuildclient.aiExchangeMessages_pb2 import SimNodeStatus
+
+_logger = getLogger("DriveBuild.MainApp.Scheduler")
+
+
+class NodeLoad:
+    """
+    The load of a SimNode as the scheduler sees it.
+    """
+
+    def __init__(self, snid: str, status: SimNodeStatus, pending: int):
+        """
+        :param status: The status the SimNode reported with its last heartbeat.
+        :param pending: The number of placements which the SimNode did not report as running yet.
+        """
+        self.snid = snid
+        self.status = status
+        self.pending = pending
+
+    @property
+    def used(self) -> int:
+        return self.status.running + self.pending
+
+    @property
+    def free(self) -> int:
+        return max(0, self.status.slots - self.used)
+
+
+def least_loaded(loads: List[NodeLoad], last_snid: Optional[str]) -> NodeLoad:
+    """
+    Prefers the SimNode with the lowest relative utilization. Ties are broken by the number of warm instances and the
+    recent step throughput.
+    """
+    return min(loads, key=lambda load: (load.used / load.status.slots, -load.status.warm_instances,
+                                        -load.status.steps_per_second))
+
+
+def bin_packing(loads: List[NodeLoad], last_snid: Optional[str]) -> NodeLoad:
+    """
+    Fills up SimNodes one after another such that the remaining SimNodes stay completely free.
+    """
+    return min(loads, key=lambda load: (load.free, -load.status.warm_instances))
+
+
+def spread(loads: List[NodeLoad], last_snid: Optional[str]) -> NodeLoad:
+    """
+    Distributes tests in a round robin fashion over all SimNodes having free slots.
+    """
+    snids = sorted(load.snid for load in loads)
+    next_snid = next((snid for snid in snids if last_snid is None or snid > last_snid), snids[0])
+    return next(load for load in loads if load.snid == next_snid)
+
+
+def hit_rate(hits: int, misses: int) -> Optional[float]:
+    """
+    :return: The fraction of lookups which were hits or None if there were no lookups at all.
+    """
+    return hits / (hits + misses) if hits + misses else None
+
+
+# Policies get the loads of all SimNodes having free slots and the snid of the last placement
+POLICIES: Dict[str, Callable[[List[NodeLoad], Optional[str]], NodeLoad]] = {
+    "least-loaded": least_loaded,
+    "bin-packing": bin_packing,
+    "spread": spread
+}
+
+
+class Scheduler:
+    """
+    Places submissions on SimNodes based on the status the SimNodes report with their heartbeats. Placements are
+    counted as pending until the SimNode answered the submission and reported its next status such that concurrent
+    submissions do not pile up on the same SimNode between two heartbeats. Submissions are preferably moved to
+    SimNodes which already generated their environment.
+    """
+
+    def __init__(self, policy: str, owns: Callable[[str], bool] = lambda snid: True):
+        """
+        :param policy: The name of one of the POLICIES.
+        :param owns: Whether submissions may be placed on the SimNode having the given snid.
+        """
+        if policy not in POLICIES:
+            raise ValueError("The scheduling policy \"" + policy + "\" is unknown. Available policies: "
+                             + ", ".join(POLICIES.keys()))
+        self._policy = POLICIES[policy]
+        self._owns = owns
+        self._lock = Lock()
+        self._statuses: Dict[str, SimNodeStatus] = {}  # snid --> last reported status
+        self._pending: Dict[str, int] = {}  # snid --> number of placements not answered yet
+        self._unreported: Dict[str, int] = {}  # snid --> number of answered placements not reported by a status yet
+        self._last_snid: Optional[str] = None
+
+    def update(self, snid: str, status: SimNodeStatus) -> None:
+        with self._lock:
+            self._statuses[snid] = status
+            self._unreported.pop(snid, None)
+
+    def remove(self, snid: str) -> None:
+        with self._lock:
+            self._statuses.pop(snid, None)
+            self._pending.pop(snid, None)
+            self._unreported.pop(snid, None)
+
+    def get_status(self, snid: str) -> Optional[SimNodeStatus]:
+        """
+        :return: The status the given SimNode reported last or None if it did not report any status yet.
+        """
+        with self._lock:
+            return self._statuses.get(snid)
+
+    def get_loads(self) -> List[NodeLoad]:
+        with self._lock:
+            return self._get_loads()
+
+    def _get_loads(self) -> List[NodeLoad]:
+        return [NodeLoad(snid, status, self._pending.get(snid, 0) + self._unreported.get(snid, 0))
+                for snid, status in self._statuses.items()]
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: The load and the cache statistics each SimNode reported last (snid --> metric --> value).
+        """
+        with self._lock:
+            return {load.snid: {
+                "slots": load.status.slots,
+                "running": load.status.running,
+                "pending": load.pending,
+                "warm_instances": load.status.warm_instances,
+                "steps_per_second": load.status.steps_per_second,
+                "cached_environments": len(load.status.cached_environments),
+                "environment_cache_hits": load.status.environment_cache_hits,
+                "environment_cache_misses": load.status.environment_cache_misses,
+                "environment_cache_hit_rate": hit_rate(load.status.environment_cache_hits,
+                                                       load.status.environment_cache_misses),
+                "snapshot_cache_hits": load.status.snapshot_cache_hits,
+                "snapshot_cache_misses": load.status.snapshot_cache_misses,
+                "snapshot_cache_hit_rate": hit_rate(load.status.snapshot_cache_hits, load.status.snapshot_cache_misses)
+            } for load in self._get_loads()}
+
+    def place(self) -> Optional[str]:
+        """
+        Selects a SimNode for a submission and counts the placement as pending. Every successful call has to be
+        followed by a call of release(...).
+        :return: The snid of the selected SimNode or None if no SimNode has a free slot.
+        """
+        with self._lock:
+            loads = [load for load in self._get_loads() if load.free > 0 and self._owns(load.snid)]
+            if loads:
+                snid = self._policy(loads, self._last_snid).snid
+                self._pending[snid] = self._pending.get(snid, 0) + 1
+                self._last_snid = snid
+                _logger.debug("Placed a submission on " + snid)
+                return snid
+            else:
+                return None
+
+    def prefer(self, snid: str, environment: Optional[str]) -> str:
+        """
+        Moves a placement from the given SimNode to one which already cached the roads of the given environment unless
+        the given SimNode cached them itself. If all SimNodes having the environment cached are saturated the placement
+        stays where the policy put it.
+        :param environment: The hash of the environment of the placed submission (see planner.environment_hash(...)).
+        :return: The snid of the SimNode the placement belongs to.
+        """
+        with self._lock:
+            status = self._statuses.get(snid)
+            if environment is None or status is None or environment in status.cached_environments:
+                return snid
+            loads = [load for load in self._get_loads() if load.free > 0 and self._owns(load.snid)
+                     and environment in load.status.cached_environments]
+            if loads:
+                preferred = self._policy(loads, self._last_snid).snid
+                self._pending[snid] = max(0, self._pending.get(snid, 0) - 1)
+                self._pending[preferred] = self._pending.get(preferred, 0) + 1
+                _logger.debug("Moved a submission from " + snid + " to " + preferred + " which cached its environment")
+                return preferred
+            else:
+                return snid
+
+    def release(self, snid: str, started: bool) -> None:
+        """
+        Marks a placement on the given SimNode as answered.
+        :param started: Whether the SimNode started simulations for the submission. These are counted until the next
+        status of the SimNode reports them.
+        """
+        with self._lock:
+            if self._pending.get(snid, 0) > 0:
+                self._pending[snid] -= 1
+                if started and snid in self._statuses:
+                    self._unreported[snid] = self._unreported.get(snid, 0) + 1
@@ -0,0 +1,86 @@
+from sqlite3 import Connection as SQLiteConnection
+from threading import local
+from typing import Optional
+
+
+class SharedState:
+    """
+    State which all worker processes of the main app on the same machine share. It is stored in a local SQLite database
+    such that each worker can answer any request: The ID each SimNode gets, the SimNode each simulation runs on and the
+    sessions of users. Sockets connected to SimNodes stay owned by the worker that accepted them.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The path of the SQLite database file. Every worker has to use the same path.
+        """
+        self._path = path
+        self._connections = local()  # NOTE SQLite connections must not be shared between threads
+        connection = self._connect()
+        connection.executescript("""
+        CREATE TABLE IF NOT EXISTS sim_node_ids (node_id TEXT NOT NULL PRIMARY KEY, snid TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS routes (sid TEXT NOT NULL PRIMARY KEY, snid TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS sessions (token TEXT NOT NULL PRIMARY KEY, username TEXT NOT NULL,
+                                             expires REAL NOT NULL);
+        """)
+
+    def _connect(self) -> SQLiteConnection:
+        from sqlite3 import connect
+        connection = getattr(self._connections, "connection", None)
+        if connection is None:
+            # NOTE Autocommit mode since every statement is a transaction of its own
+            connection = connect(self._path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.connection = connection
+        return connection
+
+    def get_snid(self, node_id: str) -> str:
+        """
+        :return: The snid of the SimNode having the given node ID. Each worker assigns the same snid to a SimNode.
+        """
+        connection = self._connect()
+        connection.execute("""
+        INSERT OR IGNORE INTO sim_node_ids (node_id, snid)
+        VALUES (?, 'snid_' || (SELECT count(*) FROM sim_node_ids));
+        """, (node_id,))
+        return connection.execute("SELECT snid FROM sim_node_ids WHERE node_id = ?;", (node_id,)).fetchone()[0]
+
+    def add_route(self, sid: str, snid: str) -> None:
+        self._connect().execute("INSERT OR REPLACE INTO routes (sid, snid) VALUES (?, ?);", (sid, snid))
+
+    def get_route(self, sid: str) -> Optional[str]:
+        """
+        :return: The snid of the SimNode running the given simulation or None if it is unknown.
+        """
+        row = self._connect().execute("SELECT snid FROM routes WHERE sid = ?;", (sid,)).fetchone()
+        return row[0] if row else None
+
+    def remove_route(self, sid: str) -> None:
+        self._connect().execute("DELETE FROM routes WHERE sid = ?;", (sid,))
+
+    def add_session(self, token: str, username: str, now: float, ttl: float) -> None:
+        """
+        Adds a session which expires ttl seconds after the UNIX timestamp now. Sessions expired at now are removed.
+        """
+        connection = self._connect()
+        connection.execute("DELETE FROM sessions WHERE expires <= ?;", (now,))
+        connection.execute("INSERT INTO sessions (token, username, expires) VALUES (?, ?, ?);",
+                           (token, username, now + ttl))
+
+    def get_session(self, token: str, now: float) -> Optional[str]:
+        """
+        :return: The username of the given session or None if it is unknown or expired.
+        """
+        row = self._connect().execute("SELECT username FROM sessions WHERE token = ? AND expires > ?;",
+                                      (token, now)).fetchone()
+        return row[0] if row else None
+
+    def remove_session(self, token: str) -> bool:
+        """
+        :return: Whether the given session existed.
+        """
+        return self._connect().execute("DELETE FROM sessions WHERE token = ?;", (token,)).rowcount > 0
+
+    def remove_sessions_of(self, username: str) -> None:
+        self._connect().execute("DELETE FROM sessions WHERE username = ?;", (username,))
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+from drivebuildclient.aiExchangeMessages_pb2 import SimulationEvent, SimStateResponse, TestResult
+
+# The states of simulations which do not change anymore
+TERMINAL_STATES = [SimStateResponse.SimState.Name(state) for state in [
+    SimStateResponse.SimState.FINISHED, SimStateResponse.SimState.CANCELED, SimStateResponse.SimState.TIMEOUT
+]]
+
+
+class TestStatesCache:
+    """
+    A read-through LRU cache of the status and the result of tests as stored in the DBMS. SimNodes push the values
+    they store whenever a simulation starts or finishes, so cached values are replaced by lifecycle events instead of
+    being requested again. Since a test in a terminal state never changes it is cached until it is the least recently
+    used one. Other tests expire after a TTL in case an event got lost.
+    """
+
+    def __init__(self, capacity: int, ttl: float, load: Callable[[str], Optional[Tuple[str, str]]]):
+        """
+        :param capacity: The maximum number of cached tests.
+        :param ttl: The time in seconds the status and the result of a test which is not in a terminal state is cached.
+        :param load: Returns the status and the result of the given sid stored in the DBMS or None if there is none.
+        """
+        self._capacity = capacity
+        self._ttl = ttl
+        self._load = load
+        self._lock = Lock()
+        # sid --> (status, result, monotonic expiration time or None if the test is in a terminal state)
+        self._entries: OrderedDict = OrderedDict()
+        self._num_events = 0
+
+    def _put(self, sid: str, status: Optional[str], result: Optional[str], now: float) -> None:
+        expires = None if status in TERMINAL_STATES else now + self._ttl
+        self._entries[sid] = (status, result, expires)
+        self._entries.move_to_end(sid)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def get(self, sid: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        :return: The status and the result of the given sid or None if the DBMS does not know it.
+        """
+        from time import monotonic
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry and (entry[2] is None or entry[2] > monotonic()):
+                self._entries.move_to_end(sid)
+                return entry[0], entry[1]
+            num_events = self._num_events
+        loaded = self._load(sid)
+        if loaded:
+            with self._lock:
+                # NOTE An event which arrived while loading may be newer than the loaded values
+                if self._num_events == num_events:
+                    self._put(sid, loaded[0], loaded[1], monotonic())
+        return loaded
+
+    def apply(self, event: SimulationEvent) -> None:
+        from time import monotonic
+        with self._lock:
+            self._num_events = self._num_events + 1
+            if event.status == SimStateResponse.SimState.DEFAULT or event.result == TestResult.Result.DEFAULT:
+                # NOTE The SimNode did not send the stored values
+                self._entries.pop(event.sid.sid, None)
+            else:
+                self._put(event.sid.sid, SimStateResponse.SimState.Name(event.status),
+                          TestResult.Result.Name(event.result), monotonic())
+
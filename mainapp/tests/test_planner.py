@@ -0,0 +1,94 @@
+from io import BytesIO
+from typing import Dict
+from unittest import TestCase, main
+from zipfile import ZipFile
+
+from drivebuildclient.aiExchangeMessages_pb2 import SubmissionResult
+
+from planner import environment_hash, merge_submission_results, plan_submission
+
+
+def _environment(name: str) -> bytes:
+    return ("<environment xmlns=\"http://drivebuild.com\"><name>" + name + "</name></environment>").encode()
+
+
+def _criteria(environment: str) -> bytes:
+    return ("<criteria xmlns=\"http://drivebuild.com\"><environment>" + environment + "</environment></criteria>") \
+        .encode()
+
+
+def _zip(files: Dict[str, bytes]) -> bytes:
+    content = BytesIO()
+    with ZipFile(content, "w") as zip_file:
+        for filename, file_content in files.items():
+            zip_file.writestr(filename, file_content)
+    return content.getvalue()
+
+
+def _unzip(content: bytes) -> Dict[str, bytes]:
+    with ZipFile(BytesIO(content), "r") as zip_file:
+        return {filename: zip_file.read(filename) for filename in zip_file.namelist()}
+
+
+class PlanSubmissionTest(TestCase):
+    def test_no_zip_file(self):
+        self.assertEqual([b"no zip"], plan_submission(b"no zip"))
+
+    def test_single_test_is_not_split(self):
+        submission = _zip({"a.dbe.xml": _environment("a"), "a.dbc.xml": _criteria("a.dbe.xml")})
+        self.assertEqual([submission], plan_submission(submission))
+
+    def test_split_per_criteria_definition(self):
+        submission = _zip({
+            "a.dbe.xml": _environment("a"),
+            "b.dbe.xml": _environment("b"),
+            "a1.dbc.xml": _criteria("a.dbe.xml"),
+            "a2.dbc.xml": _criteria("a.dbe.xml"),
+            "b.dbc.xml": _criteria("b.dbe.xml"),
+            "missing.dbc.xml": _criteria("missing.dbe.xml"),
+            "readme.txt": b"shared"
+        })
+        tests = sorted([_unzip(test) for test in plan_submission(submission)], key=lambda test: sorted(test.keys()))
+        self.assertEqual([
+            ["a.dbe.xml", "a1.dbc.xml", "readme.txt"],
+            ["a.dbe.xml", "a2.dbc.xml", "readme.txt"],
+            ["b.dbc.xml", "b.dbe.xml", "readme.txt"]
+        ], [sorted(test.keys()) for test in tests])
+        self.assertEqual(_environment("b"), tests[2]["b.dbe.xml"])
+
+    def test_environment_hash(self):
+        first = environment_hash(_zip({"a.dbe.xml": _environment("a"), "a.dbc.xml": _criteria("a.dbe.xml")}))
+        second = environment_hash(_zip({"x.dbe.xml": _environment("a"), "y.dbc.xml": _criteria("x.dbe.xml")}))
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, environment_hash(_zip({"a.dbe.xml": _environment("b")})))
+
+    def test_environment_hash_of_multiple_environments(self):
+        self.assertIsNone(environment_hash(_zip({"a.dbe.xml": _environment("a"), "b.dbe.xml": _environment("b")})))
+        self.assertIsNone(environment_hash(b"no zip"))
+
+
+class MergeSubmissionResultsTest(TestCase):
+    def test_merge_started_simulations(self):
+        first = SubmissionResult()
+        first.result.submissions["a"].sid = "1"
+        second = SubmissionResult()
+        second.message.message = "invalid"
+        third = SubmissionResult()
+        third.result.submissions["b"].sid = "2"
+        merged = merge_submission_results([first, second, third])
+        self.assertEqual({"a": "1", "b": "2"}, {name: sid.sid for name, sid in merged.result.submissions.items()})
+
+    def test_merge_messages_if_nothing_started(self):
+        first = SubmissionResult()
+        first.message.message = "b"
+        second = SubmissionResult()
+        second.message.message = "a"
+        third = SubmissionResult()
+        third.message.message = "a"
+        self.assertEqual("a\nb", merge_submission_results([first, second, third]).message.message)
+        self.assertEqual("There were no tests to run.", merge_submission_results([]).message.message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from typing import List
+from unittest import TestCase, main
+
+from drivebuildclient.aiExchangeMessages_pb2 import SimulationEvent, SimulationEvents
+
+from running import RunningTests
+
+
+def _event(kind: int, sid: str, username: str = "user") -> SimulationEvent:
+    event = SimulationEvent()
+    event.kind = kind
+    event.sid.sid = sid
+    event.username = username
+    event.test_name = "test " + sid
+    return event
+
+
+class RunningTestsTest(TestCase):
+    def setUp(self):
+        self.finished: List[str] = []
+        self.running = RunningTests(60, lambda snid: None, lambda: ["a"], self.finished.append)
+
+    def test_events(self):
+        self.running.apply("a", _event(SimulationEvent.Kind.STARTED, "1"))
+        self.running.apply("a", _event(SimulationEvent.Kind.STARTED, "2"))
+        self.assertEqual({"user": 2}, self.running.count_running())
+        self.running.apply("a", _event(SimulationEvent.Kind.FINISHED, "1"))
+        self.assertEqual({"test 2": "2"}, self.running.get_running("user"))
+        self.assertEqual(["1"], self.finished)
+
+    def test_finished_unknown_simulation(self):
+        self.running.apply("a", _event(SimulationEvent.Kind.FINISHED, "1"))
+        self.assertEqual(["1"], self.finished)  # NOTE Routes of simulations dispatched by other workers are removed too
+        self.running.apply("a", _event(SimulationEvent.Kind.STARTED, "1"))
+        self.assertEqual({}, self.running.count_running())
+
+    def test_reconcile_finishes_stale_simulations(self):
+        from time import monotonic
+        self.running.apply("a", _event(SimulationEvent.Kind.STARTED, "1"))
+        self.running.apply("a", _event(SimulationEvent.Kind.STARTED, "2"))
+        snapshot = SimulationEvents()
+        snapshot.events.add().CopyFrom(_event(SimulationEvent.Kind.STARTED, "2"))
+        self.running.reconcile("a", snapshot, monotonic())
+        self.assertEqual(["1"], self.finished)
+        self.assertEqual({"test 2": "2"}, self.running.get_running("user"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from typing import List, Optional
+from unittest import TestCase, main
+
+from drivebuildclient.aiExchangeMessages_pb2 import SimNodeStatus
+
+from scheduler import Scheduler
+
+
+def _status(slots: int, running: int = 0, warm_instances: int = 0, cached_environments: Optional[List[str]] = None) \
+        -> SimNodeStatus:
+    status = SimNodeStatus()
+    status.slots = slots
+    status.running = running
+    status.warm_instances = warm_instances
+    status.cached_environments.extend(cached_environments if cached_environments else [])
+    return status
+
+
+class SchedulerTest(TestCase):
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            Scheduler("random")
+
+    def test_no_sim_nodes(self):
+        self.assertIsNone(Scheduler("least-loaded").place())
+
+    def test_least_loaded_prefers_lowest_utilization(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(4, running=3))
+        scheduler.update("b", _status(2, running=1))
+        scheduler.update("c", _status(8, running=2))
+        self.assertEqual("c", scheduler.place())
+
+    def test_least_loaded_breaks_ties_by_warm_instances(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(2))
+        scheduler.update("b", _status(2, warm_instances=1))
+        self.assertEqual("b", scheduler.place())
+
+    def test_pending_placements_are_counted(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(2))
+        scheduler.update("b", _status(2))
+        placed = [scheduler.place() for _ in range(4)]
+        self.assertEqual(2, placed.count("a"))
+        self.assertEqual(2, placed.count("b"))
+        self.assertIsNone(scheduler.place())
+
+    def test_released_placements_count_until_reported(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(1))
+        scheduler.release(scheduler.place(), True)
+        self.assertIsNone(scheduler.place())  # NOTE The SimNode did not report the started simulation yet
+        scheduler.update("a", _status(1, running=1))
+        self.assertIsNone(scheduler.place())
+        scheduler.update("a", _status(1))
+        self.assertEqual("a", scheduler.place())
+
+    def test_failed_placements_free_their_slot(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(1))
+        scheduler.release(scheduler.place(), False)
+        self.assertEqual("a", scheduler.place())
+
+    def test_bin_packing_fills_sim_nodes_one_after_another(self):
+        scheduler = Scheduler("bin-packing")
+        scheduler.update("a", _status(2))
+        scheduler.update("b", _status(4, running=1))
+        self.assertEqual(["a", "a", "b", "b", "b"], [scheduler.place() for _ in range(5)])
+
+    def test_spread_is_round_robin(self):
+        scheduler = Scheduler("spread")
+        for snid in ["c", "a", "b"]:
+            scheduler.update(snid, _status(2))
+        self.assertEqual(["a", "b", "c", "a", "b", "c"], [scheduler.place() for _ in range(6)])
+
+    def test_spread_skips_saturated_sim_nodes(self):
+        scheduler = Scheduler("spread")
+        scheduler.update("a", _status(2))
+        scheduler.update("b", _status(1, running=1))
+        scheduler.update("c", _status(2))
+        self.assertEqual(["a", "c", "a", "c"], [scheduler.place() for _ in range(4)])
+
+    def test_only_owned_sim_nodes(self):
+        scheduler = Scheduler("least-loaded", lambda snid: snid != "a")
+        scheduler.update("a", _status(8))
+        scheduler.update("b", _status(1))
+        self.assertEqual("b", scheduler.place())
+        self.assertIsNone(scheduler.place())
+
+    def test_removed_sim_nodes_are_not_used(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(1))
+        scheduler.remove("a")
+        self.assertIsNone(scheduler.place())
+        self.assertIsNone(scheduler.get_status("a"))
+
+    def test_prefer_moves_to_cached_environment(self):
+        scheduler = Scheduler("spread")
+        scheduler.update("a", _status(1))
+        scheduler.update("b", _status(1, cached_environments=["env"]))
+        snid = scheduler.place()
+        self.assertEqual("a", snid)
+        self.assertEqual("b", scheduler.prefer(snid, "env"))
+        self.assertEqual("a", scheduler.place())  # NOTE The pending placement moved from a to b
+        self.assertIsNone(scheduler.place())
+
+    def test_prefer_keeps_placement_if_cached_sim_nodes_are_saturated(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(1))
+        scheduler.update("b", _status(1, running=1, cached_environments=["env"]))
+        self.assertEqual("a", scheduler.prefer(scheduler.place(), "env"))
+
+    def test_prefer_without_environment(self):
+        scheduler = Scheduler("least-loaded")
+        scheduler.update("a", _status(1))
+        scheduler.update("b", _status(1, cached_environments=["env"]))
+        snid = scheduler.place()
+        self.assertEqual(snid, scheduler.prefer(snid, None))
+
+    def test_metrics(self):
+        scheduler = Scheduler("least-loaded")
+        status = _status(2)
+        status.environment_cache_hits = 3
+        status.environment_cache_misses = 1
+        scheduler.update("a", status)
+        scheduler.place()
+        metrics = scheduler.get_metrics()["a"]
+        self.assertEqual(1, metrics["pending"])
+        self.assertEqual(0.75, metrics["environment_cache_hit_rate"])
+        self.assertIsNone(metrics["snapshot_cache_hit_rate"])
+
+
+if __name__ == "__main__":
+    main()
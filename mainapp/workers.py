@@ -0,0 +1,36 @@
+"""
+Starts WORKERS processes of the main app (see app.cfg). Worker i serves clients at PORT + i and accepts SimNodes at
+SIM_NODE_REGISTER_PORT + i. Every SimNode connects to every worker (see MAIN_APP_WORKERS of the SimNodes) and the
+workers share routes and sessions over STATE_PATH. Therefore clients may use any worker, e.g. behind a load balancer,
+and the relaying of AI requests is distributed over multiple Python interpreters.
+Run from the mainapp directory: python workers.py
+"""
+from logging import getLogger, basicConfig, INFO
+
+_logger = getLogger("DriveBuild.MainApp.Workers")
+
+
+def main() -> None:
+    from flask import Config
+    from os import environ, getcwd
+    from subprocess import Popen
+    from sys import executable
+    basicConfig(format='%(asctime)s: %(levelname)s - %(message)s', level=INFO)
+    config = Config(getcwd())
+    config.from_pyfile("app.cfg")
+    workers = []
+    for worker_id in range(config["WORKERS"]):
+        env = dict(environ)
+        env["DRIVEBUILD_WORKER_ID"] = str(worker_id)
+        workers.append(Popen([executable, "app.py"], env=env))
+        _logger.info("Started worker " + str(worker_id) + " at port " + str(config["PORT"] + worker_id) + ".")
+    try:
+        for worker in workers:
+            worker.wait()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measures the ticks per second of a test with a single AI controlled vehicle when the simulation and the AI only wait
+for each other. Each tick the simulation requests the AI and the AI waits for the request before sending its control
+command. The polling variant reproduces the former protocol which checked the counters every poll interval.
+Run from the simnode directory: python -m benchmarks.ai_rendezvous [--ticks 1000] [--polling-ticks 3] [--poll 5]
+"""
+from argparse import ArgumentParser
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Callable
+
+
+class _PollingRendezvous:
+    """
+    The former rendezvous of _request_ai_for(...) and _wait_for_simulator_request(...) based on counters which both
+    sides poll.
+    """
+
+    def __init__(self, poll_interval: float):
+        self._poll_interval = poll_interval
+        self._lock = Lock()
+        self._num_sim_ready = 0
+        self._num_ai_ready = 0
+
+    def simulation_ready(self) -> None:
+        with self._lock:
+            self._num_sim_ready = self._num_sim_ready + 1
+        while self._num_ai_ready < self._num_sim_ready:
+            sleep(self._poll_interval)
+
+    def ai_ready(self) -> None:
+        with self._lock:
+            self._num_ai_ready = self._num_ai_ready + 1
+        while self._num_sim_ready < self._num_ai_ready:
+            sleep(self._poll_interval)
+
+
+def _run_test(simulation_ready: Callable[[], None], ai_ready: Callable[[], None], num_ticks: int) -> float:
+    """
+    :return: The number of ticks per second.
+    """
+
+    def _run_ai() -> None:
+        for _ in range(num_ticks):
+            ai_ready()
+
+    ai_thread = Thread(target=_run_ai)
+    ai_thread.daemon = True
+    start = perf_counter()
+    ai_thread.start()
+    for _ in range(num_ticks):
+        simulation_ready()
+    ai_thread.join()
+    return num_ticks / (perf_counter() - start)
+
+
+def main() -> None:
+    from rendezvous import Rendezvous
+    parser = ArgumentParser(description="Benchmark of the rendezvous of a simulation and the AI of its vehicle")
+    parser.add_argument("--ticks", type=int, default=1000, help="The number of ticks using condition variables")
+    parser.add_argument("--polling-ticks", type=int, default=3, help="The number of ticks using polling")
+    parser.add_argument("--poll", type=float, default=5, help="The poll interval in seconds of the former protocol")
+    args = parser.parse_args()
+    print("rendezvous".ljust(12) + "ticks".rjust(8) + "ticks/s".rjust(12) + "latency ms".rjust(12))
+    polling = _PollingRendezvous(args.poll)
+    condition = Rendezvous()
+    for name, num_ticks, simulation_ready, ai_ready in [
+        ("polling", args.polling_ticks, polling.simulation_ready, polling.ai_ready),
+        ("condition", args.ticks, condition.simulation_ready, condition.ai_ready)
+    ]:
+        ticks_per_second = _run_test(simulation_ready, ai_ready, num_ticks)
+        print(name.ljust(12) + str(num_ticks).rjust(8) + ("%.1f" % ticks_per_second).rjust(12)
+              + ("%.3f" % (1000 / ticks_per_second)).rjust(12))
+
+
+if __name__ == "__main__":
+    main()
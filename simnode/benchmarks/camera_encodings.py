@@ -0,0 +1,71 @@
+"""
+Measures how many camera frames a single core encodes per second for each supported camera encoding.
+Run from the simnode directory: python -m benchmarks.camera_encodings [--width 800] [--height 600] [--frames 50]
+"""
+from argparse import ArgumentParser
+from time import process_time
+from typing import List, Tuple
+
+from PIL.Image import Image
+
+
+def _generate_frames(width: int, height: int, num_frames: int) -> List[Tuple[Image, Image]]:
+    """
+    Generates pairs of color and depth images having smooth gradients plus sensor noise which roughly resemble the
+    compressibility of rendered frames.
+    """
+    from numpy import linspace, uint8, clip, stack, outer
+    from numpy.random import default_rng
+    from PIL.Image import fromarray
+    rng = default_rng(42)
+    gradient = outer(linspace(0, 1, height), linspace(0, 1, width))
+    frames = []
+    for i in range(num_frames):
+        noise = rng.normal(0, 8, (height, width, 3))
+        shift = (i * 5) % 255
+        color = clip(stack([gradient * 200, gradient[::-1] * 150, gradient * 100], axis=2) + shift + noise, 0, 255)
+        depth = clip(gradient[::-1, ::-1] * 255 + noise[:, :, 0], 0, 255)
+        frames.append((fromarray(color.astype(uint8), "RGB"), fromarray(depth.astype(uint8), "L")))
+    return frames
+
+
+def _measure(frames: List[Tuple[Image, Image]], encoding: str, quality: int, compression_level: int) \
+        -> Tuple[float, float]:
+    """
+    :return: The frames per second a single core encodes and the average size of an encoded frame in bytes.
+    """
+    from util.image import encode_image
+    num_bytes = 0
+    start = process_time()
+    for color, depth in frames:
+        num_bytes += len(encode_image(color, encoding, quality, compression_level))
+        num_bytes += len(encode_image(depth, encoding, quality, compression_level))
+    duration = process_time() - start
+    return len(frames) / duration, num_bytes / len(frames)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark of camera encodings (color and depth channel per frame)")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--frames", type=int, default=50)
+    args = parser.parse_args()
+    frames = _generate_frames(args.width, args.height, args.frames)
+    configurations = [("RAW", 75, 6)] \
+                     + [("JPEG", quality, 6) for quality in [50, 75, 95]] \
+                     + [("PNG", 75, level) for level in [0, 1, 6, 9]]
+    print("Frames of " + str(args.width) + "x" + str(args.height) + " pixels (color + depth)")
+    print("encoding".ljust(20) + "frames/s/core".rjust(15) + "KiB/frame".rjust(15))
+    for encoding, quality, compression_level in configurations:
+        if encoding == "JPEG":
+            name = encoding + " (quality " + str(quality) + ")"
+        elif encoding == "PNG":
+            name = encoding + " (level " + str(compression_level) + ")"
+        else:
+            name = encoding
+        fps, frame_size = _measure(frames, encoding, quality, compression_level)
+        print(name.ljust(20) + ("%.1f" % fps).rjust(15) + ("%.1f" % (frame_size / 1024)).rjust(15))
+
+
+if __name__ == "__main__":
+    main()
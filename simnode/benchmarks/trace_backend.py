@@ -0,0 +1,72 @@
+"""
+Measures how long extracting the speed curve of a vehicle takes if its verification cycles are stored as rows of
+serialized DataResponses (like the table verificationcycles) and if they are stored by the columnar trace backend.
+Every cycle carries the position, the speed and a camera image of the vehicle.
+Run from the simnode directory: python -m benchmarks.trace_backend [--cycles 10000] [--image-size 65536]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import List
+
+
+class _NoDatabase:
+    def run_query(self, *_) -> bool:
+        return True
+
+
+def _create_cycles(num_cycles: int, image_size: int) -> List[tuple]:
+    from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
+    image = bytes(image_size)
+    cycles = []
+    for tick in range(num_cycles):
+        response = DataResponse()
+        response.data["position"].position.x = tick
+        response.data["position"].position.y = -tick
+        response.data["speed"].speed.speed = tick / 10
+        response.data["camera"].camera.color = image
+        cycles.append(("1", "ego", tick, response.SerializeToString(), "2020-01-01 00:00:00", "2020-01-01 00:00:01"))
+    return cycles
+
+
+def main() -> None:
+    from os.path import join
+    from shutil import rmtree
+    from tempfile import mkdtemp
+    from numpy import array
+    from columnar import ColumnarSink, read_channel
+    from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
+    parser = ArgumentParser(description="Benchmark of reading the speed curve of a vehicle from its stored trace")
+    parser.add_argument("--cycles", type=int, default=10000, help="The number of verification cycles")
+    parser.add_argument("--image-size", type=int, default=65536, help="The size of each camera image in bytes")
+    args = parser.parse_args()
+    cycles = _create_cycles(args.cycles, args.image_size)
+    directory = mkdtemp()
+    try:
+        start = perf_counter()
+        ColumnarSink(directory, _NoDatabase()).write(cycles)
+        write_seconds = perf_counter() - start
+
+        start = perf_counter()
+        speeds = []
+        for _, _, _, data, _, _ in cycles:  # NOTE Rows are already in memory, i.e. fetching them is not measured
+            response = DataResponse()
+            response.ParseFromString(data)
+            speeds.append(response.data["speed"].speed.speed)
+        rows_curve = array(speeds)
+        rows_seconds = perf_counter() - start
+
+        start = perf_counter()
+        _, columnar_curve = read_channel(join(directory, "1"), "ego", "speed")
+        columnar_curve = array(columnar_curve[:, 0])
+        columnar_seconds = perf_counter() - start
+        assert (rows_curve == columnar_curve).all()
+    finally:
+        rmtree(directory)
+    print("backend".ljust(12) + "read ms".rjust(12))
+    print("rows".ljust(12) + ("%.2f" % (rows_seconds * 1000)).rjust(12))
+    print("columnar".ljust(12) + ("%.2f" % (columnar_seconds * 1000)).rjust(12))
+    print("Writing " + str(args.cycles) + " cycles with the columnar backend took " + ("%.2f" % write_seconds) + "s.")
+
+
+if __name__ == "__main__":
+    main()
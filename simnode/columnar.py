@@ -0,0 +1,290 @@
+"""
+Stores the verification cycles of each simulation in append-only files instead of the table verificationcycles.
+The trace of a simulation is the directory <trace directory>/<sid> having a directory <vid> per vehicle:
+- cycles.ticks and cycles.values: The tick and the start and end of each verification cycle (int64 seconds since epoch)
+- requests/<rid>.ticks and requests/<rid>.values: The ticks and the values of scalar requests (position, speed,
+  angle, damage and bounding box) as typed little-endian arrays
+- requests/<rid>.index and requests/<rid>.blobs: The serialized DataResponse.Data of all other requests (e.g. cameras
+  and lidar) and an index of (tick, offset, length) int64 triples
+- trace.json: The number of verification cycles and the kind, the dtype, the width and the number of rows of each
+  request
+Since vids and rids stem from criteria definitions they are URL-encoded (including dots) in file names.
+trace.json is replaced only after all files were appended to. Hence its numbers of rows tell which rows were written
+completely even if a SimNode failed in between. The read_* functions ignore any further rows and reopening a trace
+truncates them. The table tracefiles only refers to the directory of each simulation. The read_* functions memory-map
+the files such that offline analyses do not need to decode every verification cycle.
+"""
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from numpy import ndarray
+
+from cycle_writer import TraceSink, VerificationCycle
+from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
+from drivebuildclient.db_handler import DBConnection
+
+_logger = getLogger("DriveBuild.SimNode.Columnar")
+
+# The kind of a DataResponse.Data --> (dtype, function extracting the values of a row)
+_SCALARS: Dict[str, Tuple[str, Callable[[DataResponse.Data], List[Any]]]] = {
+    "position": ("<f8", lambda data: [data.position.x, data.position.y]),
+    "speed": ("<f8", lambda data: [data.speed.speed]),
+    "angle": ("<f8", lambda data: [data.angle.angle]),
+    "damage": ("u1", lambda data: [data.damage.is_damaged]),
+    "bounding_box": ("<f4", lambda data: _unpack_points(data.bounding_box))
+}
+
+
+def _unpack_points(data: DataResponse.Data.BoundingBox) -> List[float]:
+    from numpy import frombuffer
+    return list(frombuffer(data.packed.data, dtype="<f4")) if data.packed.data else list(data.points)
+
+
+def _filename(name: str) -> str:
+    """
+    Escapes a vid or a rid which stems from a criteria definition such that it is a single file name. Dots are escaped
+    as well such that neither "." nor ".." refers to another directory.
+    """
+    from urllib.parse import quote
+    return quote(name, safe="").replace(".", "%2E")
+
+
+def _vehicle_directory(trace_directory: str, vid: str) -> str:
+    from os.path import join
+    return join(trace_directory, _filename(vid))
+
+
+def _to_epoch(time: str) -> int:
+    from datetime import datetime
+    return int(datetime.strptime(time, "%Y-%m-%d %H:%M:%S").timestamp())
+
+
+class ColumnarSink(TraceSink):
+    """
+    Appends verification cycles to the trace files of their simulations and registers the directory of each
+    simulation in the table tracefiles.
+    """
+
+    def __init__(self, directory: str, db_connection: DBConnection):
+        self._directory = directory
+        self._db_connection = db_connection
+        self._lock = Lock()
+        self._traces: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (sid, vid) --> content of trace.json
+
+    def write(self, cycles: List[VerificationCycle]) -> bool:
+        from copy import deepcopy
+        from os.path import join
+        # (sid, vid) --> file name --> (dtype, rows) such that each file is opened only once per batch
+        columns: Dict[Tuple[str, str], Dict[str, Tuple[str, List[Any]]]] = {}
+        blobs: Dict[Tuple[str, str], Dict[str, List[Tuple[int, bytes]]]] = {}  # (sid, vid) --> rid --> (tick, blob)
+        traces: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (sid, vid) --> content of trace.json after this batch
+        with self._lock:
+            for sid, vid, tick, data, started, finished in cycles:
+                if (sid, vid) not in traces:
+                    if (sid, vid) not in self._traces:
+                        self._traces[(sid, vid)] = self._open_vehicle(sid, vid)
+                    traces[(sid, vid)] = deepcopy(self._traces[(sid, vid)])
+                self._add_cycle(traces[(sid, vid)], columns.setdefault((sid, vid), {}),
+                                blobs.setdefault((sid, vid), {}), sid, vid, tick, data, started, finished)
+            # NOTE A batch is stored completely or not at all such that retrying its cycles does not duplicate rows
+            committed = []  # The vehicles whose trace.json counts the rows of this batch already
+            try:
+                for (sid, vid), trace in traces.items():
+                    vehicle_directory = _vehicle_directory(join(self._directory, sid), vid)
+                    for filename, (dtype, rows) in columns[(sid, vid)].items():
+                        self._append_column(join(vehicle_directory, filename), dtype, rows)
+                    for rid, rows in blobs[(sid, vid)].items():
+                        self._append_blobs(join(vehicle_directory, "requests", _filename(rid)), rows)
+                for (sid, vid), trace in traces.items():
+                    self._write_trace(_vehicle_directory(join(self._directory, sid), vid), trace)
+                    committed.append((sid, vid))
+            except Exception:
+                self._roll_back(traces.keys(), committed)
+                raise
+            self._traces.update(traces)
+        return True
+
+    def _roll_back(self, vehicles: Iterable[Tuple[str, str]], committed: List[Tuple[str, str]]) -> None:
+        """
+        Restores the trace.json of the given committed vehicles and forgets all given vehicles. Reopening their traces
+        truncates the rows appended after their trace.json was written.
+        """
+        from os.path import join
+        for sid, vid in vehicles:
+            previous = self._traces.pop((sid, vid))
+            if (sid, vid) in committed:
+                self._write_trace(_vehicle_directory(join(self._directory, sid), vid), previous)
+
+    def close(self, sid: str) -> None:
+        with self._lock:
+            for key in [key for key in self._traces.keys() if key[0] == sid]:
+                del self._traces[key]
+
+    @staticmethod
+    def _add_cycle(trace: Dict[str, Any], vehicle_columns: Dict[str, Tuple[str, List[Any]]],
+                   vehicle_blobs: Dict[str, List[Tuple[int, bytes]]], sid: str, vid: str, tick: int, data: bytes,
+                   started: str, finished: str) -> None:
+        """
+        Adds the rows of the given verification cycle to the columns and blobs to append and counts them in the trace.
+        """
+        from os.path import join
+        channels = trace["channels"]
+        trace["cycles"] = trace["cycles"] + 1
+        vehicle_columns.setdefault("cycles.ticks", ("<i8", []))[1].append(tick)
+        vehicle_columns.setdefault("cycles.values", ("<i8", []))[1].append([_to_epoch(started), _to_epoch(finished)])
+        response = DataResponse()
+        response.ParseFromString(data)
+        for rid, request_data in response.data.items():
+            kind = request_data.WhichOneof("data")
+            if kind is None or kind == "error":
+                continue
+            if kind in _SCALARS:
+                dtype, extract = _SCALARS[kind]
+                values = extract(request_data)
+                channel = channels.setdefault(rid, {"kind": kind, "dtype": dtype, "width": len(values), "rows": 0})
+                if channel["width"] != len(values):
+                    _logger.warning("Skipped a value of " + rid + " at tick " + str(tick) + " of " + sid + ":" + vid
+                                    + " since its width differs from previous values.")
+                    continue
+                vehicle_columns.setdefault(join("requests", _filename(rid) + ".ticks"), ("<i8", []))[1].append(tick)
+                vehicle_columns.setdefault(join("requests", _filename(rid) + ".values"), (dtype, []))[1].append(values)
+            else:
+                channel = channels.setdefault(rid, {"kind": kind, "dtype": None, "width": None, "rows": 0})
+                vehicle_blobs.setdefault(rid, []).append((tick, request_data.SerializeToString()))
+            channel["rows"] = channel["rows"] + 1
+
+    def _open_vehicle(self, sid: str, vid: str) -> Dict[str, Any]:
+        """
+        Creates the trace directory of the given vehicle and registers the trace of its simulation. Rows of a trace
+        which exists already but which are not counted in its trace.json are truncated.
+        :return: The content of the trace.json of the vehicle.
+        """
+        from os import makedirs
+        from os.path import abspath, exists, join
+        vehicle_directory = _vehicle_directory(join(self._directory, sid), vid)
+        makedirs(join(vehicle_directory, "requests"), exist_ok=True)
+        self._db_connection.run_query("""
+        INSERT INTO tracefiles VALUES (:sid, :path) ON CONFLICT DO NOTHING;
+        """, {"sid": sid, "path": abspath(join(self._directory, sid))})
+        if not exists(join(vehicle_directory, "trace.json")):
+            return {"cycles": 0, "channels": {}}
+        trace = _read_trace(join(self._directory, sid), vid)
+        for filename, row_size, num_rows in _list_files(trace):
+            path = join(vehicle_directory, filename)
+            if exists(path):
+                with open(path, "r+b") as column_file:
+                    column_file.truncate(row_size * num_rows)
+        return trace
+
+    @staticmethod
+    def _append_column(path: str, dtype: str, rows: List[Any]) -> None:
+        from numpy import asarray
+        with open(path, "ab") as column_file:
+            column_file.write(asarray(rows, dtype=dtype).tobytes())
+
+    @staticmethod
+    def _append_blobs(path: str, rows: List[Tuple[int, bytes]]) -> None:
+        from numpy import asarray
+        index = []
+        with open(path + ".blobs", "ab") as blobs_file:
+            offset = blobs_file.tell()
+            for tick, blob in rows:
+                blobs_file.write(blob)
+                index.append((tick, offset, len(blob)))
+                offset = offset + len(blob)
+        with open(path + ".index", "ab") as index_file:
+            index_file.write(asarray(index, dtype="<i8").tobytes())
+
+    @staticmethod
+    def _write_trace(vehicle_directory: str, trace: Dict[str, Any]) -> None:
+        from json import dump
+        from os import replace
+        from os.path import join
+        trace_path = join(vehicle_directory, "trace.json")
+        with open(trace_path + ".tmp", "w") as trace_file:
+            dump(trace, trace_file)
+        replace(trace_path + ".tmp", trace_path)
+
+
+def _list_files(trace: Dict[str, Any]) -> List[Tuple[str, int, int]]:
+    """
+    :return: The name, the size of a row and the number of complete rows of every file of a trace except the blobs.
+    """
+    from os.path import join
+    from numpy import dtype
+    files = [("cycles.ticks", 8, trace["cycles"]), ("cycles.values", 16, trace["cycles"])]
+    for rid, channel in trace["channels"].items():
+        if channel["kind"] in _SCALARS:
+            files.append((join("requests", _filename(rid) + ".ticks"), 8, channel["rows"]))
+            row_size = dtype(channel["dtype"]).itemsize * channel["width"]
+            files.append((join("requests", _filename(rid) + ".values"), row_size, channel["rows"]))
+        else:
+            files.append((join("requests", _filename(rid) + ".index"), 24, channel["rows"]))
+    return files
+
+
+def _read_trace(trace_directory: str, vid: str) -> Dict[str, Any]:
+    from json import load
+    from os.path import join
+    with open(join(_vehicle_directory(trace_directory, vid), "trace.json"), "r") as trace_file:
+        return load(trace_file)
+
+
+def _memmap(path: str, dtype: str, width: int, num_rows: int) -> ndarray:
+    """
+    Memory-maps the first num_rows rows of the given file. Further rows were not written completely.
+    """
+    from numpy import memmap, zeros
+    if num_rows == 0:
+        return zeros((0, width), dtype=dtype)
+    return memmap(path, dtype=dtype, mode="r", shape=(num_rows, width))
+
+
+def read_channels(trace_directory: str, vid: str) -> Dict[str, Dict[str, Any]]:
+    """
+    :param trace_directory: The directory of the trace of a simulation (See the table tracefiles).
+    :return: The kind, the dtype, the width and the number of rows of each request of the given vehicle
+    (rid --> channel).
+    """
+    return _read_trace(trace_directory, vid)["channels"]
+
+
+def read_cycles(trace_directory: str, vid: str) -> Tuple[ndarray, ndarray]:
+    """
+    :return: The ticks of the verification cycles of the given vehicle and their start and end (n x 2).
+    """
+    from os.path import join
+    num_cycles = _read_trace(trace_directory, vid)["cycles"]
+    return _memmap(join(_vehicle_directory(trace_directory, vid), "cycles.ticks"), "<i8", 1, num_cycles)[:, 0], \
+        _memmap(join(_vehicle_directory(trace_directory, vid), "cycles.values"), "<i8", 2, num_cycles)
+
+
+def read_channel(trace_directory: str, vid: str, rid: str) -> Tuple[ndarray, ndarray]:
+    """
+    Memory-maps a scalar request like the speed without reading or decoding the whole trace.
+    :return: The ticks (n) and the values (n x width) of the given request.
+    """
+    from os.path import join
+    channel = read_channels(trace_directory, vid)[rid]
+    if channel["kind"] not in _SCALARS:
+        raise ValueError("The request " + rid + " is no scalar request. Use read_blobs(...) instead.")
+    path = join(_vehicle_directory(trace_directory, vid), "requests", _filename(rid))
+    return _memmap(path + ".ticks", "<i8", 1, channel["rows"])[:, 0], \
+        _memmap(path + ".values", channel["dtype"], channel["width"], channel["rows"])
+
+
+def read_blobs(trace_directory: str, vid: str, rid: str) -> Iterator[Tuple[int, DataResponse.Data]]:
+    """
+    :return: The ticks and the data of the given non scalar request like a camera.
+    """
+    from numpy import memmap
+    from os.path import join
+    path = join(_vehicle_directory(trace_directory, vid), "requests", _filename(rid))
+    index = _memmap(path + ".index", "<i8", 3, read_channels(trace_directory, vid)[rid]["rows"])
+    if len(index):
+        blobs = memmap(path + ".blobs", dtype="u1", mode="r")
+        for tick, offset, length in index:
+            data = DataResponse.Data()
+            data.ParseFromString(blobs[offset:offset + length].tobytes())
+            yield int(tick), data
@@ -1,6 +1,7 @@
 # Main application (address for clients)
 MAIN_APP_HOST = "localhost"
 MAIN_APP_PORT = 5001
+MAIN_APP_WORKERS = 1  # The number of workers of the main app (Worker i listens at MAIN_APP_PORT + i)
 
 # DBMS
 DBMS_HOST = "localhost"
@@ -10,9 +11,33 @@ DBMS_USERNAME = "drivebuild"
 DBMS_PASSWORD = "drivebuild"
 
 # SimNode (address for communication of node to itself)
+# NOTE Multiple SimNodes may run on the same host if they use distinct ports
+NODE_ID = ""  # Identifies this SimNode at the main app (Empty to use "<hostname>:<SIM_NODE_PORT>")
 SIM_NODE_PORT = 5002
 FIRST_SIM_PORT = 40000
 TIMEOUT = 600  # In seconds
+MAX_SIMULATIONS = 2  # The number of simulations the main app places on this SimNode simultaneously
+ROAD_CACHE_SIZE = 32  # The number of environments whose generated roads are kept for further tests
+FINISHED_SIMULATION_TTL = 60  # The time in seconds a finished simulation is kept before only a tombstone remains
+MAX_TOMBSTONES = 10000  # The number of evicted simulations whose final status and result are remembered
+TOMBSTONE_TTL = 86400  # The time in seconds the final status and result of an evicted simulation are remembered
+CYCLE_WRITER_QUEUE_SIZE = 10000  # The number of verification cycles which may wait for being stored
+CYCLE_WRITER_BATCH_SIZE = 500  # The maximum number of verification cycles stored by a single INSERT
+CYCLE_WRITER_FLUSH_INTERVAL = 1  # The maximum time in seconds a verification cycle waits for its batch to fill up
+CYCLE_WRITER_POLICY = "spill"  # What happens to verification cycles if the queue is full ("block", "drop" or "spill")
+CYCLE_WRITER_SPILL_PATH = "verificationcycles.spill"  # The file the policy "spill" appends verification cycles to
+# The maximum time in seconds stopping a simulation waits for its verification cycles to be stored
+CYCLE_WRITER_STOP_TIMEOUT = 10
+TRACE_BACKEND = "database"  # Where to store verification cycles ("database" or "columnar")
+TRACE_DIRECTORY = "traces"  # The directory of the per simulation trace files of the backend "columnar"
+# Also fill the deprecated repeated point fields of lidar, bounding box and road edges for clients not knowing
+# PackedPoints yet (Slow for large point clouds; will be removed)
+FILL_DEPRECATED_POINTS = True
+
+# SimNode (address for AIs connecting directly)
+DATA_HOST = ""  # The host AIs connect to (Empty if AIs can reach the SimNode at the address the main app sees)
+DATA_PORT = 5003  # 0 disables direct connections
+DIRECT_ENDPOINT_SECRET = "DriveBuild forever"  # Has to match the secret of the main app
 
 # BeamNG
 BEAMNG_INSTALL_FOLDER = "G:\\gitrepos\\beamng-research_unlimited\\trunk"
@@ -0,0 +1,237 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from logging import getLogger
+from threading import Condition, Event, Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+from drivebuildclient.db_handler import DBConnection
+
+_logger = getLogger("DriveBuild.SimNode.CycleWriter")
+
+VerificationCycle = Tuple[str, str, int, bytes, str, str]  # sid, vid, tick, data, started, finished
+
+
+class BackpressurePolicy(Enum):
+    BLOCK = "block"  # The simulation waits until the queue has room again
+    DROP = "drop"  # The verification cycle is discarded
+    SPILL = "spill"  # The verification cycle is appended to a file and written once the queue is empty
+
+
+class TraceSink(ABC):
+    """
+    The storage verification cycles are written to.
+    """
+
+    @abstractmethod
+    def write(self, cycles: List[VerificationCycle]) -> bool:
+        """
+        :return: False only if storing the given verification cycles failed.
+        """
+        pass
+
+    def close(self, sid: str) -> None:
+        """
+        Releases everything the sink keeps about the given simulation once all of its verification cycles were written.
+        """
+        pass
+
+
+class DatabaseSink(TraceSink):
+    """
+    Stores verification cycles in the table verificationcycles using multi-row INSERTs.
+    """
+
+    _COLUMNS = ["sid", "vid", "tick", "data", "started", "finished"]
+
+    def __init__(self, db_connection: DBConnection):
+        self._db_connection = db_connection
+
+    def write(self, cycles: List[VerificationCycle]) -> bool:
+        values = []
+        args = {}
+        for i, cycle in enumerate(cycles):
+            names = [column + "_" + str(i) for column in DatabaseSink._COLUMNS]
+            values.append("(" + ", ".join([":" + name for name in names]) + ")")
+            args.update(zip(names, cycle))
+        return self._db_connection.run_query("INSERT INTO verificationcycles VALUES " + ", ".join(values) + ";",
+                                             args) is not None
+
+
+class VerificationCycleWriter:
+    """
+    Stores verification cycles in a background thread such that simulations do not wait for the storage. Queued
+    verification cycles are passed to the sink in batches of at most batch_size cycles at least every flush_interval
+    seconds. If the queue is full the backpressure policy decides what happens to further verification cycles.
+    """
+
+    def __init__(self, sink: TraceSink, max_queued: int, batch_size: int, flush_interval: float,
+                 policy: BackpressurePolicy, spill_path: str):
+        """
+        :param max_queued: The maximum number of verification cycles waiting to be written.
+        :param batch_size: The maximum number of verification cycles passed to the sink at once.
+        :param flush_interval: The maximum time in seconds a verification cycle waits for its batch to fill up.
+        :param spill_path: The file the policy SPILL appends verification cycles to. It is truncated since its
+        offsets refer to the verification cycles spilled by this writer only.
+        """
+        from os.path import exists, getsize
+        from queue import Queue
+        self._sink = sink
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._policy = policy
+        self._spill_path = spill_path
+        self._queue = Queue(max_queued)
+        self._spill_lock = Lock()
+        self._spill_offset = 0  # The position in the spill file of the first verification cycle not written yet
+        self._num_spilled = 0  # The number of verification cycles in the spill file not written yet
+        self._flush_requested = Event()
+        self._condition = Condition()
+        self._num_put = 0
+        self._num_done = 0  # The number of verification cycles written, dropped or failed
+        self._num_pending: Dict[str, int] = {}  # sid --> number of verification cycles not written, dropped or failed
+        self.num_dropped = 0
+        self.num_failed = 0
+        if exists(spill_path) and getsize(spill_path) > 0:
+            _logger.warning("Discarded the verification cycles a previous SimNode left in " + spill_path + ".")
+        open(spill_path, "wb").close()
+
+    def put(self, cycle: VerificationCycle) -> None:
+        """
+        Queues the given verification cycle. It blocks only if the queue is full and the policy is BLOCK.
+        """
+        from queue import Full
+        with self._condition:
+            self._num_put = self._num_put + 1
+            self._num_pending[cycle[0]] = self._num_pending.get(cycle[0], 0) + 1
+        try:
+            self._queue.put(cycle, self._policy is BackpressurePolicy.BLOCK)
+        except Full:
+            if self._policy is BackpressurePolicy.SPILL:
+                self._spill(cycle)
+            else:
+                self._mark_done([cycle], dropped=True)
+                if self.num_dropped % 1000 == 1:
+                    _logger.warning("Dropped " + str(self.num_dropped) + " verification cycles so far since the queue "
+                                    + "is full.")
+
+    def flush(self, timeout: Optional[float] = None, sid: Optional[str] = None) -> bool:
+        """
+        Waits until all verification cycles queued before calling this method are written (or dropped or failed).
+        :param sid: Only wait for the verification cycles of this simulation instead of the whole backlog.
+        :return: False only if the timeout passed before.
+        """
+        with self._condition:
+            target = self._num_put
+            self._flush_requested.set()
+            if sid is None:
+                return self._condition.wait_for(lambda: self._num_done >= target, timeout)
+            else:
+                return self._condition.wait_for(lambda: sid not in self._num_pending, timeout)
+
+    def close(self, sid: str) -> None:
+        """
+        Releases everything the sink keeps about the given simulation. Verification cycles of it which are written
+        afterwards are still stored.
+        """
+        self._sink.close(sid)
+
+    def start(self) -> None:
+        """
+        Starts the background thread writing the queued verification cycles.
+        """
+        writer_thread = Thread(target=self._run)
+        writer_thread.daemon = True
+        writer_thread.start()
+
+    def _run(self) -> None:
+        while True:
+            cycles = self._collect_batch()
+            if not cycles:
+                cycles = self._read_spilled()
+            if cycles:
+                self._write(cycles)
+            else:
+                self._flush_requested.clear()
+
+    def _collect_batch(self) -> List[VerificationCycle]:
+        """
+        Waits until batch_size verification cycles are queued, the flush interval passed or a flush is requested.
+        """
+        from queue import Empty
+        from time import monotonic
+        cycles = []
+        deadline = monotonic() + self._flush_interval
+        while len(cycles) < self._batch_size:
+            timeout = 0 if self._flush_requested.is_set() else max(deadline - monotonic(), 0)
+            try:
+                cycles.append(self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait())
+            except Empty:
+                break
+        return cycles
+
+    def _write(self, cycles: List[VerificationCycle]) -> None:
+        """
+        Writes the given batch. If that fails every verification cycle is written on its own such that a single
+        invalid one (e.g. violating the primary key) does not discard the whole batch.
+        """
+        if self._write_to_sink(cycles):
+            self._mark_done(cycles)
+        elif len(cycles) == 1:
+            self._mark_done(cycles, failed=True)
+        else:
+            _logger.warning("Storing a batch of " + str(len(cycles)) + " verification cycles failed. Retrying them "
+                            + "one by one.")
+            for cycle in cycles:
+                self._mark_done([cycle], failed=not self._write_to_sink([cycle]))
+
+    def _write_to_sink(self, cycles: List[VerificationCycle]) -> bool:
+        try:
+            written = self._sink.write(cycles)
+        except Exception:
+            _logger.exception("The sink failed to write verification cycles.")
+            written = False
+        if not written and len(cycles) == 1:
+            sid, vid, tick, _, _, _ = cycles[0]
+            _logger.error("Storing the verification cycle of " + sid + ":" + vid + " at tick " + str(tick)
+                          + " failed.")
+        return written
+
+    def _mark_done(self, cycles: List[VerificationCycle], dropped: bool = False, failed: bool = False) -> None:
+        with self._condition:
+            self._num_done = self._num_done + len(cycles)
+            for cycle in cycles:
+                self._num_pending[cycle[0]] = self._num_pending[cycle[0]] - 1
+                if not self._num_pending[cycle[0]]:
+                    del self._num_pending[cycle[0]]
+            if dropped:
+                self.num_dropped = self.num_dropped + len(cycles)
+            if failed:
+                self.num_failed = self.num_failed + len(cycles)
+            self._condition.notify_all()
+
+    def _spill(self, cycle: VerificationCycle) -> None:
+        import pickle
+        with self._spill_lock:
+            with open(self._spill_path, "ab") as spill_file:
+                pickle.dump(cycle, spill_file)
+            self._num_spilled = self._num_spilled + 1
+
+    def _read_spilled(self) -> List[VerificationCycle]:
+        """
+        Reads at most batch_size spilled verification cycles. The spill file is truncated once all of them are read.
+        """
+        import pickle
+        with self._spill_lock:
+            if not self._num_spilled:
+                return []
+            cycles = []
+            with open(self._spill_path, "rb") as spill_file:
+                spill_file.seek(self._spill_offset)
+                while len(cycles) < min(self._batch_size, self._num_spilled):
+                    cycles.append(pickle.load(spill_file))
+                self._spill_offset = spill_file.tell()
+            self._num_spilled = self._num_spilled - len(cycles)
+            if not self._num_spilled:
+                open(self._spill_path, "wb").close()
+                self._spill_offset = 0
+            return cycles
@@ -6,6 +6,8 @@ from beamngpy import Scenario
 from drivebuildclient.aiExchangeMessages_pb2 import TestResult, User, SimulationID
 from lxml.etree import _ElementTree
 
+from dbtypes.recording import TraceRecorder
+
 
 class ExtThread:
     """
@@ -56,3 +58,4 @@ class SimulationData:
     start_time: datetime = None
     end_time: datetime = None
     user: User = None
+    recorder: TraceRecorder = None  # Decides which verification cycles are stored
@@ -6,6 +6,7 @@ from threading import Lock
 from beamngpy import BeamNGpy
 
 from config import BEAMNG_USER_PATH, BEAMNG_INSTALL_FOLDER
+from snapshot import TickSnapshot
 
 _logger = getLogger("DriveBuild.SimNode.DBTypes.BeamNGpy")
 
@@ -24,6 +25,7 @@ class DBBeamNGpy(BeamNGpy):
         Path(user_path).mkdir(parents=True, exist_ok=True)
         super().__init__(host, port, BEAMNG_INSTALL_FOLDER, user_path)
         self.current_tick = 0
+        self.snapshot = TickSnapshot()
         self._sim_lock = Lock()
 
     def step(self, count, wait=True):
@@ -31,6 +33,7 @@ class DBBeamNGpy(BeamNGpy):
         super().step(count, wait)
         self._sim_lock.release()
         self.current_tick += count
+        self.snapshot.advance(self.current_tick)
 
     def poll_sensors(self, vehicle):
         if self.skt:
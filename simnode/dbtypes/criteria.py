@@ -92,9 +92,12 @@ class StateCondition(Criterion, ABC):
         return self.scenario.get_vehicle(self.participant)
 
     def _poll_request_data(self) -> List[Any]:
+        from functools import partial
         request_data = []
+        vehicle = self._get_vehicle()
         for request in self.requests:
-            request_data.append(request.read_sensor_cache_of(self._get_vehicle(), self.scenario))
+            request_data.append(self.scenario.bng.snapshot.get_value(
+                request.snapshot_key(vehicle), partial(request.read_sensor_cache_of, vehicle, self.scenario)))
         return request_data
 
     @static_vars(prefix="criterion_", counter=0)
@@ -455,6 +458,7 @@ CriteriaFunction = Callable[[Scenario], Evaluable]
 @dataclass
 class TestCase:
     from generator import ScenarioBuilder
+    from dbtypes.scheme import RecordingPolicy
     name: str
     scenario: ScenarioBuilder
     precondition_fct: CriteriaFunction
@@ -463,3 +467,4 @@ class TestCase:
     stepsPerSecond: int
     aiFrequency: int
     authors: List[str]
+    recording: RecordingPolicy
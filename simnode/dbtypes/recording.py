@@ -0,0 +1,69 @@
+from threading import Lock
+from typing import Callable, Dict, List
+
+from cycle_writer import VerificationCycle
+from dbtypes.scheme import RecordingPolicy
+
+
+class TraceRecorder:
+    """
+    Decides which verification cycles of a simulation and which of their requests are stored according to the
+    recording policy of its test. With on_failure_only the selected verification cycles are kept in a ring buffer and
+    are only stored when the test finished and failed.
+    """
+    from requests import AiRequest
+
+    def __init__(self, policy: RecordingPolicy):
+        from collections import deque
+        self.policy = policy
+        self._lock = Lock()
+        self._num_cycles = 0
+        self._num_stored_cycles = 0
+        self._buffer = deque(maxlen=policy.buffered_cycles)  # The selected verification cycles of each stored cycle
+
+    def start_cycle(self) -> bool:
+        """
+        Starts the next verification cycle.
+        :return: True only if the data of this verification cycle has to be stored.
+        """
+        with self._lock:
+            self._num_cycles = self._num_cycles + 1
+            if (self._num_cycles - 1) % self.policy.every:
+                return False
+            self._num_stored_cycles = self._num_stored_cycles + 1
+            return True
+
+    def select_requests(self, requests: Dict[str, AiRequest]) -> List[str]:
+        """
+        :param requests: The requests of a vehicle (rid --> request).
+        :return: The IDs of the requests whose data has to be stored in the current verification cycle.
+        """
+        from requests import CameraRequest
+        with_cameras = (self._num_stored_cycles - 1) % self.policy.camera_every == 0
+        return [rid for rid, request in requests.items()
+                if (self.policy.include is None or rid in self.policy.include)
+                and (self.policy.exclude is None or rid not in self.policy.exclude)
+                and (with_cameras or not isinstance(request, CameraRequest))]
+
+    def record(self, cycles: List[VerificationCycle], store: Callable[[VerificationCycle], None]) -> None:
+        """
+        Stores the data of the vehicles in the current verification cycle or buffers it if the policy is
+        on_failure_only.
+        """
+        if self.policy.on_failure_only:
+            with self._lock:
+                self._buffer.append(cycles)
+        else:
+            for cycle in cycles:
+                store(cycle)
+
+    def finish(self, failed: bool, store: Callable[[VerificationCycle], None]) -> None:
+        """
+        Stores the buffered verification cycles if the test failed and drops them otherwise.
+        """
+        with self._lock:
+            buffered = list(self._buffer) if failed else []
+            self._buffer.clear()
+        for cycles in buffered:
+            for cycle in cycles:
+                store(cycle)
@@ -144,6 +144,16 @@ class Road:
     rid: Optional[str] = None
 
 
+@dataclass
+class RecordingPolicy:
+    every: int = 1  # Store only every nth verification cycle
+    include: Optional[List[str]] = None  # The IDs of the requests to store (None means all)
+    exclude: Optional[List[str]] = None  # The IDs of the requests not to store
+    camera_every: int = 1  # Store camera images only with every nth stored verification cycle
+    on_failure_only: bool = False  # Store the last buffered_cycles stored verification cycles only if the test fails
+    buffered_cycles: int = 100
+
+
 @dataclass
 class ScenarioMapping:
     from dataclasses import field
@@ -151,3 +161,4 @@ class ScenarioMapping:
     environment: _ElementTree
     filename: str
     crit_defs: List[_ElementTree] = field(default_factory=list)
+    environment_hash: Optional[str] = None  # The SHA-256 hash of the DBE file
@@ -1,13 +1,59 @@
 from logging import getLogger
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Any
 
 from beamngpy import BeamNGpy
 from drivebuildclient import static_vars
 from lxml.etree import _ElementTree, _Element
 
+from config import ROAD_CACHE_SIZE
+
 _logger = getLogger("DriveBuild.SimNode.Generator")
 
 
+class RoadCache:
+    """
+    An LRU cache of the roads and markings generated for environments. Generating them is expensive and many tests
+    share the same environment. The hits and the misses are reported to the main app with each heartbeat.
+    """
+
+    def __init__(self, capacity: int):
+        from collections import OrderedDict
+        from threading import Lock
+        self._capacity = capacity
+        self._lock = Lock()
+        self._roads: OrderedDict = OrderedDict()  # environment hash --> generated roads
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, environment_hash: Optional[str]) -> Optional[List[Any]]:
+        """
+        :return: The roads generated for the given environment or None if they are not cached.
+        """
+        with self._lock:
+            roads = self._roads.get(environment_hash) if environment_hash else None
+            if roads is None:
+                self.misses = self.misses + 1
+            else:
+                self._roads.move_to_end(environment_hash)
+                self.hits = self.hits + 1
+            return roads
+
+    def put(self, environment_hash: Optional[str], roads: List[Any]) -> None:
+        if environment_hash:
+            with self._lock:
+                self._roads[environment_hash] = roads
+                self._roads.move_to_end(environment_hash)
+                while len(self._roads) > self._capacity:
+                    self._roads.popitem(last=False)
+
+    def get_environment_hashes(self) -> List[str]:
+        with self._lock:
+            return list(self._roads.keys())
+
+
+ROAD_CACHE = RoadCache(ROAD_CACHE_SIZE)
+
+
 class ScenarioBuilder:
     from beamngpy import Scenario
     from dbtypes.scheme import Road, Obstacle, Participant
@@ -20,6 +66,7 @@ class ScenarioBuilder:
         self.obstacles = obstacles
         self.participants = participants
         self.time_of_day = time_of_day
+        self.environment_hash: Optional[str] = None  # The SHA-256 hash of the DBE file defining the roads
 
     @static_vars(line_width=0.15, num_nodes=100, smoothness=0, markings_smoothing=0.13)
     def add_roads_to_scenario(self, scenario: Scenario) -> None:
@@ -29,6 +76,14 @@ class ScenarioBuilder:
         from numpy.ma import arange
         from numpy import repeat, linspace
         from collections import defaultdict
+        from copy import deepcopy
+
+        cached_roads = ROAD_CACHE.get(self.environment_hash)
+        if cached_roads is not None:
+            for cached_road in cached_roads:
+                scenario.add_road(deepcopy(cached_road))
+            return
+        generated_roads = []
 
         @static_vars(rounding_precision=3)
         def _interpolate_nodes(old_x_vals: List[float], old_y_vals: List[float], old_width_vals: List[float],
@@ -66,7 +121,7 @@ class ScenarioBuilder:
                 = _interpolate_nodes(old_x_vals, old_y_vals, old_width_vals, self.add_roads_to_scenario.num_nodes)
             main_nodes = list(zip(new_x_vals, new_y_vals, z_vals, new_width_vals))
             main_road.nodes.extend(main_nodes)
-            scenario.add_road(main_road)
+            generated_roads.append(main_road)
             # FIXME Recognize changing widths --- Basic drawing works for all the roads I have testes so far,
             #  however strong width changes cause stair stepping, this can be countered by a smoothing parameter,
             #  but this itself can introduce low poly lines and inaccuracies. Better post processing or a dynamic
@@ -221,7 +276,7 @@ class ScenarioBuilder:
                                                                        self.add_roads_to_scenario.line_width)
                 if left_side_line_nodes:
                     left_side_line.nodes.extend(left_side_line_nodes)
-                    scenario.add_road(left_side_line)
+                    generated_roads.append(left_side_line)
                 else:
                     _logger.warning("Could not create left side line")
                 right_side_line = Road('line_white', rid=road.rid + "_right_line")
@@ -230,7 +285,7 @@ class ScenarioBuilder:
                                                                         self.add_roads_to_scenario.line_width)
                 if right_side_line_nodes:
                     right_side_line.nodes.extend(right_side_line_nodes)
-                    scenario.add_road(right_side_line)
+                    generated_roads.append(right_side_line)
                 else:
                     _logger.warning("Could not create right side line")
 
@@ -245,7 +300,7 @@ class ScenarioBuilder:
                                                           2 * self.add_roads_to_scenario.line_width)
                     if left_right_divider_nodes:
                         left_right_divider.nodes.extend(left_right_divider_nodes)
-                        scenario.add_road(left_right_divider)
+                        generated_roads.append(left_right_divider)
                     else:
                         _logger.warning("Could not create line separating lanes having different directions")
 
@@ -267,10 +322,15 @@ class ScenarioBuilder:
 
                     if lane_separation_line_nodes:
                         lane_separation_line.nodes.extend(lane_separation_line_nodes)
-                        scenario.add_road(lane_separation_line)
+                        generated_roads.append(lane_separation_line)
                     else:
                         _logger.warning("Could not create line separating lanes having the same direction")
 
+        # NOTE The scenario may modify the roads it gets
+        ROAD_CACHE.put(self.environment_hash, [deepcopy(generated_road) for generated_road in generated_roads])
+        for generated_road in generated_roads:
+            scenario.add_road(generated_road)
+
     def add_obstacles_to_scenario(self, scenario: Scenario) -> None:
         from beamngpy import ProceduralCone, ProceduralCube, ProceduralCylinder, ProceduralBump, StaticObject
         from dbtypes.scheme import Cone, Cube, Cylinder, Bump, Stopsign, TrafficLightSingle, TrafficLightDouble
@@ -383,7 +443,8 @@ def generate_scenario(env: _ElementTree, participants_node: _Element) -> Scenari
         Cylinder, Cone, Bump, Stopsign, TrafficLightSingle, TrafficLightDouble
     from util.xml import xpath, get_tag_name
     from requests import PositionRequest, SpeedRequest, SteeringAngleRequest, CameraRequest, CameraDirection, \
-        LidarRequest, RoadCenterDistanceRequest, CarToLaneAngleRequest, BoundingBoxRequest, RoadEdgesRequest
+        CameraEncoding, LidarRequest, RoadCenterDistanceRequest, CarToLaneAngleRequest, BoundingBoxRequest, \
+        RoadEdgesRequest
 
     roads: List[Road] = list()
 
@@ -501,7 +562,12 @@ def generate_scenario(env: _ElementTree, participants_node: _Element) -> Scenari
                 height = int(req_node.get("height"))
                 fov = int(req_node.get("fov"))
                 direction = CameraDirection[req_node.get("direction")]
-                ai_requests.append(CameraRequest(rid, width, height, fov, direction))
+                channels = req_node.get("channels", "color depth").split()
+                encoding = CameraEncoding[req_node.get("encoding", "PNG")]
+                quality = int(req_node.get("quality", "75"))
+                compression_level = int(req_node.get("compressionLevel", "6"))
+                ai_requests.append(CameraRequest(rid, width, height, fov, direction, channels, encoding, quality,
+                                                 compression_level))
             elif tag == "lidar":
                 radius = int(req_node.get("radius"))
                 ai_requests.append(LidarRequest(rid, radius))
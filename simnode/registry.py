@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from enum import Enum
+from threading import Condition, Lock
+from typing import Dict, List, Optional, Tuple
+
+from beamngpy import Vehicle
+
+from dbtypes import SimulationData
+from sim_controller import Simulation
+
+
+class SimulationState(Enum):
+    REGISTERED = "registered"  # The sid was generated and BeamNG is starting
+    STARTING = "starting"  # BeamNG started and the SimNode sets up serving the simulation
+    RUNNING = "running"
+    STOPPING = "stopping"  # The simulation got its result and BeamNG is closing
+    FINISHED = "finished"
+
+
+class SimulationLifecycle:
+    """
+    The state of a simulation. Callers may wait for state changes instead of polling.
+    """
+
+    def __init__(self):
+        from time import monotonic
+        self._condition = Condition()
+        self._state = SimulationState.REGISTERED
+        self.registered = monotonic()
+
+    @property
+    def state(self) -> SimulationState:
+        return self._state
+
+    def set_state(self, state: SimulationState) -> None:
+        with self._condition:
+            self._state = state
+            self._condition.notify_all()
+
+    def wait_while(self, states: List[SimulationState], timeout: Optional[float] = None) -> SimulationState:
+        """
+        Blocks as long as the simulation is in one of the given states but at most timeout seconds.
+        :return: The state of the simulation.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._state not in states, timeout)
+            return self._state
+
+
+class SimulationRegistry:
+    """
+    Indexes the simulations of a SimNode by their sid such that looking up a simulation, its data or one of its
+    vehicles does not depend on the number of simulations. Insertions and removals are thread safe. Lookups do not
+    lock since they only read a single dict entry. Evicted simulations leave a tombstone of their final status and
+    result which is kept for at most tombstone_ttl seconds and only for the max_tombstones most recent evictions.
+    """
+
+    def __init__(self, max_tombstones: int, tombstone_ttl: float):
+        self._max_tombstones = max_tombstones
+        self._tombstone_ttl = tombstone_ttl
+        self._lock = Lock()
+        self._simulations: Dict[str, Tuple[Simulation, SimulationData]] = {}  # sid --> (simulation, data)
+        self._vehicles: Dict[str, Dict[str, Vehicle]] = {}  # sid --> vid --> vehicle
+        self._lifecycles: Dict[str, SimulationLifecycle] = {}  # sid --> lifecycle
+        # sid --> (SimStateResponse.SimState, TestResult.Result, monotonic time of the eviction)
+        self._tombstones: OrderedDict = OrderedDict()
+
+    def register(self, sid: str) -> SimulationLifecycle:
+        """
+        Starts tracking the lifecycle of the given sid before its simulation is added.
+        """
+        with self._lock:
+            lifecycle = SimulationLifecycle()
+            self._lifecycles[sid] = lifecycle
+            return lifecycle
+
+    def get_lifecycle(self, sid: str) -> Optional[SimulationLifecycle]:
+        """
+        :return: The lifecycle of the given sid or None if it is unknown or evicted.
+        """
+        return self._lifecycles.get(sid)
+
+    def add(self, sim: Simulation, data: SimulationData) -> Optional[Simulation]:
+        """
+        Adds the given simulation as running and replaces any simulation having the same sid.
+        :return: The replaced simulation or None if there was none.
+        """
+        vehicles = {vehicle.vid: vehicle for vehicle in data.scenario.vehicles.keys()}
+        with self._lock:
+            replaced = self._simulations.get(sim.sid.sid)
+            self._tombstones.pop(sim.sid.sid, None)
+            self._vehicles[sim.sid.sid] = vehicles
+            self._simulations[sim.sid.sid] = (sim, data)
+            lifecycle = self._lifecycles.setdefault(sim.sid.sid, SimulationLifecycle())
+        lifecycle.set_state(SimulationState.RUNNING)
+        return replaced[0] if replaced else None
+
+    def evict(self, sid: str, state: int, result: int) -> Optional[Tuple[Simulation, SimulationData]]:
+        """
+        Removes the given simulation and keeps a tombstone of its final state and result.
+        :param state: The final SimStateResponse.SimState of the simulation.
+        :param result: The final TestResult.Result of the simulation.
+        :return: The removed simulation and its data or None if there was no simulation having the given sid.
+        """
+        from time import monotonic
+        now = monotonic()
+        with self._lock:
+            self._vehicles.pop(sid, None)
+            self._lifecycles.pop(sid, None)
+            evicted = self._simulations.pop(sid, None)
+            self._tombstones[sid] = (state, result, now)
+            self._tombstones.move_to_end(sid)
+            self._remove_old_tombstones(now)
+        return evicted
+
+    def remove_abandoned(self, timeout: float) -> List[str]:
+        """
+        Forgets sids which were registered more than timeout seconds ago but never got a simulation, e.g. since
+        starting their simulation failed.
+        :return: The forgotten sids.
+        """
+        from time import monotonic
+        now = monotonic()
+        with self._lock:
+            abandoned = [sid for sid, lifecycle in self._lifecycles.items()
+                         if sid not in self._simulations and lifecycle.registered + timeout < now]
+            for sid in abandoned:
+                self._lifecycles.pop(sid).set_state(SimulationState.FINISHED)
+        return abandoned
+
+    def _remove_old_tombstones(self, now: float) -> None:
+        while self._tombstones and (len(self._tombstones) > self._max_tombstones
+                                    or next(iter(self._tombstones.values()))[2] + self._tombstone_ttl < now):
+            self._tombstones.popitem(last=False)
+
+    def get_tombstone(self, sid: str) -> Optional[Tuple[int, int]]:
+        """
+        :return: The final SimStateResponse.SimState and TestResult.Result of the given evicted simulation or None if
+        it was not evicted or its tombstone expired.
+        """
+        from time import monotonic
+        with self._lock:
+            self._remove_old_tombstones(monotonic())
+            tombstone = self._tombstones.get(sid)
+        return (tombstone[0], tombstone[1]) if tombstone else None
+
+    def contains(self, sid: str) -> bool:
+        return sid in self._simulations
+
+    def get_simulation(self, sid: str) -> Optional[Simulation]:
+        entry = self._simulations.get(sid)
+        return entry[0] if entry else None
+
+    def get_data(self, sid: str) -> Optional[SimulationData]:
+        entry = self._simulations.get(sid)
+        return entry[1] if entry else None
+
+    def get_vehicle(self, sid: str, vid: str) -> Optional[Vehicle]:
+        return self._vehicles.get(sid, {}).get(vid)
+
+    def items(self) -> List[Tuple[Simulation, SimulationData]]:
+        """
+        :return: A snapshot of all simulations and their data.
+        """
+        with self._lock:
+            return list(self._simulations.values())
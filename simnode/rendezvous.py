@@ -0,0 +1,90 @@
+from threading import Condition, Lock
+from typing import Dict, Optional, Set
+
+
+class Rendezvous:
+    """
+    Synchronizes a simulation with the AI controlling one of its vehicles. Each side announces that it is ready and
+    then waits until the other side announced it at least as often, i.e. until both reached the same tick. Waiting
+    sides wake up as soon as the other side arrives or the rendezvous is canceled.
+    """
+
+    def __init__(self, canceled: bool = False):
+        self._condition = Condition()
+        self._num_sim_ready = 0
+        self._num_ai_ready = 0
+        self._canceled = canceled
+
+    def simulation_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Announces that the simulation requests the AI and waits for the AI.
+        :param timeout: The maximum time in seconds to wait or None for waiting until the AI arrives.
+        :return: True only if the AI arrived (False if the timeout passed or the rendezvous was canceled).
+        """
+        with self._condition:
+            self._num_sim_ready = self._num_sim_ready + 1
+            self._condition.notify_all()
+            arrived = self._condition.wait_for(
+                lambda: self._num_ai_ready >= self._num_sim_ready or self._canceled, timeout)
+            return arrived and not self._canceled
+
+    def ai_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Announces that the AI is ready and waits for the simulation to request it.
+        :param timeout: The maximum time in seconds to wait or None for waiting until the simulation arrives.
+        :return: True only if the simulation arrived (False if the timeout passed or the rendezvous was canceled).
+        """
+        with self._condition:
+            self._num_ai_ready = self._num_ai_ready + 1
+            self._condition.notify_all()
+            arrived = self._condition.wait_for(
+                lambda: self._num_sim_ready >= self._num_ai_ready or self._canceled, timeout)
+            return arrived and not self._canceled
+
+    def cancel(self) -> None:
+        """
+        Wakes up all waiting sides. Further calls do not wait anymore.
+        """
+        with self._condition:
+            self._canceled = True
+            self._condition.notify_all()
+
+
+class RendezvousTable:
+    """
+    The rendezvous of all vehicles of all simulations of a SimNode.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._rendezvous: Dict[str, Dict[str, Rendezvous]] = {}  # sid --> vid --> rendezvous
+        self._canceled_sids: Set[str] = set()
+
+    def get(self, sid: str, vid: str) -> Rendezvous:
+        """
+        :return: The rendezvous of the given vehicle. It is created if it does not exist yet.
+        """
+        with self._lock:
+            vehicles = self._rendezvous.setdefault(sid, {})
+            if vid not in vehicles:
+                vehicles[vid] = Rendezvous(sid in self._canceled_sids)
+            return vehicles[vid]
+
+    def cancel(self, sid: str) -> None:
+        """
+        Cancels the rendezvous of all vehicles of the given simulation including the ones requested later.
+        """
+        with self._lock:
+            self._canceled_sids.add(sid)
+            rendezvous = list(self._rendezvous.get(sid, {}).values())
+        for vehicle_rendezvous in rendezvous:
+            vehicle_rendezvous.cancel()
+
+    def remove(self, sid: str) -> None:
+        """
+        Cancels and forgets the rendezvous of all vehicles of the given simulation.
+        """
+        self.cancel(sid)
+        with self._lock:
+            self._rendezvous.pop(sid, None)
+            self._canceled_sids.discard(sid)
@@ -1,7 +1,7 @@
 from abc import ABC
 from enum import Enum
 from logging import getLogger
-from typing import Optional
+from typing import Hashable, Optional
 
 from beamngpy import Scenario
 
@@ -30,6 +30,12 @@ class AiRequest(ABC):
         """
         pass
 
+    def snapshot_key(self, vehicle: Vehicle) -> Hashable:
+        """
+        Identifies the data of this request in a TickSnapshot. Requests having the same key share their data.
+        """
+        return vehicle.vid, self.rid
+
 
 class PositionRequest(AiRequest):
     from beamngpy import Vehicle
@@ -38,6 +44,9 @@ class PositionRequest(AiRequest):
     def add_sensor_to(self, _: Vehicle) -> None:
         pass
 
+    def snapshot_key(self, vehicle: Vehicle) -> Hashable:
+        return vehicle.vid, type(self)
+
     def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Optional[Tuple[float, float]]:
         if vehicle.state:
             x, y, _ = vehicle.state["pos"]
@@ -53,6 +62,9 @@ class BoundingBoxRequest(AiRequest):
     def add_sensor_to(self, vehicle: Vehicle) -> None:
         pass
 
+    def snapshot_key(self, vehicle: Vehicle) -> Hashable:
+        return vehicle.vid, type(self)
+
     def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Polygon:
         from shapely.geometry import Polygon
         bbox_points = vehicle.get_bbox()
@@ -71,6 +83,9 @@ class RoadEdgesRequest(AiRequest):
     def add_sensor_to(self, vehicle: Vehicle) -> None:
         pass
 
+    def snapshot_key(self, _: Vehicle) -> Hashable:
+        return type(self)  # The road edges do not depend on the vehicle
+
     def read_sensor_cache_of(self, vehicle: Vehicle, scenario: Scenario) \
             -> Optional[Dict[str, Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]]]:
         road_edges = {}
@@ -100,6 +115,9 @@ class SteeringAngleRequest(AiRequest):
     def add_sensor_to(self, _: Vehicle) -> None:
         pass
 
+    def snapshot_key(self, vehicle: Vehicle) -> Hashable:
+        return vehicle.vid, type(self)
+
     def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Optional[float]:
         from numpy import arctan2, rad2deg
         if vehicle.state:
@@ -119,6 +137,9 @@ class SpeedRequest(AiRequest):
     def add_sensor_to(self, _: Vehicle) -> None:
         pass
 
+    def snapshot_key(self, vehicle: Vehicle) -> Hashable:
+        return vehicle.vid, type(self)
+
     def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Optional[float]:
         from numpy.linalg import norm
         return norm(vehicle.state["vel"]) if vehicle.state else None
@@ -149,17 +170,37 @@ class CameraDirection(Enum):
     DASH = "DASH"
 
 
+class CameraEncoding(Enum):
+    PNG = "PNG"
+    JPEG = "JPEG"
+    RAW = "RAW"
+
+
 class CameraRequest(AiRequest):
     from beamngpy import Vehicle
-    from typing import Tuple
+    from typing import Dict, Iterable
     from PIL.Image import Image
 
-    def __init__(self, rid: str, width: int, height: int, fov: int, direction: CameraDirection):
+    CHANNELS = ["color", "annotated", "depth"]
+
+    def __init__(self, rid: str, width: int, height: int, fov: int, direction: CameraDirection,
+                 channels: Iterable[str] = ("color", "depth"), encoding: CameraEncoding = CameraEncoding.PNG,
+                 quality: int = 75, compression_level: int = 6):
+        """
+        :param channels: The images to render and to return. A subset of CameraRequest.CHANNELS.
+        :param encoding: The encoding of the returned images.
+        :param quality: The quality of JPEG encoded images (Range 1 to 100).
+        :param compression_level: The zlib compression level of PNG encoded images (Range 0 to 9).
+        """
         super().__init__(rid)
         self.width = width
         self.height = height
         self.fov = fov
         self.direction = direction
+        self.channels = [channel for channel in CameraRequest.CHANNELS if channel in channels]
+        self.encoding = encoding
+        self.quality = quality
+        self.compression_level = compression_level
 
     def add_sensor_to(self, vehicle: Vehicle) -> None:
         from beamngpy.sensors import Camera
@@ -209,14 +250,24 @@ class CameraRequest(AiRequest):
             return
         vehicle.attach_sensor(self.rid,
                               Camera((x_pos, y_pos, z_pos), (x_rot, y_rot, z_rot), self.fov, (self.width, self.height),
-                                     colour=True, depth=True, annotation=False))
+                                     colour="color" in self.channels, depth="depth" in self.channels,
+                                     annotation="annotated" in self.channels))
 
-    def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Tuple[Image, Image, Image]:
+    def read_sensor_cache_of(self, vehicle: Vehicle, _: Scenario) -> Dict[str, Image]:
         """
-        Returns the colored, annotated and the depth image.
+        Returns the requested channels out of the colored, annotated and the depth image.
         """
         data = vehicle.sensor_cache[self.rid]
-        return data["colour"], data["annotation"], data["depth"]
+        sensor_keys = {
+            "color": "colour",
+            "annotated": "annotation",
+            "depth": "depth"
+        }
+        return {channel: data[sensor_keys[channel]] for channel in self.channels}
+
+    def encode(self, image: Image) -> bytes:
+        from util.image import encode_image
+        return encode_image(image, self.encoding.value, self.quality, self.compression_level)
 
 
 class LightRequest(AiRequest):
@@ -41,6 +41,20 @@ class Simulation:
             simulation_sim_node_com_server.daemon = True
             simulation_sim_node_com_server.start()
 
+    def close(self) -> None:
+        """
+        Closes the server of this simulation and its connection to it. Afterwards it does not accept messages anymore.
+        """
+        from socket import SHUT_RDWR
+        for sock in [self._sim_node_client_socket, self._sim_server_socket]:
+            if sock:
+                try:
+                    # NOTE Wakes up the thread accepting connections
+                    sock.shutdown(SHUT_RDWR)
+                except OSError:
+                    pass  # The socket is not connected
+                sock.close()
+
     def send_message_to_sim_node(self, action: bytes, data: List[bytes]) -> bytes:
         from drivebuildclient import send_request, create_client
         from time import sleep
@@ -526,10 +540,7 @@ class Simulation:
 
         runtime_thread = Thread(target=Simulation._run_runtime_verification, args=(self, test_case.aiFrequency))
         runtime_thread.daemon = True
-        runtime_thread.start()
-
-        while not runtime_thread.ident:  # Wait for the Thread to get an ID
-            pass
+        runtime_thread.start()  # NOTE Thread.start() returns only after the thread got its ident
         return bng_scenario, ExtThread(runtime_thread.ident)
 
 
@@ -0,0 +1,100 @@
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+
+class SnapshotStats:
+    """
+    Counts the hits and the misses of all snapshots of a SimNode. They are reported to the main app with each
+    heartbeat.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits = self.hits + 1
+            else:
+                self.misses = self.misses + 1
+
+
+SNAPSHOT_STATS = SnapshotStats()
+
+
+class TickSnapshot:
+    """
+    The data of a simulation at its current tick. Simulations are paused between steps, i.e. polling the sensors of a
+    vehicle and reading a request yield the same data until the next step. Therefore every vehicle is polled and every
+    request is read and serialized at most once per tick no matter whether the criteria, an AI or the storage of
+    verification cycles asks for it.
+    """
+
+    def __init__(self):
+        self._lock = RLock()  # Serializing a request reads its value while holding the lock
+        self._tick = 0
+        self._polled: Set[str] = set()  # The vids of the vehicles polled in the current tick
+        self._values: Dict[Hashable, Any] = {}  # snapshot key --> value of a request
+        self._serialized: Dict[Hashable, Optional[bytes]] = {}  # snapshot key --> serialized DataResponse.Data
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    def advance(self, tick: int) -> None:
+        """
+        Drops all data of previous ticks.
+        """
+        with self._lock:
+            if tick != self._tick:
+                self._tick = tick
+                self._polled.clear()
+                self._values.clear()
+                self._serialized.clear()
+
+    def poll_once(self, vid: str, poll: Callable[[], None]) -> None:
+        """
+        Polls the sensors of the given vehicle unless they were polled in the current tick already. Polling drops the
+        values and serialized forms of the requests of this vehicle read before since they may stem from the sensor
+        data of the previous tick. Data of other vehicles and data not depending on a vehicle is kept.
+        """
+        with self._lock:
+            hit = vid in self._polled
+            SNAPSHOT_STATS.count(hit)
+            if not hit:
+                poll()
+                self._polled.add(vid)
+                for cache in [self._values, self._serialized]:
+                    for key in [key for key in cache.keys() if TickSnapshot._belongs_to(key, vid)]:
+                        del cache[key]
+
+    @staticmethod
+    def _belongs_to(key: Hashable, vid: str) -> bool:
+        return isinstance(key, tuple) and key[0] == vid  # See AiRequest.snapshot_key(...)
+
+    def get_value(self, key: Hashable, read: Callable[[], Any]) -> Any:
+        """
+        :param key: The snapshot key of the request (See AiRequest.snapshot_key(...)).
+        :param read: Reads the value of the request if it is not part of the snapshot yet.
+        """
+        with self._lock:
+            hit = key in self._values
+            SNAPSHOT_STATS.count(hit)
+            if not hit:
+                self._values[key] = read()
+            return self._values[key]
+
+    def get_serialized(self, key: Hashable, serialize: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """
+        :param key: The snapshot key of the request (See AiRequest.snapshot_key(...)).
+        :param serialize: Serializes the value of the request if its serialized form is not part of the snapshot yet.
+        :return: The serialized DataResponse.Data of the request or None if there is no data.
+        """
+        with self._lock:
+            hit = key in self._serialized
+            SNAPSHOT_STATS.count(hit)
+            if not hit:
+                self._serialized[key] = serialize()
+            return self._serialized[key]
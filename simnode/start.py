@@ -1,20 +1,30 @@
 import copyreg
 from datetime import datetime
 from logging import getLogger, basicConfig, INFO
+from queue import Queue
 from socket import socket
 from threading import Thread, Lock
 from typing import Dict, Optional, Tuple, List
 
-from drivebuildclient import accept_at_server, create_server, create_client, process_requests
+from beamngpy import Scenario, Vehicle
+from drivebuildclient import accept_at_server, create_server, create_client, process_requests, send_request, \
+    static_vars
 from drivebuildclient.aiExchangeMessages_pb2 import SimulationID, VehicleIDs, Void, VerificationResult, VehicleID, Num, \
-    TestResult, SubmissionResult, User, SimStateResponse, Control, DataResponse, DataRequest, SimulationNodeID
+    TestResult, SubmissionResult, User, SimStateResponse, Control, DataResponse, DataRequest, SimulationNodeID, \
+    SimNodeStatus, SimulationEvent, SimulationEvents
 from drivebuildclient.db_handler import DBConnection
 from lxml.etree import _Element
 
-from config import SIM_NODE_PORT, MAIN_APP_HOST, MAIN_APP_PORT, DBMS_HOST, DBMS_PORT, DBMS_DBNAME, DBMS_USERNAME, \
-    DBMS_PASSWORD
+from config import SIM_NODE_PORT, MAIN_APP_HOST, MAIN_APP_PORT, MAIN_APP_WORKERS, DBMS_HOST, DBMS_PORT, DBMS_DBNAME, \
+    DBMS_USERNAME, DBMS_PASSWORD, DATA_PORT, MAX_TOMBSTONES, TOMBSTONE_TTL, CYCLE_WRITER_QUEUE_SIZE, \
+    CYCLE_WRITER_BATCH_SIZE, CYCLE_WRITER_FLUSH_INTERVAL, CYCLE_WRITER_POLICY, CYCLE_WRITER_SPILL_PATH, TRACE_BACKEND, \
+    TRACE_DIRECTORY
+from cycle_writer import BackpressurePolicy, DatabaseSink, TraceSink, VerificationCycleWriter
 from dbtypes import SimulationData
 from dbtypes.scheme import MovementMode
+from registry import SimulationRegistry, SimulationState
+from requests import AiRequest
+from rendezvous import RendezvousTable
 from sim_controller import Simulation
 
 _DB_CONNECTION = DBConnection(DBMS_HOST, DBMS_PORT, DBMS_DBNAME, DBMS_USERNAME, DBMS_PASSWORD)
@@ -36,34 +46,50 @@ def element_pickler(element: _Element):
 
 copyreg.pickle(_Element, element_pickler, element_unpickler)
 
+
+def _create_trace_sink() -> TraceSink:
+    if TRACE_BACKEND == "columnar":
+        from columnar import ColumnarSink
+        return ColumnarSink(TRACE_DIRECTORY, _DB_CONNECTION)
+    elif TRACE_BACKEND == "database":
+        return DatabaseSink(_DB_CONNECTION)
+    else:
+        raise ValueError("The trace backend \"" + TRACE_BACKEND + "\" is unknown.")
+
+
 if __name__ == "__main__":
-    _all_tasks: Dict[Simulation, SimulationData] = {}
-    # sid --> (vid --> (numSimReady, numAiReady))
-    _registered_ais: Dict[str, Dict[str, Tuple[int, int]]] = {}
-    _registered_ais_lock = Lock()
+    _simulations = SimulationRegistry(MAX_TOMBSTONES, TOMBSTONE_TTL)
+    _rendezvous = RendezvousTable()  # Synchronizes simulations with the AIs controlling their vehicles
+    _cycle_writer = VerificationCycleWriter(_create_trace_sink(), CYCLE_WRITER_QUEUE_SIZE, CYCLE_WRITER_BATCH_SIZE,
+                                            CYCLE_WRITER_FLUSH_INTERVAL, BackpressurePolicy(CYCLE_WRITER_POLICY),
+                                            CYCLE_WRITER_SPILL_PATH)
+    _cycle_writer.start()
+    _simulation_event_queues: List[Queue] = []  # SimulationEvents to push to each worker of the main app
+    _snids: Dict[int, SimulationNodeID] = {}  # The port of each worker of the main app --> the snid it assigned
     basicConfig(format='%(asctime)s: %(levelname)s - %(message)s', level=INFO)
 
 
     def _get_simulation(sid: SimulationID) -> Optional[Simulation]:
-        for sim, _ in _all_tasks.items():
-            if sim.sid.sid == sid.sid:
-                return sim
-        return None
+        return _simulations.get_simulation(sid.sid)
 
 
     def _get_data(sid: SimulationID) -> Optional[SimulationData]:
-        for sim, data in _all_tasks.items():
-            if sim.sid.sid == sid.sid:
-                return data
-        return None
+        return _simulations.get_data(sid.sid)
 
 
     def _is_simulation_running(sid: SimulationID) -> bool:
-        while True:  # Pseudo "do-while"-loop
-            data = _get_data(sid)
-            if data:
-                break
-        return data.scenario.bng is not None
+        """
+        Waits at most TIMEOUT seconds for a simulation which is still starting. Otherwise it returns immediately.
+        """
+        from config import TIMEOUT
+        lifecycle = _simulations.get_lifecycle(sid.sid)
+        if lifecycle is None:  # Unknown, abandoned or evicted
+            return False
+        state = lifecycle.wait_while([SimulationState.REGISTERED, SimulationState.STARTING], TIMEOUT)
+        if state is not SimulationState.RUNNING:
+            return False
+        data = _get_data(sid)
+        return data is not None and data.scenario.bng is not None
 
 
     # Actions to be requested by the SimNode itself (not a simulation)
@@ -75,6 +101,7 @@ if __name__ == "__main__":
             result = sid_cursor.fetchall()
             sid = SimulationID()
             sid.sid = str(result[0][0])
+            _simulations.register(sid.sid)
             return sid
         else:
             _logger.error("Generation of sid failed.")
@@ -115,11 +142,12 @@ if __name__ == "__main__":
 
 
     def _poll_sensors(sid: SimulationID) -> Void:
-        vehicles = _get_data(sid).scenario.vehicles.keys()
+        from functools import partial
+        scenario = _get_data(sid).scenario
         void = Void()
         if _is_simulation_running(sid):
-            for vehicle in vehicles:
-                _get_data(sid).scenario.bng.poll_sensors(vehicle)
+            for vehicle in scenario.vehicles.keys():
+                scenario.bng.snapshot.poll_once(vehicle.vid, partial(scenario.bng.poll_sensors, vehicle))
             void.message = "Polled all registered sensors of simulation " + sid.sid + "."
         else:
             void.message = "Skipped polling sensors since simulation " + sid.sid + " is not running anymore."
@@ -143,27 +171,11 @@ if __name__ == "__main__":
         return verification
 
 
-    def _init_registered_ais(sid: SimulationID, vid: VehicleID) -> None:
-        if sid.sid not in _registered_ais:
-            _registered_ais[sid.sid] = {}
-        if vid.vid not in _registered_ais[sid.sid]:
-            _registered_ais[sid.sid][vid.vid] = (0, 0)
-
-
     def _request_ai_for(sid: SimulationID, vid: VehicleID) -> Void:
-        from time import sleep
+        from config import TIMEOUT
         _logger.debug("sim_request_ai_for: enter for " + sid.sid + ":" + vid.vid)
-        _registered_ais_lock.acquire()
-        _init_registered_ais(sid, vid)
-        num_sim_ready, num_ai_ready = _registered_ais[sid.sid][vid.vid]
-        _registered_ais[sid.sid][vid.vid] = (num_sim_ready + 1, num_ai_ready)
-        _logger.debug(sid.sid + ":" + vid.vid + " after raf: " + str(_registered_ais[sid.sid][vid.vid]))
-        _registered_ais_lock.release()
-        while _registered_ais[sid.sid][vid.vid][1] < _registered_ais[sid.sid][vid.vid][0] \
-                and _is_simulation_running(sid):
-            _logger.debug(sid.sid + ":" + vid.vid + " wait for ai ready")
-            sleep(5)
-            pass  # Wait for all being ready
+        if _is_simulation_running(sid) and not _rendezvous.get(sid.sid, vid.vid).simulation_ready(TIMEOUT):
+            _logger.info("Stopped waiting for the AI of " + sid.sid + ":" + vid.vid + ".")
         _logger.debug("sim_request_ai_for: leave for " + sid.sid + ":" + vid.vid)
         void = Void()
         void.message = "Simulation " + sid.sid + " finished requesting vehicle " + vid.vid + "."
@@ -171,28 +183,28 @@ if __name__ == "__main__":
 
 
     def _store_verification_cycle(sid: SimulationID, started: datetime, finished: datetime) -> Void:
-        vehicles = _get_data(sid).scenario.vehicles.keys()
+        sim_data = _get_data(sid)
+        scenario = sim_data.scenario
         void = Void()
         if _is_simulation_running(sid):
-            for vehicle in vehicles:
-                vid = VehicleID()
-                vid.vid = vehicle.vid
-                request = DataRequest()
-                request.request_ids.extend(vehicle.requests)
-                data = _request_data(sid, vid, request)
-                args = {
-                    "sid": sid.sid,
-                    "vid": vid.vid,
-                    "tick": _get_data(sid).scenario.bng.current_tick,
-                    "data": data.SerializeToString(),
-                    "started": _time_to_string(started),
-                    "finished": _time_to_string(finished)
-                }
-                _DB_CONNECTION.run_query("""
-                INSERT INTO verificationcycles VALUES
-                (:sid, :vid, :tick, :data, :started, :finished);
-                """, args)
-            void.message = "Stored data of the current runtime verification cycle of simulation " + sid.sid + "."
+            if sim_data.recorder.start_cycle():
+                cycles = []
+                for vehicle in scenario.vehicles.keys():
+                    rids = sim_data.recorder.select_requests(vehicle.requests)
+                    if not rids:  # NOTE Do not store rows without any data
+                        continue
+                    vid = VehicleID()
+                    vid.vid = vehicle.vid
+                    request = DataRequest()
+                    request.request_ids.extend(rids)
+                    data = _request_data(sid, vid, request)
+                    cycles.append((sid.sid, vid.vid, scenario.bng.current_tick, data.SerializeToString(),
+                                   _time_to_string(started), _time_to_string(finished)))
+                sim_data.recorder.record(cycles, _cycle_writer.put)
+                void.message = "Recorded data of the current runtime verification cycle of simulation " + sid.sid + "."
+            else:
+                void.message = "Skipped storing the data of the current runtime verification cycle of simulation " \
+                               + sid.sid + " according to its recording policy."
         else:
             void.message = "Skipped storing the data of the current runtime verification cycle since simulation " \
                            + sid.sid + " does not run anymore."
@@ -245,6 +257,7 @@ if __name__ == "__main__":
                 result = Void()
                 if _is_simulation_running(sid):
                     _get_data(sid).scenario.bng.step(steps.num)
+                    _count_simulated_steps(steps.num)
                     result.message = "Simulated " + str(steps.num) + " steps in simulation " + sid.sid + "."
                 else:
                     result.message = "Simulation " + sid.sid + " is not running anymore."
@@ -266,13 +279,17 @@ if __name__ == "__main__":
 
 
     def _status(sid: SimulationID) -> SimStateResponse:
-        sim = _get_simulation(sid)
+        """
+        Derives the status of a simulation from its lifecycle. Once it is stopping or finished its test result tells
+        how it ended.
+        """
+        data = _get_data(sid)
+        lifecycle = _simulations.get_lifecycle(sid.sid)
         sim_state = SimStateResponse()
-        if sim:
-            scenario = _get_data(sid).scenario
-            if scenario.bng is None:
+        if data and lifecycle:
+            if lifecycle.state in [SimulationState.STOPPING, SimulationState.FINISHED]:
                 # FIXME Detect simulations with enforced result (Manually stopped)
-                task = _get_data(sid).simulation_task
+                task = data.simulation_task
                 if task.get_state() is TestResult.Result.SUCCEEDED \
                         or task.get_state() is TestResult.Result.FAILED:
                     sim_state.state = SimStateResponse.SimState.FINISHED
@@ -285,7 +302,8 @@ if __name__ == "__main__":
             else:
                 sim_state.state = SimStateResponse.SimState.RUNNING
         else:
-            sim_state.state = SimStateResponse.SimState.UNKNOWN
+            tombstone = _simulations.get_tombstone(sid.sid)
+            sim_state.state = tombstone[0] if tombstone else SimStateResponse.SimState.UNKNOWN
         return sim_state
 
 
@@ -296,7 +314,8 @@ if __name__ == "__main__":
             state = data.simulation_task.get_state()
             result.result = state if state else TestResult.Result.UNKNOWN
         else:
-            result.result = TestResult.Result.UNKNOWN
+            tombstone = _simulations.get_tombstone(sid.sid)
+            result.result = tombstone[1] if tombstone else TestResult.Result.UNKNOWN
         return result
 
 
@@ -325,6 +344,24 @@ if __name__ == "__main__":
         """, args)
 
 
+    def _create_simulation_event(kind: int, sim: Simulation, data: SimulationData) -> SimulationEvent:
+        event = SimulationEvent()
+        event.kind = kind
+        event.sid.sid = sim.sid.sid
+        event.test_name = sim.test_name
+        event.username = data.user.username if data.user else ""
+        # NOTE The main app caches these values instead of querying the DBMS (see _update_test_data(...))
+        event.status = _status(sim.sid).state
+        event.result = _result(sim.sid).result
+        return event
+
+
+    def _publish_simulation_event(kind: int, sim: Simulation, data: SimulationData) -> None:
+        event = _create_simulation_event(kind, sim, data)
+        for events in _simulation_event_queues:
+            events.put(event)
+
+
     # Actions to be requested by main application
     def _run_tests(file_content: bytes, user: User) -> SubmissionResult:
         from tc_manager import run_tests
@@ -335,14 +372,17 @@ if __name__ == "__main__":
             if isinstance(new_tasks, Dict):
                 if new_tasks:
                     for sim, data in new_tasks.items():
-                        if sim.sid.sid in [s.sid.sid for s in _all_tasks.keys()]:
+                        if _simulations.contains(sim.sid.sid):
                             warn("The simulation ID " + sim.sid.sid + " already exists and is getting overwritten.")
-                            _all_tasks.pop(_get_simulation(sim.sid))
                         submission_result.result.submissions[sim.test_name].sid = sim.sid.sid
+                        lifecycle = _simulations.get_lifecycle(sim.sid.sid)
+                        if lifecycle:
+                            lifecycle.set_state(SimulationState.STARTING)
                         sim.start_server(_handle_simulation_message)
                         data.user = user
-                        _all_tasks[sim] = data
+                        _simulations.add(sim, data)
                         _update_test_data(data)
+                        _publish_simulation_event(SimulationEvent.Kind.STARTED, sim, data)
                 else:
                     submission_result.message.message = "There were no valid tests to run."
             elif isinstance(new_tasks, str):
@@ -356,17 +396,10 @@ if __name__ == "__main__":
 
 
     def _wait_for_simulator_request(sid: SimulationID, vid: VehicleID) -> SimStateResponse:
-        from time import sleep
+        from config import TIMEOUT
         _logger.info("_wait_for_simulator_request: enter for " + sid.sid + ":" + vid.vid)
-        _registered_ais_lock.acquire()
-        _init_registered_ais(sid, vid)
-        num_sim_ready, num_ai_ready = _registered_ais[sid.sid][vid.vid]
-        _registered_ais[sid.sid][vid.vid] = (num_sim_ready, num_ai_ready + 1)
-        _registered_ais_lock.release()
-        while _registered_ais[sid.sid][vid.vid][0] < _registered_ais[sid.sid][vid.vid][1] \
-                and _is_simulation_running(sid):
-            sleep(5)
-            pass  # Wait all being ready
+        if _is_simulation_running(sid) and not _rendezvous.get(sid.sid, vid.vid).ai_ready(TIMEOUT):
+            _logger.info("Stopped waiting for simulation " + sid.sid + " to request " + vid.vid + ".")
         response = _status(sid)
         _logger.info("_wait_for_simulator_request: leave for " + sid.sid + ":" + vid.vid)
         return response
@@ -379,7 +412,7 @@ if __name__ == "__main__":
         :param steer: The steering angle (Range -1.0 to 1.0) # FIXME Negative/Positive left/right?
         :param brake: The brake intensity (Range 0.0 to 1.0)
         """
-        vehicle = _get_data(sid).scenario.get_vehicle(vid.vid)
+        vehicle = _simulations.get_vehicle(sid.sid, vid.vid)
         try:
             vehicle.control(throttle=command.accelerate, steering=command.steer, brake=command.brake, parkingbrake=0)
         except Exception:
@@ -397,7 +430,11 @@ if __name__ == "__main__":
         simulation.
         """
         from datetime import datetime
+        from config import CYCLE_WRITER_STOP_TIMEOUT
         data = _get_data(sid)
+        if data is None:
+            _logger.info("Ignored controlling simulation " + sid.sid + " since it was evicted already.")
+            return
         task = data.simulation_task
         if direct:
             if command is Control.SimCommand.Command.SUCCEED:
@@ -411,10 +448,51 @@ if __name__ == "__main__":
         else:
             task.set_state(command)
 
+        lifecycle = _simulations.get_lifecycle(sid.sid)
         if _is_simulation_running(sid):
+            lifecycle.set_state(SimulationState.STOPPING)
             data.scenario.bng.close()
         data.end_time = datetime.now()
+        if lifecycle:
+            lifecycle.set_state(SimulationState.FINISHED)
+        _rendezvous.cancel(sid.sid)
+        data.recorder.finish(task.get_state() is TestResult.Result.FAILED, _cycle_writer.put)
+        # NOTE Only wait for the cycles of this simulation such that a backlog of others does not delay stopping it
+        if not _cycle_writer.flush(CYCLE_WRITER_STOP_TIMEOUT, sid.sid):
+            _logger.warning("Not all verification cycles of simulation " + sid.sid + " were stored in time.")
+        _cycle_writer.close(sid.sid)
         _update_test_data(data)
+        _publish_simulation_event(SimulationEvent.Kind.FINISHED, _get_simulation(sid), data)
+
+
+    def _evict_finished_simulations() -> None:
+        """
+        Releases simulations FINISHED_SIMULATION_TTL seconds after they finished. Their final state is stored once more
+        and only a tombstone remains for late requests of their status or result. Sids whose simulation never started
+        are forgotten as well.
+        """
+        from time import sleep
+        from config import FINISHED_SIMULATION_TTL, TIMEOUT
+        while True:
+            sleep(FINISHED_SIMULATION_TTL / 2)
+            for sid in _simulations.remove_abandoned(TIMEOUT + FINISHED_SIMULATION_TTL):
+                _logger.info("Forgot simulation " + sid + " since it never started.")
+            now = datetime.now()
+            for sim, data in _simulations.items():
+                if data.end_time and (now - data.end_time).total_seconds() > FINISHED_SIMULATION_TTL:
+                    try:
+                        _update_test_data(data)
+                    except Exception:
+                        _logger.exception("Storing the final state of simulation " + sim.sid.sid + " failed.")
+                    _simulations.evict(sim.sid.sid, _status(sim.sid).state, _result(sim.sid).result)
+                    _rendezvous.remove(sim.sid.sid)
+                    sim.close()
+                    _logger.info("Evicted simulation " + sim.sid.sid + ".")
+
+
+    sim_node_eviction = Thread(target=_evict_finished_simulations)
+    sim_node_eviction.daemon = True
+    sim_node_eviction.start()
 
 
     def _control(sid: SimulationID, vid: VehicleID, control: Control) -> Void:
@@ -437,63 +515,83 @@ if __name__ == "__main__":
         return result
 
 
-    def _attach_request_data(data: DataResponse.Data, sid: SimulationID, vid: VehicleID, rid: str) -> None:
+    def _serialize_request_data(vehicle: Vehicle, request: AiRequest, scenario: Scenario) -> Optional[bytes]:
+        """
+        :return: The DataResponse.Data of the given request at the current tick or None if there is no data.
+        """
+        from functools import partial
         from requests import PositionRequest, SpeedRequest, SteeringAngleRequest, LidarRequest, CameraRequest, \
             DamageRequest, RoadCenterDistanceRequest, CarToLaneAngleRequest, BoundingBoxRequest, RoadEdgesRequest
-        from PIL import Image
-        from io import BytesIO
-        from shapely.geometry import mapping
-        vehicle = _get_data(sid).scenario.get_vehicle(vid.vid)
+        from config import FILL_DEPRECATED_POINTS
+        from util import fill_deprecated_points, pack_points
+        sensor_data = scenario.bng.snapshot.get_value(request.snapshot_key(vehicle),
+                                                      partial(request.read_sensor_cache_of, vehicle, scenario))
+        if sensor_data is None:
+            return None
+        data = DataResponse.Data()
+        request_type = type(request)
+        if request_type is PositionRequest:
+            data.position.x = sensor_data[0]
+            data.position.y = sensor_data[1]
+        elif request_type is SpeedRequest:
+            data.speed.speed = sensor_data
+        elif request_type is SteeringAngleRequest:
+            data.angle.angle = sensor_data
+        elif request_type is LidarRequest:
+            pack_points(data.lidar.packed, sensor_data, 3)
+            if FILL_DEPRECATED_POINTS:
+                fill_deprecated_points(data.lidar.points, sensor_data)
+        elif request_type is CameraRequest:
+            data.camera.encoding = DataResponse.Data.Camera.Encoding.Value(request.encoding.value)
+            for channel, image in sensor_data.items():
+                if image is not None:
+                    setattr(data.camera, channel, request.encode(image))
+        elif request_type is DamageRequest:
+            data.damage.is_damaged = sensor_data
+        elif request_type is RoadCenterDistanceRequest:
+            data.road_center_distance.road_id = sensor_data[0]
+            data.road_center_distance.distance = sensor_data[1]
+        elif request_type is CarToLaneAngleRequest:
+            data.car_to_lane_angle.lane_id = sensor_data[0]
+            data.car_to_lane_angle.angle = float(sensor_data[1])
+        elif request_type is BoundingBoxRequest:
+            pack_points(data.bounding_box.packed, sensor_data.exterior.coords, 2)
+            if FILL_DEPRECATED_POINTS:
+                fill_deprecated_points(data.bounding_box.points, sensor_data.exterior.coords)
+        elif request_type is RoadEdgesRequest:
+            for road_id, (left_points, right_points) in sensor_data.items():
+                pack_points(data.road_edges.edges[road_id].packed_left, left_points, 2)
+                pack_points(data.road_edges.edges[road_id].packed_right, right_points, 2)
+                if FILL_DEPRECATED_POINTS:
+                    fill_deprecated_points(data.road_edges.edges[road_id].left_points, left_points)
+                    fill_deprecated_points(data.road_edges.edges[road_id].right_points, right_points)
+        # elif request_type is LightRequest:
+        # response = DataResponse.Data.Light()
+        # FIXME Add DataResponse.Data.Light
+        else:
+            raise NotImplementedError(
+                "The conversion from " + str(request_type) + " to DataResponse.Data is not implemented, yet.")
+        return data.SerializeToString()
+
+
+    def _attach_request_data(data: DataResponse.Data, sid: SimulationID, vid: VehicleID, rid: str) -> None:
+        """
+        Serves the data from the snapshot of the current tick such that every request is read and serialized at most
+        once per tick no matter how often the AI, the criteria and the storage of verification cycles ask for it.
+        """
+        from functools import partial
+        vehicle = _simulations.get_vehicle(sid.sid, vid.vid)
         if rid in vehicle.requests:
-            sensor_data = vehicle.poll_request(rid, _get_data(sid).scenario)
-            if sensor_data:
-                request_type = type(vehicle.requests[rid])
-                if request_type is PositionRequest:
-                    data.position.x = sensor_data[0]
-                    data.position.y = sensor_data[1]
-                elif request_type is SpeedRequest:
-                    data.speed.speed = sensor_data
-                elif request_type is SteeringAngleRequest:
-                    data.angle.angle = sensor_data
-                elif request_type is LidarRequest:
-                    data.lidar.points.extend(sensor_data)
-                elif request_type is CameraRequest:
-                    def _convert(image: Image) -> bytes:
-                        bytes_arr = BytesIO()
-                        image.save(bytes_arr, format="PNG")
-                        bytes_arr.seek(0)
-                        return bytes_arr.read()
-
-                    data.camera.color = _convert(sensor_data[0])
-                    data.camera.annotated = _convert(sensor_data[1])
-                    data.camera.depth = _convert(sensor_data[2])
-                elif request_type is DamageRequest:
-                    data.damage.is_damaged = sensor_data
-                elif request_type is RoadCenterDistanceRequest:
-                    data.road_center_distance.road_id = sensor_data[0]
-                    data.road_center_distance.distance = sensor_data[1]
-                elif request_type is CarToLaneAngleRequest:
-                    data.car_to_lane_angle.lane_id = sensor_data[0]
-                    data.car_to_lane_angle.angle = float(sensor_data[1])
-                elif request_type is BoundingBoxRequest:
-                    points = mapping(sensor_data)["coordinates"][0]
-                    for point in points:
-                        data.bounding_box.points.append(point[0])
-                        data.bounding_box.points.append(point[1])
-                elif request_type is RoadEdgesRequest:
-                    for rid, (left_points, right_points) in sensor_data.items():
-                        data.road_edges.edges[rid].left_points.extend([e for p in left_points for e in p])
-                        data.road_edges.edges[rid].right_points.extend([e for p in right_points for e in p])
-                # elif request_type is LightRequest:
-                # response = DataResponse.Data.Light()
-                # FIXME Add DataResponse.Data.Light
-                else:
-                    raise NotImplementedError(
-                        "The conversion from " + str(request_type) + " to DataResponse.Data is not implemented, yet.")
-            else:
+            request = vehicle.requests[rid]
+            scenario = _get_data(sid).scenario
+            serialized = scenario.bng.snapshot.get_serialized(
+                request.snapshot_key(vehicle), partial(_serialize_request_data, vehicle, request, scenario))
+            if serialized is None:
                 _logger.warning("Could not attach data for request \"" + rid
                                 + "\" of vehicle \"" + vid.vid
                                 + "\" in simulation \"" + str(sid.sid) + "\".")
+            else:
+                data.MergeFromString(serialized)
         else:
             raise ValueError("There is no request called \"" + rid + "\".")
 
@@ -513,7 +611,7 @@ if __name__ == "__main__":
 
     def _get_running_tests(user: User) -> SubmissionResult:
         submission_result = SubmissionResult()
-        for sim, data in _all_tasks.items():
+        for sim, data in _simulations.items():
             if _is_simulation_running(sim.sid) and data.user.username == user.username:
                 submission_result.result.submissions[sim.test_name].sid = sim.sid.sid
         if not submission_result.result.submissions:  # Avoid an empty message
@@ -521,7 +619,19 @@ if __name__ == "__main__":
         return submission_result
 
 
-    def _handle_main_app_message(action: bytes, data: List[bytes]) -> bytes:
+    def _get_running_simulations() -> SimulationEvents:
+        running = SimulationEvents()
+        for sim, data in _simulations.items():
+            if data.scenario.bng is not None:
+                running.events.append(_create_simulation_event(SimulationEvent.Kind.STARTED, sim, data))
+        return running
+
+
+    def _handle_main_app_message(action: bytes, data: List[bytes], port: int = MAIN_APP_PORT) -> bytes:
+        """
+        :param port: The port of the worker of the main app which sent the message.
+        """
+        from functools import partial
         from google.protobuf.message import DecodeError
         if action == b"runTests":
             user = User()
@@ -555,8 +665,11 @@ if __name__ == "__main__":
             request.ParseFromString(data[2])
             result = _request_data(sid, vid, request)
         elif action == b"requestSocket":
-            client = create_client(MAIN_APP_HOST, MAIN_APP_PORT)
-            client_thread = Thread(target=process_requests, args=(client, _handle_main_app_message))
+            client = create_client(MAIN_APP_HOST, port)
+            # NOTE Tell the main app which vehicle of which simulation on which SimNode the socket belongs to
+            send_request(client, b"registerVehicleSocket", data[0:2] + [_snids[port].SerializeToString()])
+            client_thread = Thread(target=process_requests,
+                                   args=(client, partial(_handle_main_app_message, port=port)))
             client_thread.daemon = True
             _logger.info("_handle_main_app_message --> " + str(client.getsockname()))
             client_thread.start()
@@ -566,6 +679,8 @@ if __name__ == "__main__":
             user = User()
             user.ParseFromString(data[0])
             result = _get_running_tests(user)
+        elif action == b"runningSimulations":
+            result = _get_running_simulations()
         elif action == b"stop":
             sid = SimulationID()
             sid.ParseFromString(data[0])
@@ -582,14 +697,152 @@ if __name__ == "__main__":
         return result.SerializeToString()
 
 
-    main_app_client = create_client(MAIN_APP_HOST, MAIN_APP_PORT)
-    snid = SimulationNodeID()
-    snid.ParseFromString(main_app_client.recv(1024))  # FIXME Determine appropriate value
-    prefix = snid.snid
-    if not prefix:
-        _logger.error("SimNode was no prefix assigned.")
-        main_app_client.close()
-        exit(1)
-    sim_node_main_app_com = Thread(target=process_requests, args=(main_app_client, _handle_main_app_message))
-    _logger.info("_handle_main_app_message --> " + str(main_app_client.getsockname()))
-    sim_node_main_app_com.start()
+    @static_vars(steps=0, lock=Lock())
+    def _count_simulated_steps(num_steps: int) -> None:
+        with _count_simulated_steps.lock:
+            _count_simulated_steps.steps += num_steps
+
+
+    @static_vars(last_steps={}, last_time={})
+    def _get_status(port: int) -> SimNodeStatus:
+        """
+        Returns the capacity and the load of this SimNode. The step throughput covers the time since the last status
+        for the worker of the main app at the given port.
+        """
+        from time import monotonic
+        from config import MAX_SIMULATIONS, DATA_HOST
+        from dbtypes.beamngpy import DBBeamNGpy
+        from generator import ROAD_CACHE
+        from snapshot import SNAPSHOT_STATS
+        status = SimNodeStatus()
+        status.slots = MAX_SIMULATIONS
+        status.data_host = DATA_HOST
+        status.data_port = DATA_PORT
+        status.running = len([data for _, data in _simulations.items() if data.scenario.bng is not None])
+        status.warm_instances = DBBeamNGpy.user_path_pool.qsize()
+        status.cached_environments.extend(ROAD_CACHE.get_environment_hashes())
+        status.environment_cache_hits = ROAD_CACHE.hits
+        status.environment_cache_misses = ROAD_CACHE.misses
+        status.snapshot_cache_hits = SNAPSHOT_STATS.hits
+        status.snapshot_cache_misses = SNAPSHOT_STATS.misses
+        now = monotonic()
+        steps = _count_simulated_steps.steps
+        last_time = _get_status.last_time.get(port)
+        if last_time is not None and now > last_time:
+            status.steps_per_second = (steps - _get_status.last_steps[port]) / (now - last_time)
+        _get_status.last_steps[port] = steps
+        _get_status.last_time[port] = now
+        return status
+
+
+    # Actions to be requested by AIs connecting directly
+    def _handle_direct_connection(conn: socket, addr: Tuple[str, int]) -> None:
+        """
+        Serves an AI which authenticates with a DirectEndpoint signed by the main app. Afterwards the AI may send the
+        same requests for its vehicle as it would send to the main app.
+        """
+        from drivebuildclient.aiExchangeMessages_pb2 import Bool, DirectEndpoint
+        from drivebuildclient.directUtil import DIRECT_ACTIONS, verify_endpoint
+        from config import DIRECT_ENDPOINT_SECRET
+        endpoints: List[DirectEndpoint] = []
+
+        def _handle_message(action: bytes, data: List[bytes]) -> bytes:
+            if action == b"authenticate":
+                endpoint = DirectEndpoint()
+                endpoint.ParseFromString(data[0])
+                result = Bool()
+                result.value = verify_endpoint(endpoint, DIRECT_ENDPOINT_SECRET.encode())
+                if result.value:
+                    endpoints[:] = [endpoint]
+                else:
+                    _logger.warning(str(addr) + " sent an invalid or expired endpoint.")
+                return result.SerializeToString()
+            elif endpoints and action in DIRECT_ACTIONS:
+                serialized_ids = [endpoints[0].sid.SerializeToString(), endpoints[0].vid.SerializeToString()]
+                return _handle_main_app_message(action, serialized_ids + data)
+            else:
+                result = Void()
+                result.message = "The action \"" + action.decode() + "\" requires authentication or is unknown."
+                return result.SerializeToString()
+
+        process_requests(conn, _handle_message)
+
+
+    def _accept_direct_connection(conn: socket, addr: Tuple[str, int]) -> None:
+        direct_connection_thread = Thread(target=_handle_direct_connection, args=(conn, addr))
+        direct_connection_thread.daemon = True
+        direct_connection_thread.start()
+
+
+    if DATA_PORT:
+        sim_node_ai_com = Thread(target=accept_at_server, args=(create_server(DATA_PORT), _accept_direct_connection))
+        sim_node_ai_com.daemon = True
+        sim_node_ai_com.start()
+
+
+    def _send_heartbeats(port: int, snid: SimulationNodeID) -> None:
+        from time import sleep
+        heartbeat_client = create_client(MAIN_APP_HOST, port)
+        interval = Num()  # In ms
+        interval.ParseFromString(send_request(heartbeat_client, b"registerHeartbeatSocket", [snid.SerializeToString()]))
+        try:
+            while True:
+                sleep(interval.num / 1000)
+                send_request(heartbeat_client, b"ping", [_get_status(port).SerializeToString()])
+        except OSError:
+            _logger.exception("The main app at port " + str(port) + " is not reachable anymore.")
+
+
+    def _send_simulation_events(port: int, snid: SimulationNodeID, events: Queue) -> None:
+        event_client = create_client(MAIN_APP_HOST, port)
+        send_request(event_client, b"registerEventSocket", [snid.SerializeToString()])
+        try:
+            while True:
+                event = events.get()
+                send_request(event_client, b"simulationEvent", [event.SerializeToString()])
+        except OSError:
+            _logger.exception("The main app at port " + str(port) + " is not reachable anymore.")
+
+
+    def _get_node_id() -> str:
+        from socket import gethostname
+        from config import NODE_ID
+        return NODE_ID if NODE_ID else gethostname() + ":" + str(SIM_NODE_PORT)
+
+
+    def _connect_to_main_app(port: int) -> None:
+        """
+        Registers at the worker of the main app listening at the given port. Each worker gets its own sockets.
+        """
+        from functools import partial
+        from drivebuildclient.aiExchangeMessages_pb2 import SimNodeRegistration
+        main_app_client = create_client(MAIN_APP_HOST, port)
+        registration = SimNodeRegistration()
+        registration.node_id = _get_node_id()
+        registration.capabilities.CopyFrom(_get_status(port))
+        snid = SimulationNodeID()
+        snid.ParseFromString(send_request(main_app_client, b"registerSimNode", [registration.SerializeToString()]))
+        _snids[port] = snid
+        prefix = snid.snid
+        if not prefix:
+            _logger.error("SimNode was no prefix assigned.")
+            main_app_client.close()
+            exit(1)
+        sim_node_main_app_com = Thread(target=process_requests,
+                                       args=(main_app_client, partial(_handle_main_app_message, port=port)))
+        _logger.info("_handle_main_app_message --> " + str(main_app_client.getsockname()))
+        sim_node_main_app_com.start()
+
+        sim_node_heartbeat = Thread(target=_send_heartbeats, args=(port, snid))
+        sim_node_heartbeat.daemon = True
+        sim_node_heartbeat.start()
+
+        events = Queue()
+        _simulation_event_queues.append(events)
+        sim_node_events = Thread(target=_send_simulation_events, args=(port, snid, events))
+        sim_node_events.daemon = True
+        sim_node_events.start()
+
+
+    for worker_port in range(MAIN_APP_PORT, MAIN_APP_PORT + MAIN_APP_WORKERS):
+        _connect_to_main_app(worker_port)
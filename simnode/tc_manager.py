@@ -46,6 +46,7 @@ def associate_criteria(mapping_stubs: List[ScenarioMapping], criteria_defs: List
 
 def get_valid(folder: str) -> Tuple[List[ScenarioMapping], List[_ElementTree]]:
     import os
+    from hashlib import sha256
     from util import is_dbe, is_dbc
     from util.xml import validate
     scenario_mapping_stubs = list()
@@ -55,7 +56,10 @@ def get_valid(folder: str) -> Tuple[List[ScenarioMapping], List[_ElementTree]]:
         valid, root = validate(path)
         if valid and root:
             if is_dbe(root):
-                scenario_mapping_stubs.append(ScenarioMapping(root, filename))
+                with open(path, "rb") as environment_file:
+                    # NOTE The main app uses the same hash for placing tests where their roads are cached already
+                    environment_hash = sha256(environment_file.read()).hexdigest()
+                scenario_mapping_stubs.append(ScenarioMapping(root, filename, environment_hash=environment_hash))
             elif is_dbc(root):
                 valid_crit_defs.append(root)
             else:
@@ -67,6 +71,7 @@ def run_tests(zip_file_content: bytes) -> Union[Dict[Simulation, SimulationData]
     from sim_controller import run_test_case
     from transformer import transform
     from datetime import datetime
+    from dbtypes.recording import TraceRecorder
     folder = extract_test_cases(zip_file_content)
     mapping_stubs, valid_crit_defs = get_valid(folder)
 
@@ -78,6 +83,7 @@ def run_tests(zip_file_content: bytes) -> Union[Dict[Simulation, SimulationData]
             sim, bng_scenario, thread, sid = run_test_case(test_case)
             data = SimulationData(bng_scenario, thread, crit_def, env_def, sid)
             data.start_time = datetime.now()
+            data.recorder = TraceRecorder(test_case.recording)
             simulations[sim] = data
         return simulations
     else:
@@ -0,0 +1,124 @@
+from os.path import getsize, join
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Any, Dict, List, Tuple
+from unittest import TestCase, main
+
+from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
+
+from columnar import ColumnarSink, read_blobs, read_channel, read_channels, read_cycles
+from cycle_writer import VerificationCycle
+
+
+class _Database:
+    def __init__(self):
+        self.queries: List[Tuple[str, Dict[str, Any]]] = []
+
+    def run_query(self, query: str, args: Dict[str, Any]) -> bool:
+        self.queries.append((query, args))
+        return True
+
+
+def _cycle(tick: int, vid: str = "ego") -> VerificationCycle:
+    response = DataResponse()
+    response.data["position"].position.x = tick
+    response.data["position"].position.y = -tick
+    response.data["speed"].speed.speed = tick / 10
+    response.data["damage"].damage.is_damaged = tick % 2 == 1
+    response.data["camera"].camera.color = bytes([tick]) * (tick + 1)
+    response.data["broken"].error.message = "Not available"
+    return "1", vid, tick, response.SerializeToString(), "2020-01-01 00:00:0" + str(tick % 10), "2020-01-01 00:00:10"
+
+
+class ColumnarSinkTest(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.trace_directory = join(self.directory, "1")
+        self.database = _Database()
+        self.sink = ColumnarSink(self.directory, self.database)
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_round_trip(self):
+        self.assertTrue(self.sink.write([_cycle(tick) for tick in range(3)]))
+        self.assertTrue(self.sink.write([_cycle(tick) for tick in range(3, 5)] + [_cycle(0, "other")]))
+        ticks, times = read_cycles(self.trace_directory, "ego")
+        self.assertEqual([0, 1, 2, 3, 4], ticks.tolist())
+        self.assertEqual(5, times.shape[0])
+        self.assertEqual(10, times[0, 1] - times[0, 0])
+        channels = read_channels(self.trace_directory, "ego")
+        self.assertEqual({"position", "speed", "damage", "camera"}, set(channels.keys()))
+        self.assertEqual(5, channels["camera"]["rows"])
+        ticks, positions = read_channel(self.trace_directory, "ego", "position")
+        self.assertEqual([0, 1, 2, 3, 4], ticks.tolist())
+        self.assertEqual([[tick, -tick] for tick in range(5)], positions.tolist())
+        _, speeds = read_channel(self.trace_directory, "ego", "speed")
+        self.assertEqual([tick / 10 for tick in range(5)], speeds[:, 0].tolist())
+        _, damages = read_channel(self.trace_directory, "ego", "damage")
+        self.assertEqual([0, 1, 0, 1, 0], damages[:, 0].tolist())
+        cameras = list(read_blobs(self.trace_directory, "ego", "camera"))
+        self.assertEqual([0, 1, 2, 3, 4], [tick for tick, _ in cameras])
+        self.assertEqual(bytes([4]) * 5, cameras[4][1].camera.color)
+        self.assertEqual([0], read_cycles(self.trace_directory, "other")[0].tolist())
+        with self.assertRaises(ValueError):
+            read_channel(self.trace_directory, "ego", "camera")
+
+    def test_trace_is_registered(self):
+        self.sink.write([_cycle(0), _cycle(1), _cycle(0, "other")])
+        self.assertEqual(["1", "1"], [args["sid"] for _, args in self.database.queries])
+
+    def test_close_releases_simulation(self):
+        self.sink.write([_cycle(0)])
+        self.sink.close("1")
+        self.sink.write([_cycle(1)])  # NOTE The trace is reopened
+        self.assertEqual([0, 1], read_cycles(self.trace_directory, "ego")[0].tolist())
+        self.assertEqual([0, 1], read_channel(self.trace_directory, "ego", "speed")[0].tolist())
+        self.assertEqual(2, len(self.database.queries))
+
+    def test_partially_written_rows_are_ignored(self):
+        self.sink.write([_cycle(0), _cycle(1)])
+        speed_values = join(self.trace_directory, "ego", "requests", "speed.values")
+        with open(speed_values, "ab") as values_file:
+            values_file.write(bytes(12))  # NOTE As if the SimNode failed while appending
+        self.assertEqual(2, read_channel(self.trace_directory, "ego", "speed")[1].shape[0])
+        self.sink.close("1")
+        self.sink.write([_cycle(2)])
+        self.assertEqual(3 * 8, getsize(speed_values))
+        ticks, speeds = read_channel(self.trace_directory, "ego", "speed")
+        self.assertEqual([0, 1, 2], ticks.tolist())
+        self.assertEqual([0, 0.1, 0.2], speeds[:, 0].tolist())
+
+    def test_failed_batch_is_not_stored(self):
+        from os import makedirs, rmdir
+        self.sink.write([_cycle(0), _cycle(0, "other")])
+        # NOTE trace.json of ego is replaced before the one of other fails
+        blocked_path = join(self.trace_directory, "other", "trace.json.tmp")
+        makedirs(blocked_path)
+        with self.assertRaises(OSError):
+            self.sink.write([_cycle(1), _cycle(2), _cycle(1, "other")])
+        self.assertEqual([0], read_cycles(self.trace_directory, "ego")[0].tolist())
+        self.assertEqual([0], read_channel(self.trace_directory, "ego", "speed")[0].tolist())
+        rmdir(blocked_path)
+        for cycle in [_cycle(1), _cycle(2), _cycle(1, "other")]:  # NOTE Like VerificationCycleWriter retries them
+            self.assertTrue(self.sink.write([cycle]))
+        self.assertEqual([0, 1, 2], read_cycles(self.trace_directory, "ego")[0].tolist())
+        self.assertEqual([0, 1, 2], read_channel(self.trace_directory, "ego", "speed")[0].tolist())
+        self.assertEqual([0, 1, 2], [tick for tick, _ in read_blobs(self.trace_directory, "ego", "camera")])
+        self.assertEqual([0, 1], read_cycles(self.trace_directory, "other")[0].tolist())
+
+    def test_ids_are_escaped(self):
+        from os import listdir
+        response = DataResponse()
+        response.data["../../speed"].speed.speed = 1
+        response.data["cam/front"].camera.color = b"image"
+        self.sink.write([("1", "..", 0, response.SerializeToString(), "2020-01-01 00:00:00", "2020-01-01 00:00:00")])
+        self.assertEqual(["1"], listdir(self.directory))
+        self.assertEqual(["%2E%2E"], listdir(self.trace_directory))
+        self.assertEqual([[1]], read_channel(self.trace_directory, "..", "../../speed")[1].tolist())
+        cameras = list(read_blobs(self.trace_directory, "..", "cam/front"))
+        self.assertEqual(b"image", cameras[0][1].camera.color)
+
+
+if __name__ == "__main__":
+    main()
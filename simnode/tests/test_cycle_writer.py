@@ -0,0 +1,175 @@
+from os import remove
+from os.path import exists, getsize
+from tempfile import mkstemp
+from threading import Event, Thread
+from typing import List, Optional
+from unittest import TestCase, main
+
+from cycle_writer import BackpressurePolicy, TraceSink, VerificationCycle, VerificationCycleWriter
+
+
+def _cycle(tick: int) -> VerificationCycle:
+    return "1", "ego", tick, b"data", "2020-01-01 00:00:00", "2020-01-01 00:00:01"
+
+
+class _Sink(TraceSink):
+    """
+    Keeps written verification cycles in memory. Writing waits until released and fails for the given ticks.
+    """
+
+    def __init__(self, failing_ticks: Optional[List[int]] = None, released: bool = True):
+        self.batches: List[List[VerificationCycle]] = []
+        self.closed: List[str] = []
+        self.failing_ticks = failing_ticks if failing_ticks else []
+        self.release = Event()
+        if released:
+            self.release.set()
+
+    @property
+    def ticks(self) -> List[int]:
+        return [cycle[2] for batch in self.batches for cycle in batch]
+
+    def write(self, cycles: List[VerificationCycle]) -> bool:
+        self.release.wait(5)
+        if any(cycle[2] in self.failing_ticks for cycle in cycles):
+            return False
+        self.batches.append(cycles)
+        return True
+
+    def close(self, sid: str) -> None:
+        self.closed.append(sid)
+
+
+class VerificationCycleWriterTest(TestCase):
+    def setUp(self):
+        _, self.spill_path = mkstemp()
+
+    def tearDown(self):
+        if exists(self.spill_path):
+            remove(self.spill_path)
+
+    def _create_writer(self, sink: TraceSink, max_queued: int = 100, batch_size: int = 10,
+                       policy: BackpressurePolicy = BackpressurePolicy.BLOCK) -> VerificationCycleWriter:
+        writer = VerificationCycleWriter(sink, max_queued, batch_size, 60, policy, self.spill_path)
+        writer.start()
+        return writer
+
+    def test_flush_writes_batches(self):
+        sink = _Sink()
+        writer = self._create_writer(sink, batch_size=4)
+        for tick in range(10):
+            writer.put(_cycle(tick))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(list(range(10)), sink.ticks)
+        self.assertTrue(all(len(batch) <= 4 for batch in sink.batches))
+
+    def test_flush_timeout(self):
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink)
+        writer.put(_cycle(0))
+        self.assertFalse(writer.flush(0.1))
+        sink.release.set()
+        self.assertTrue(writer.flush(5))
+
+    def test_block(self):
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink, max_queued=2, batch_size=1)
+        put = Event()
+
+        def _put_all() -> None:
+            for tick in range(5):
+                writer.put(_cycle(tick))
+            put.set()
+
+        thread = Thread(target=_put_all)
+        thread.daemon = True
+        thread.start()
+        self.assertFalse(put.wait(0.2))  # NOTE One cycle is being written and two are queued
+        sink.release.set()
+        self.assertTrue(put.wait(5))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(list(range(5)), sink.ticks)
+        self.assertEqual(0, writer.num_dropped)
+
+    def test_flush_simulation(self):
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink, batch_size=1)
+        writer.put(_cycle(0))
+        writer.flush(0.1)  # NOTE Wait until the writer took the first cycle
+        writer.put(("2",) + _cycle(1)[1:])
+        self.assertFalse(writer.flush(0.1, "2"))  # NOTE The cycle of simulation 1 is written first
+        self.assertTrue(writer.flush(0.1, "3"))
+        sink.release.set()
+        self.assertTrue(writer.flush(5, "2"))
+        self.assertEqual([0, 1], sink.ticks)
+
+    def test_drop(self):
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink, max_queued=2, batch_size=1, policy=BackpressurePolicy.DROP)
+        writer.put(_cycle(0))
+        writer.flush(0.1)  # NOTE Wait until the writer took the first cycle
+        for tick in range(1, 5):
+            writer.put(_cycle(tick))
+        sink.release.set()
+        self.assertTrue(writer.flush(5))
+        self.assertEqual([0, 1, 2], sink.ticks)
+        self.assertEqual(2, writer.num_dropped)
+
+    def test_spill(self):
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink, max_queued=2, batch_size=2, policy=BackpressurePolicy.SPILL)
+        writer.put(_cycle(0))
+        writer.flush(0.1)  # NOTE Wait until the writer took the first cycle
+        for tick in range(1, 8):
+            writer.put(_cycle(tick))
+        self.assertGreater(getsize(self.spill_path), 0)
+        sink.release.set()
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(list(range(8)), sorted(sink.ticks))
+        self.assertEqual(0, writer.num_dropped)
+        self.assertEqual(0, getsize(self.spill_path))
+
+    def test_stale_spill_file_is_discarded(self):
+        import pickle
+        with open(self.spill_path, "wb") as spill_file:
+            for tick in range(100, 103):
+                pickle.dump(_cycle(tick), spill_file)
+        sink = _Sink(released=False)
+        writer = self._create_writer(sink, max_queued=1, batch_size=1, policy=BackpressurePolicy.SPILL)
+        self.assertEqual(0, getsize(self.spill_path))
+        writer.put(_cycle(0))
+        writer.flush(0.1)  # NOTE Wait until the writer took the first cycle
+        for tick in range(1, 5):
+            writer.put(_cycle(tick))
+        sink.release.set()
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(list(range(5)), sorted(sink.ticks))
+
+    def test_failed_cycle_does_not_fail_its_batch(self):
+        sink = _Sink(failing_ticks=[3])
+        writer = self._create_writer(sink, batch_size=10)
+        for tick in range(6):
+            writer.put(_cycle(tick))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual([0, 1, 2, 4, 5], sink.ticks)
+        self.assertEqual(1, writer.num_failed)
+
+    def test_failing_sink(self):
+        class _FailingSink(TraceSink):
+            def write(self, cycles: List[VerificationCycle]) -> bool:
+                raise IOError("The storage is unavailable")
+
+        writer = self._create_writer(_FailingSink())
+        for tick in range(3):
+            writer.put(_cycle(tick))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(3, writer.num_failed)
+
+    def test_close(self):
+        sink = _Sink()
+        self._create_writer(sink).close("1")
+        self.assertEqual(["1"], sink.closed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+from collections import namedtuple
+from threading import Thread
+from time import sleep
+from types import SimpleNamespace
+from unittest import TestCase, main
+
+from registry import SimulationRegistry, SimulationState
+
+_Vehicle = namedtuple("_Vehicle", ["vid"])
+
+
+def _simulation(sid: str) -> SimpleNamespace:
+    return SimpleNamespace(sid=SimpleNamespace(sid=sid))
+
+
+def _data(*vids: str) -> SimpleNamespace:
+    return SimpleNamespace(scenario=SimpleNamespace(vehicles={_Vehicle(vid): None for vid in vids}))
+
+
+class SimulationLifecycleTest(TestCase):
+    def test_transitions(self):
+        registry = SimulationRegistry(10, 60)
+        lifecycle = registry.register("1")
+        self.assertIs(SimulationState.REGISTERED, lifecycle.state)
+        lifecycle.set_state(SimulationState.STARTING)
+        self.assertIs(SimulationState.STARTING, lifecycle.state)
+        registry.add(_simulation("1"), _data("ego"))
+        self.assertIs(lifecycle, registry.get_lifecycle("1"))
+        self.assertIs(SimulationState.RUNNING, lifecycle.state)
+        lifecycle.set_state(SimulationState.STOPPING)
+        lifecycle.set_state(SimulationState.FINISHED)
+        self.assertIs(SimulationState.FINISHED, registry.get_lifecycle("1").state)
+
+    def test_add_without_register(self):
+        registry = SimulationRegistry(10, 60)
+        registry.add(_simulation("1"), _data())
+        self.assertIs(SimulationState.RUNNING, registry.get_lifecycle("1").state)
+
+    def test_wait_while_starting(self):
+        registry = SimulationRegistry(10, 60)
+        lifecycle = registry.register("1")
+        states = []
+        thread = Thread(target=lambda: states.append(
+            lifecycle.wait_while([SimulationState.REGISTERED, SimulationState.STARTING], 5)))
+        thread.daemon = True
+        thread.start()
+        lifecycle.set_state(SimulationState.STARTING)
+        sleep(0.1)
+        self.assertEqual([], states)
+        registry.add(_simulation("1"), _data())
+        thread.join(5)
+        self.assertEqual([SimulationState.RUNNING], states)
+
+    def test_wait_while_timeout(self):
+        lifecycle = SimulationRegistry(10, 60).register("1")
+        self.assertIs(SimulationState.REGISTERED, lifecycle.wait_while([SimulationState.REGISTERED], 0.05))
+
+    def test_remove_abandoned(self):
+        registry = SimulationRegistry(10, 60)
+        abandoned = registry.register("1")
+        registry.register("2")
+        registry.add(_simulation("2"), _data())
+        sleep(0.05)
+        self.assertEqual(["1"], registry.remove_abandoned(0.01))
+        self.assertIsNone(registry.get_lifecycle("1"))
+        self.assertIs(SimulationState.FINISHED, abandoned.state)
+        self.assertIsNotNone(registry.get_lifecycle("2"))
+        self.assertEqual([], registry.remove_abandoned(60))
+
+
+class SimulationRegistryTest(TestCase):
+    def test_lookups(self):
+        registry = SimulationRegistry(10, 60)
+        simulation = _simulation("1")
+        data = _data("ego", "other")
+        registry.add(simulation, data)
+        self.assertTrue(registry.contains("1"))
+        self.assertIs(simulation, registry.get_simulation("1"))
+        self.assertIs(data, registry.get_data("1"))
+        self.assertEqual("other", registry.get_vehicle("1", "other").vid)
+        self.assertIsNone(registry.get_vehicle("1", "missing"))
+        self.assertIsNone(registry.get_data("2"))
+        self.assertEqual([(simulation, data)], registry.items())
+
+    def test_add_replaces_simulation(self):
+        registry = SimulationRegistry(10, 60)
+        replaced = _simulation("1")
+        self.assertIsNone(registry.add(replaced, _data()))
+        self.assertIs(replaced, registry.add(_simulation("1"), _data()))
+
+    def test_evict_leaves_tombstone(self):
+        registry = SimulationRegistry(10, 60)
+        simulation = _simulation("1")
+        data = _data("ego")
+        registry.add(simulation, data)
+        self.assertEqual((simulation, data), registry.evict("1", 2, 3))
+        self.assertFalse(registry.contains("1"))
+        self.assertIsNone(registry.get_lifecycle("1"))
+        self.assertIsNone(registry.get_vehicle("1", "ego"))
+        self.assertEqual((2, 3), registry.get_tombstone("1"))
+        self.assertIsNone(registry.get_tombstone("2"))
+
+    def test_add_removes_tombstone(self):
+        registry = SimulationRegistry(10, 60)
+        registry.add(_simulation("1"), _data())
+        registry.evict("1", 2, 3)
+        registry.add(_simulation("1"), _data())
+        self.assertIsNone(registry.get_tombstone("1"))
+
+    def test_max_tombstones(self):
+        registry = SimulationRegistry(2, 60)
+        for sid in ["1", "2", "3"]:
+            registry.add(_simulation(sid), _data())
+            registry.evict(sid, 2, 3)
+        self.assertIsNone(registry.get_tombstone("1"))
+        self.assertIsNotNone(registry.get_tombstone("2"))
+        self.assertIsNotNone(registry.get_tombstone("3"))
+
+    def test_tombstone_ttl(self):
+        registry = SimulationRegistry(10, 0.05)
+        registry.evict("1", 2, 3)
+        self.assertIsNotNone(registry.get_tombstone("1"))
+        sleep(0.1)
+        self.assertIsNone(registry.get_tombstone("1"))
+
+
+if __name__ == "__main__":
+    main()
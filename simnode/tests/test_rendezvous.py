@@ -0,0 +1,107 @@
+from threading import Thread
+from time import sleep
+from typing import Callable, List
+from unittest import TestCase, main
+
+from rendezvous import Rendezvous, RendezvousTable
+
+
+def _start(target: Callable[[], None]) -> Thread:
+    thread = Thread(target=target)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+class RendezvousTest(TestCase):
+    def test_simulation_waits_for_ai(self):
+        rendezvous = Rendezvous()
+        results = []
+        thread = _start(lambda: results.append(rendezvous.simulation_ready(5)))
+        sleep(0.1)
+        self.assertEqual([], results)
+        self.assertTrue(rendezvous.ai_ready(5))
+        thread.join(5)
+        self.assertEqual([True], results)
+
+    def test_ai_waits_for_simulation(self):
+        rendezvous = Rendezvous()
+        results = []
+        thread = _start(lambda: results.append(rendezvous.ai_ready(5)))
+        sleep(0.1)
+        self.assertEqual([], results)
+        self.assertTrue(rendezvous.simulation_ready(5))
+        thread.join(5)
+        self.assertEqual([True], results)
+
+    def test_timeout(self):
+        rendezvous = Rendezvous()
+        self.assertFalse(rendezvous.simulation_ready(0.05))
+        self.assertTrue(rendezvous.ai_ready(0.05))  # NOTE The simulation announced itself already
+
+    def test_sides_meet_once_per_tick(self):
+        num_ticks = 50
+        rendezvous = Rendezvous()
+        events: List[str] = []
+        arrived: List[bool] = []
+
+        def _simulate() -> None:
+            for tick in range(num_ticks):
+                events.append("step " + str(tick))
+                arrived.append(rendezvous.simulation_ready(5))
+
+        def _control() -> None:
+            for tick in range(num_ticks):
+                arrived.append(rendezvous.ai_ready(5))
+                events.append("control " + str(tick))
+
+        threads = [_start(_simulate), _start(_control)]
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual([True] * 2 * num_ticks, arrived)
+        for tick in range(num_ticks):
+            # NOTE The AI controls a tick after the simulation reached it but before the simulation passed the next one
+            self.assertLess(events.index("step " + str(tick)), events.index("control " + str(tick)))
+            if tick + 2 < num_ticks:
+                self.assertLess(events.index("control " + str(tick)), events.index("step " + str(tick + 2)))
+
+
+    def test_cancel_wakes_up_waiting_sides(self):
+        rendezvous = Rendezvous()
+        results = []
+        thread = _start(lambda: results.append(rendezvous.simulation_ready()))
+        sleep(0.1)
+        rendezvous.cancel()
+        thread.join(5)
+        self.assertEqual([False], results)
+        self.assertFalse(rendezvous.ai_ready())
+
+
+class RendezvousTableTest(TestCase):
+    def test_same_rendezvous_per_vehicle(self):
+        table = RendezvousTable()
+        self.assertIs(table.get("1", "ego"), table.get("1", "ego"))
+        self.assertIsNot(table.get("1", "ego"), table.get("1", "other"))
+        self.assertIsNot(table.get("1", "ego"), table.get("2", "ego"))
+
+    def test_cancel_simulation(self):
+        table = RendezvousTable()
+        rendezvous = table.get("1", "ego")
+        other_simulation = table.get("2", "ego")
+        table.cancel("1")
+        self.assertFalse(rendezvous.ai_ready())
+        self.assertFalse(table.get("1", "later").simulation_ready())  # NOTE Vehicles requested later are canceled too
+        self.assertFalse(other_simulation.ai_ready(0.05))
+        self.assertTrue(other_simulation.simulation_ready(0.05))
+
+    def test_remove_simulation(self):
+        table = RendezvousTable()
+        rendezvous = table.get("1", "ego")
+        table.remove("1")
+        self.assertFalse(rendezvous.ai_ready())
+        self.assertIsNot(rendezvous, table.get("1", "ego"))
+        self.assertFalse(table.get("1", "ego").ai_ready(0.05))  # NOTE A sid which is used again is not canceled
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from typing import List, Tuple
 from lxml.etree import _ElementTree
 
 from dbtypes.criteria import TestCase
-from dbtypes.scheme import ScenarioMapping
+from dbtypes.scheme import ScenarioMapping, RecordingPolicy
 
 
 def get_author(root: _ElementTree) -> str:
@@ -11,6 +11,22 @@ def get_author(root: _ElementTree) -> str:
     return xpath(root, "db:author")[0].text
 
 
+def get_recording_policy(crit_def: _ElementTree) -> RecordingPolicy:
+    from util.xml import xpath
+    recording_nodes = xpath(crit_def, "db:recording")
+    if not recording_nodes:
+        return RecordingPolicy()
+    node = recording_nodes[0]
+    return RecordingPolicy(
+        int(node.get("every", "1")),
+        node.get("include").split() if node.get("include") is not None else None,
+        node.get("exclude").split() if node.get("exclude") is not None else None,
+        int(node.get("cameraEvery", "1")),
+        node.get("onFailureOnly", "false").lower() in ("true", "1"),
+        int(node.get("bufferedCycles", "100"))
+    )
+
+
 def transform(mappings: List[ScenarioMapping]) -> List[Tuple[TestCase, _ElementTree, _ElementTree]]:
     """
     Return tuples containing the generated test case, its criteria definition and its environment
@@ -28,13 +44,15 @@ def transform(mappings: List[ScenarioMapping]) -> List[Tuple[TestCase, _ElementT
             steps_per_second = int(xpath(crit_def, "db:stepsPerSecond")[0].text)
             participants_node = xpath(crit_def, "db:participants")[0]
             builder = generate_scenario(environment, participants_node)
+            builder.environment_hash = mapping.environment_hash
             precondition, success, failure = generate_criteria(crit_def)
             crit_def_author = get_author(crit_def)
             authors = [environment_author]
             if crit_def_author not in authors:
                 authors.append(crit_def_author)
             test_cases.append(
-                (TestCase(test_name, builder, precondition, success, failure, steps_per_second, ai_frequency, authors),
+                (TestCase(test_name, builder, precondition, success, failure, steps_per_second, ai_frequency, authors,
+                          get_recording_policy(crit_def)),
                  crit_def, environment)
             )
     return test_cases
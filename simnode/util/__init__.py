@@ -1,9 +1,10 @@
 import re
-from typing import List, Optional
+from typing import List, Optional, Any
 
 from lxml.etree import _ElementTree
 
 from drivebuildclient import static_vars
+from drivebuildclient.aiExchangeMessages_pb2 import DataResponse
 from dbtypes.scheme import Position
 
 
@@ -42,3 +43,26 @@ def string_to_shape(shape_string: str) -> Optional[List[Position]]:
         return positions
     else:
         return None
+
+
+def pack_points(packed: DataResponse.Data.PackedPoints, points: Any, stride: int) -> None:
+    """
+    Stores the given points as little-endian float32 values without iterating over them in Python.
+    :param packed: The message to store the points in.
+    :param points: Anything numpy can convert to an array like a flat array or a list of tuples.
+    :param stride: The number of values per point.
+    """
+    from numpy import asarray
+    packed.data = asarray(points, dtype="<f4").tobytes()
+    packed.stride = stride
+
+
+def fill_deprecated_points(points: Any, values: Any) -> None:
+    """
+    Fills a deprecated repeated field like DataResponse.Data.Lidar.points with the flattened given points for clients
+    which do not know PackedPoints yet. Unlike pack_points(...) this iterates over all values in Python.
+    :param points: The repeated field to fill.
+    :param values: Anything numpy can convert to an array like a flat array or a list of tuples.
+    """
+    from numpy import asarray
+    points.extend(asarray(values, dtype=float).ravel().tolist())
@@ -0,0 +1,40 @@
+from PIL.Image import Image
+
+RAW_HEADER_FORMAT = "<III"  # height, width, channels
+
+
+def encode_raw(image: Image) -> bytes:
+    """
+    Converts the given image to uint8 pixels prefixed by a header containing its shape.
+    """
+    from numpy import asarray, uint8
+    from struct import pack
+    if image.mode not in ["L", "RGB", "RGBA"]:
+        image = image.convert("L")
+    pixels = asarray(image, dtype=uint8)
+    height, width = pixels.shape[0:2]
+    channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+    return pack(RAW_HEADER_FORMAT, height, width, channels) + pixels.tobytes()
+
+
+def encode_image(image: Image, encoding: str, quality: int = 75, compression_level: int = 6) -> bytes:
+    """
+    Encodes the given image to be transferred within a DataResponse.Data.Camera.
+    :param encoding: The name of the encoding (PNG, JPEG or RAW).
+    :param quality: The quality of JPEG encoded images (Range 1 to 100).
+    :param compression_level: The zlib compression level of PNG encoded images (Range 0 to 9).
+    :return: The encoded image.
+    """
+    from io import BytesIO
+    if encoding == "RAW":
+        return encode_raw(image)
+    bytes_arr = BytesIO()
+    if encoding == "JPEG":
+        if image.mode not in ["L", "RGB"]:
+            image = image.convert("RGB" if image.mode == "RGBA" else "L")
+        image.save(bytes_arr, format="JPEG", quality=quality)
+    elif encoding == "PNG":
+        image.save(bytes_arr, format="PNG", compress_level=compression_level)
+    else:
+        raise ValueError("The image encoding " + encoding + " is not supported.")
+    return bytes_arr.getvalue()
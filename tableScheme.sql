@@ -1,7 +1,7 @@
 CREATE TABLE IF NOT EXISTS Users
 (
     username TEXT NOT NULL PRIMARY KEY,
-    password TEXT NOT NULL
+    password TEXT NOT NULL -- A salted hash (Plaintext passwords are replaced by hashes on their first login)
 );
 
 CREATE TABLE IF NOT EXISTS Tests
@@ -27,3 +27,31 @@ CREATE TABLE IF NOT EXISTS VerificationCycles
     PRIMARY KEY (sid, vid, tick)
 );
 
+-- The per simulation trace files of SimNodes storing verification cycles with the backend "columnar"
+CREATE TABLE IF NOT EXISTS TraceFiles
+(
+    sid  INT  NOT NULL PRIMARY KEY REFERENCES tests (sid),
+    path TEXT NOT NULL -- The trace directory of the simulation on its SimNode
+);
+
+CREATE TABLE IF NOT EXISTS Submissions
+(
+    qid       SERIAL    NOT NULL PRIMARY KEY,
+    username  TEXT      NOT NULL REFERENCES users (username),
+    priority  INT       NOT NULL DEFAULT 0,
+    submitted TIMESTAMP NOT NULL DEFAULT now()
+);
+
+-- The tests of a submission which are dispatched individually
+CREATE TABLE IF NOT EXISTS SubmissionParts
+(
+    pid        SERIAL NOT NULL PRIMARY KEY,
+    qid        INT    NOT NULL REFERENCES submissions (qid),
+    content    BYTEA, -- The zip file of the part (Removed as soon as it is dispatched)
+    status     TEXT   NOT NULL DEFAULT 'QUEUED', -- QUEUED, DISPATCHING, DISPATCHED or FAILED
+    dispatched TIMESTAMP,
+    result     BYTEA -- The serialized SubmissionResult of the dispatch
+);
+
+CREATE INDEX IF NOT EXISTS submission_parts_queued ON SubmissionParts (pid) WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS submission_parts_qid ON SubmissionParts (qid);